@@ -2,6 +2,8 @@ import pygame
 import pygame_gui
 import random
 from constants import *
+from utils import create_surface
+from render_backend import blit_cached
 
 class AbilitySelectionScreen:
     def __init__(self, screen, manager):
@@ -95,7 +97,7 @@ class AbilitySelectionScreen:
             self.descriptions.append((desc_surfaces, x + button_width//2, y + button_height + 10))
 
         # Overlay
-        self.overlay = pygame.Surface((screen_width, screen_height))
+        self.overlay = create_surface((screen_width, screen_height))
         self.overlay.fill(BLACK)
         self.overlay.set_alpha(200) # Darker overlay
 
@@ -114,29 +116,31 @@ class AbilitySelectionScreen:
             button.hide()
         self.is_visible = False
 
+    def draw_overlay(self, surface):
+        # Draw overlay (baked into the frozen background by the main loop)
+        if self.overlay:
+            surface.blit(self.overlay, (0, 0))
+
     def draw(self, surface):
         if not self.is_visible:
             return
 
-        # Draw overlay
-        if self.overlay:
-            surface.blit(self.overlay, (0, 0))
-
         # Draw title
         if self.title_text:
-            surface.blit(self.title_text, self.title_rect)
+            blit_cached(surface, [(self.title_text, self.title_rect)])
             
         # Draw instructions
         if self.instruction_text:
-            surface.blit(self.instruction_text, self.instruction_rect)
+            blit_cached(surface, [(self.instruction_text, self.instruction_rect)])
             
         # Draw descriptions
         for desc_surfaces, centerx, top in self.descriptions:
             current_y = top
+            lines = []
             for desc_surface in desc_surfaces:
-                rect = desc_surface.get_rect(centerx=centerx, top=current_y)
-                surface.blit(desc_surface, rect)
+                lines.append((desc_surface, desc_surface.get_rect(centerx=centerx, top=current_y)))
                 current_y += desc_surface.get_height()
+            blit_cached(surface, lines)
 
     def handle_event(self, event, game_state, player):
         if not self.is_visible:
@@ -145,36 +149,30 @@ class AbilitySelectionScreen:
         if event.type == pygame_gui.UI_BUTTON_PRESSED:
             for i, button in enumerate(self.ability_buttons):
                 if event.ui_element == button:
-                    selected_ability_id = self.chosen_abilities[i]
-                    player.activate_ability(selected_ability_id)
-                    game_state.reset_ability_counter()
-                    game_state.change_state(STATE_PLAYING)
-                    self.hide() # Hide self after selection
+                    self.select_ability(i, game_state, player)
                     return True # Event handled
 
         # Optional: Add keyboard selection (1, 2, 3)
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_1 and len(self.chosen_abilities) > 0:
-                player.activate_ability(self.chosen_abilities[0])
-                game_state.reset_ability_counter()
-                game_state.change_state(STATE_PLAYING)
-                self.hide()
+            if event.key == pygame.K_1 and self.select_ability(0, game_state, player):
                 return True
-            elif event.key == pygame.K_2 and len(self.chosen_abilities) > 1:
-                player.activate_ability(self.chosen_abilities[1])
-                game_state.reset_ability_counter()
-                game_state.change_state(STATE_PLAYING)
-                self.hide()
+            elif event.key == pygame.K_2 and self.select_ability(1, game_state, player):
                 return True
-            elif event.key == pygame.K_3 and len(self.chosen_abilities) > 2:
-                player.activate_ability(self.chosen_abilities[2])
-                game_state.reset_ability_counter()
-                game_state.change_state(STATE_PLAYING)
-                self.hide()
+            elif event.key == pygame.K_3 and self.select_ability(2, game_state, player):
                 return True
 
         return True # Keep processing other events if needed 
 
+    def select_ability(self, index, game_state, player):
+        """Activate the offered ability at index and resume play. Returns False if there is no such ability."""
+        if not 0 <= index < len(self.chosen_abilities):
+            return False
+        player.activate_ability(self.chosen_abilities[index])
+        game_state.reset_ability_counter()
+        game_state.change_state(STATE_PLAYING)
+        self.hide() # Hide self after selection
+        return True
+
     def wrap_text(self, text, max_width, font):
         """Wrap text to fit within max_width"""
         words = text.split(' ')
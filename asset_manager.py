@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import OrderedDict
+import pygame
+from constants import *
+from utils import create_surface, get_resource
+
+class AssetManager:
+    """Loads every image once and hands out display-format copies per scale.
+
+    Decoded originals are kept for the whole session. Converted and scaled
+    copies are keyed by (filename, scale, alpha) and the least recently used
+    are dropped beyond ASSET_CACHE_SIZE, so switching UI scales does not pile
+    up surfaces. get_original only decodes and may run on any thread; each
+    file has its own lock, so a file is decoded once however many threads
+    ask for it. get converts to the display format and belongs on the main
+    thread. Missing files get a magenta placeholder once, with a single
+    warning.
+    """
+
+    def __init__(self, base_path=ASSET_IMAGE_PATH, max_size=ASSET_CACHE_SIZE):
+        # The path is inside the assets package (see utils.get_resource)
+        self.base_path = base_path
+        self.max_size = max_size
+        self.originals = {}  # filename -> decoded Surface, or None if it could not be loaded
+        self.scaled = OrderedDict()  # (filename, scale, alpha) -> display-format Surface
+        self.load_times = {}  # filename -> milliseconds spent decoding
+        self.lock = threading.Lock()  # Guards the caches and file_locks
+        self.file_locks = {}  # filename -> Lock held while that file is decoded
+
+    def get(self, filename, scale=1.0, convert_alpha=True):
+        """Return the image at the given scale in display format, loading it on first use"""
+        key = (filename, round(scale, 3), convert_alpha)
+        with self.lock:
+            image = self.scaled.get(key)
+            if image is not None:
+                self.scaled.move_to_end(key)
+                return image
+
+        original = self.get_original(filename)
+        if original is None:
+            image = create_surface((64, 64), alpha=convert_alpha)
+            image.fill((255, 0, 255))  # Magenta for missing textures
+        else:
+            image = original.convert_alpha() if convert_alpha else original.convert()
+            if key[1] != 1.0:
+                new_size = (int(image.get_width() * key[1]), int(image.get_height() * key[1]))
+                image = pygame.transform.smoothscale(image, new_size)
+
+        with self.lock:
+            self.scaled[key] = image
+            if len(self.scaled) > self.max_size:
+                self.scaled.popitem(last=False)
+        return image
+
+    def get_original(self, filename):
+        """The decoded image (not display-converted), decoding it on first use"""
+        with self.lock:
+            if filename in self.originals:
+                return self.originals[filename]
+            file_lock = self.file_locks.setdefault(filename, threading.Lock())
+
+        with file_lock:
+            # Another thread may have decoded it while this one waited
+            with self.lock:
+                if filename in self.originals:
+                    return self.originals[filename]
+
+            full_path = f"{self.base_path}/{filename}"
+            start = time.perf_counter()
+            try:
+                with get_resource(full_path).open('rb') as image_file:
+                    original = pygame.image.load(image_file, filename)
+            except (pygame.error, OSError) as e:
+                print(f"Warning: Image {full_path} could not be loaded ({e}). Using placeholder.")
+                original = None
+            with self.lock:
+                self.load_times[filename] = (time.perf_counter() - start) * 1000.0
+                self.originals[filename] = original
+                del self.file_locks[filename]
+        return original
+
+    def get_stats(self):
+        """Load counts and times, for reports"""
+        with self.lock:
+            times = list(self.load_times.values())
+            return {
+                'images': len(self.originals),
+                'scaled_copies': len(self.scaled),
+                'load_ms_total': sum(times),
+                'load_ms_max': max(times, default=0.0)
+            }
+
+    def describe(self):
+        """One-line summary for the perf overlay"""
+        stats = self.get_stats()
+        return (f"{stats['images']} images, {stats['scaled_copies']} scaled, "
+                f"{stats['load_ms_total']:.1f} ms loading (max {stats['load_ms_max']:.1f} ms)")
+
+
+# Shared by every caller of utils.load_image
+image_assets = AssetManager()
@@ -0,0 +1 @@
+"""Bundled game data (theme, sounds, images), read through utils.get_resource so it also loads from a zipapp."""
@@ -0,0 +1,129 @@
+import pygame
+from constants import *
+from sound_synth import SoundEffectCache
+from utils import get_resource
+
+class AudioManager:
+    """Plays the game's sounds on a small, fixed set of mixer channels.
+
+    The mixer is (re)opened with a short buffer so a shot is heard within a
+    few milliseconds of the key press. Every sound category gets its own pool
+    of reserved channels, so heavy fire cannot take the channels explosions or
+    menus need. Inside a pool each sound is limited to max_voices: beyond that
+    its oldest voice is restarted, and when the pool is full the oldest voice
+    of the lowest priority at or below the new sound's is stolen. A sound
+    triggered several times in one frame only plays once.
+
+    Until open() is called (and in headless runs, where it never is) play()
+    does nothing.
+    """
+
+    def __init__(self, pools=AUDIO_CHANNEL_POOLS):
+        self.enabled = False  # Until open() succeeds; headless runs never open the mixer
+        self.pool_sizes = pools
+        self.sounds = {}  # name -> (Sound, category, max_voices, priority)
+        self.pools = {}  # category -> channel indices
+        self.channels = []
+        self.voices = []  # Per channel: (sound name, priority, start frame)
+        self.effects = None  # SoundEffectCache, built once the mixer is open
+
+        self.frame = 0
+        self.triggered = set()  # Sounds already started this frame
+        self.reset_stats()
+
+    def open(self):
+        """Open the mixer with the low-latency buffer, reserve the channel pools and synthesize the effects"""
+        try:
+            # pygame.init() already opened the mixer with its default (large) buffer
+            pygame.mixer.quit()
+            pygame.mixer.init(frequency=AUDIO_FREQUENCY, size=-16, channels=2, buffer=AUDIO_BUFFER_SIZE)
+        except pygame.error as e:
+            print(f"Warning: Audio unavailable ({e}). Continuing without sound.")
+            return False
+        self.enabled = True
+
+        total = sum(self.pool_sizes.values())
+        pygame.mixer.set_num_channels(total)
+        # Reserved channels are never picked by Sound.play(), only by us
+        pygame.mixer.set_reserved(total)
+        self.channels = [pygame.mixer.Channel(index) for index in range(total)]
+        self.voices = [None] * total
+        first = 0
+        for category, count in self.pool_sizes.items():
+            self.pools[category] = list(range(first, first + count))
+            first += count
+
+        self.effects = SoundEffectCache()
+        for name, (kind, size, pitch, category, max_voices, priority) in SOUND_EFFECTS.items():
+            self.add(name, self.effects.get(kind, size, pitch), category, max_voices, priority)
+        return True
+
+    def reset_stats(self):
+        self.played = 0
+        self.skipped = 0  # Repeat triggers in the same frame
+        self.stolen = 0
+        self.dropped = 0  # No free or stealable voice
+
+    def load(self, name, resource, category, max_voices=2, priority=0):
+        """Register a bundled sound file; higher priorities may steal voices from lower ones"""
+        if self.enabled:
+            with get_resource(resource).open('rb') as sound_file:
+                self.add(name, pygame.mixer.Sound(file=sound_file), category, max_voices, priority)
+
+    def add(self, name, sound, category, max_voices=2, priority=0):
+        """Register an already loaded or synthesized Sound"""
+        self.sounds[name] = (sound, category, max_voices, priority)
+
+    def begin_frame(self):
+        self.frame += 1
+        self.triggered.clear()
+
+    def play(self, name):
+        """Start a sound, returning the channel it plays on or None if it was skipped"""
+        if not self.enabled or name not in self.sounds:
+            return None
+        if name in self.triggered:
+            self.skipped += 1
+            return None
+        self.triggered.add(name)
+
+        sound, category, max_voices, priority = self.sounds[name]
+        index = self.pick_channel(self.pools[category], name, max_voices, priority)
+        if index is None:
+            self.dropped += 1
+            return None
+        channel = self.channels[index]
+        channel.play(sound)
+        self.voices[index] = (name, priority, self.frame)
+        self.played += 1
+        return channel
+
+    def pick_channel(self, pool, name, max_voices, priority):
+        busy = [index for index in pool if self.channels[index].get_busy()]
+
+        # Over the per-sound limit: restart this sound's oldest voice
+        own = [index for index in busy if self.voices[index][0] == name]
+        if len(own) >= max_voices:
+            self.stolen += 1
+            return min(own, key=lambda index: self.voices[index][2])
+
+        for index in pool:
+            if index not in busy:
+                return index
+
+        # Pool is full: steal the oldest of the lowest-priority voices this sound outranks or equals
+        victims = [index for index in busy if self.voices[index][1] <= priority]
+        if not victims:
+            return None
+        self.stolen += 1
+        return min(victims, key=lambda index: (self.voices[index][1], self.voices[index][2]))
+
+    def describe(self):
+        """One-line summary for the perf overlay"""
+        busy = sum(1 for channel in self.channels if channel.get_busy())
+        return (f"{busy}/{len(self.channels)} voices, {self.played} played, {self.skipped} merged, "
+                f"{self.stolen} stolen, {self.dropped} dropped")
+
+
+# Shared by the main loop (which opens it) and the game objects that trigger sounds
+audio = AudioManager()
@@ -0,0 +1,153 @@
+import math
+import weakref
+from constants import *
+
+class Autopilot:
+    """Built-in bot that flies the ship and clicks through the menus.
+
+    Attach it as PlayingScreen.input_controller: get_controls returns the same
+    (move_x, move_y, fire, use_ability) tuple the keyboard produces. In the
+    windowed game drive_menus is called once per frame so sessions can run
+    unattended: it retries lost missions, starts the highest unlocked one (or
+    the next one from level_plan) and picks abilities through the
+    AbilitySelectionScreen.
+    """
+
+    # Abilities in order of preference when the ship is healthy
+    ABILITY_PREFERENCE = (ABILITY_PIERCING, ABILITY_RAPID_FIRE, ABILITY_SHIELD)
+
+    def __init__(self, level_plan=None, max_retries=None):
+        self.level_plan = level_plan  # Optional iterator of levels to start; None (or once it runs out) plays the highest unlocked
+        self.max_retries = max_retries  # Retries of a lost mission before moving on; None retries forever
+        self.retries = 0
+        self.menu_state = None
+        self.menu_timer = 0
+        self.last_positions = weakref.WeakKeyDictionary()  # object -> (x, y) seen on the previous frame
+
+    def get_controls(self, playing_screen, game_state):
+        player = playing_screen.player
+        screen_width = playing_screen.screen.get_width()
+        screen_height = playing_screen.screen.get_height()
+
+        move_x = self.dodge(playing_screen, player, screen_width, self.track(playing_screen, player))
+
+        # Drift back to the home row, low on the screen
+        home_y = screen_height * AUTOPILOT_HOME_ROW
+        move_y = 0
+        if abs(player.y - home_y) > player.speed:
+            move_y = 1 if home_y > player.y else -1
+
+        return move_x, move_y, True, game_state.can_use_ability()
+
+    def dodge(self, playing_screen, player, screen_width, preferred):
+        """Pick the horizontal direction that stays clear of incoming fire the longest.
+
+        Every projectile and enemy that reaches the ship's row within the lookahead
+        is a threat. Each direction is tried by predicting where the ship will be at
+        each threat's arrival; the preferred (tracking) direction wins ties.
+        """
+        threats = []  # (frames until arrival, x at arrival, clearance needed)
+        positions = weakref.WeakKeyDictionary()
+        for obj in playing_screen.enemy_projectiles + playing_screen.enemies:
+            positions[obj] = (obj.x, obj.y)
+            vx, vy = self.get_velocity(obj)
+            if vy <= 0:
+                continue
+            frames = (player.y - obj.y) / vy
+            if 0 <= frames <= AUTOPILOT_DODGE_LOOKAHEAD:
+                impact_x = obj.x + vx * frames
+                threats.append((frames, impact_x, (player.width + obj.width) / 2 + AUTOPILOT_DODGE_MARGIN))
+        self.last_positions = positions
+        if not threats:
+            return preferred
+
+        min_x = player.width // 2
+        max_x = screen_width - player.width // 2
+        best_direction = preferred
+        best_time = -1
+        for direction in (preferred, 0, 1, -1):
+            # Frames until the first hit when holding this direction
+            first_hit = math.inf
+            for frames, impact_x, clearance in threats:
+                x = max(min_x, min(max_x, player.x + direction * player.speed * frames))
+                if abs(impact_x - x) < clearance:
+                    first_hit = min(first_hit, frames)
+            if first_hit > best_time:
+                best_direction = direction
+                best_time = first_hit
+            if first_hit == math.inf:
+                break
+        return best_direction
+
+    def get_velocity(self, obj):
+        """Per-frame velocity, measured from the last frame when the object was seen before"""
+        last = self.last_positions.get(obj)
+        if last is not None:
+            return obj.x - last[0], obj.y - last[1]
+        if hasattr(obj, 'angle'):
+            angle_rad = math.radians(obj.angle)
+            return math.cos(angle_rad) * obj.speed, math.sin(angle_rad) * obj.speed
+        return 0, obj.speed
+
+    def track(self, playing_screen, player):
+        """Line up under the lowest enemy still above the ship, or the boss"""
+        target = None
+        for enemy in playing_screen.enemies:
+            if enemy.y < player.y and (target is None or enemy.y > target.y):
+                target = enemy
+        if target is None:
+            target = playing_screen.boss
+        if target is None or abs(target.x - player.x) <= player.speed:
+            return 0
+        return 1 if target.x > player.x else -1
+
+    def next_level(self, game_state):
+        """Level to start from the level select screen"""
+        if self.level_plan is not None:
+            # A finished plan (or a locked level) falls back to the highest unlocked level
+            level = next(self.level_plan, None)
+            if level is not None and game_state.is_level_available(level):
+                return level
+        unlocked = [level for level in range(1, 6) if game_state.is_level_available(level)]
+        return max(unlocked)
+
+    def choose_ability(self, chosen_abilities, player):
+        """Index of the offered ability to take"""
+        if player.health <= player.max_health // 2 and ABILITY_SHIELD in chosen_abilities:
+            return chosen_abilities.index(ABILITY_SHIELD)
+        for ability_id in self.ABILITY_PREFERENCE:
+            if ability_id in chosen_abilities:
+                return chosen_abilities.index(ability_id)
+        return 0
+
+    def drive_menus(self, game):
+        """Answer whichever menu is up, after a short pause so the screen can be seen"""
+        game_state = game.game_state
+        state = game_state.current_state
+        if state != self.menu_state:
+            self.menu_state = state
+            self.menu_timer = 0
+            return
+        self.menu_timer += 1
+        if self.menu_timer < AUTOPILOT_MENU_DELAY:
+            return
+        self.menu_timer = 0
+
+        if state == STATE_TITLE:
+            game.title_screen.begin_game(game_state)
+        elif state == STATE_LEVEL_SELECT:
+            self.retries = 0
+            game.level_select.start_level(game_state, self.next_level(game_state))
+        elif state == STATE_ABILITY_SELECT:
+            player = game.playing_screen.player
+            index = self.choose_ability(game.ability_selection_screen.chosen_abilities, player)
+            game.ability_selection_screen.select_ability(index, game_state, player)
+        elif state == STATE_GAME_OVER:
+            if self.max_retries is not None and self.retries >= self.max_retries:
+                game.game_over_screen.return_to_title(game_state)
+            else:
+                self.retries += 1
+                game.game_over_screen.retry(game_state)
+        elif state == STATE_VICTORY:
+            game.victory_screen.return_to_title(game_state)
+        # Paused, debug menu and gallery are left to the person at the keyboard
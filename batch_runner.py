@@ -0,0 +1,265 @@
+"""Run many headless missions in parallel and stream the results to a JSONL file.
+
+Example:
+    python batch_runner.py --runs 1000 --levels 1-5 --workers 8 --out results.jsonl
+
+Every worker process owns one headless PlayingScreen that is reset for each
+run, so a run only pays for the mission itself. Each run gets its own seed and
+is reproducible on its own with the same seed, level and input.
+"""
+import os
+
+# Workers never open a real window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep stdout clean for --out -
+
+import argparse
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pygame
+import pygame_gui
+from constants import *
+from utils import load_theme
+from game_state import GameState
+from playing_screen import PlayingScreen
+from ability_selection_screen import AbilitySelectionScreen
+from autopilot import Autopilot
+from mem_profiler import MemoryProfiler, profile_stage
+
+# Entity lists whose peak sizes are reported for each run
+TRACKED_ENTITIES = ('enemies', 'enemy_projectiles', 'player_lasers', 'power_ups', 'particles', 'explosions')
+
+# Per-process state created by init_worker
+_worker = None
+
+
+class ScriptedInput:
+    """Deterministic sweep-and-fire input: strafe left and right across the screen while firing"""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.direction = self.rng.choice((-1, 1))
+        self.hold_frames = 0
+
+    def get_controls(self, playing_screen, game_state):
+        player = playing_screen.player
+        screen_width = playing_screen.screen.get_width()
+
+        # Pick a new strafe every so often and bounce off the screen edges
+        self.hold_frames -= 1
+        if self.hold_frames <= 0:
+            self.direction = self.rng.choice((-1, 0, 1))
+            self.hold_frames = self.rng.randint(20, 90)
+        if player.x < screen_width * 0.1:
+            self.direction = 1
+        elif player.x > screen_width * 0.9:
+            self.direction = -1
+
+        return self.direction, 0, True, False
+
+
+# Input controllers selectable with --input, built as factory(seed)
+INPUT_CONTROLLERS = {
+    'scripted': ScriptedInput,
+    'autopilot': lambda seed: Autopilot(),
+}
+
+
+class HeadlessWorker:
+    """One dummy display, UI manager and PlayingScreen reused for every run in a process"""
+
+    def __init__(self, render, memprofile):
+        pygame.init()
+        self.render = render
+        self.memprofile = memprofile
+        self.screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
+        self.manager = pygame_gui.UIManager((DEFAULT_WIDTH, DEFAULT_HEIGHT), load_theme())
+        self.playing_screen = PlayingScreen(self.screen, self.manager)
+        self.ability_selection_screen = AbilitySelectionScreen(self.screen, self.manager)
+
+    def run(self, run_id, level, seed, input_name, max_frames):
+        """Play one mission to its end and return its result record"""
+        random.seed(seed)
+        game_state = GameState()
+        for unlocked in range(1, level + 1):
+            game_state.unlock_level(unlocked)
+        game_state.set_current_level(level)
+        game_state.change_state(STATE_PLAYING)
+
+        playing_screen = self.playing_screen
+        # Assets preloaded by the previous run were built from that run's seed
+        playing_screen.level_preloader.clear()
+        playing_screen.input_controller = INPUT_CONTROLLERS[input_name](seed)
+        playing_screen.reset(game_state)
+
+        # Only the mission itself is profiled, not the setup above
+        profiler = None
+        frame_blocks = []
+        if self.memprofile:
+            profiler = MemoryProfiler()
+            playing_screen.profiler = profiler
+            profiler.start()
+
+        frame_times = []
+        peaks = dict.fromkeys(TRACKED_ENTITIES, 0)
+        outcome = 'timeout'
+        started = time.perf_counter()
+
+        for frame in range(max_frames):
+            frame_start = time.perf_counter()
+
+            if game_state.current_state == STATE_ABILITY_SELECT:
+                self.select_ability(game_state)
+            with profile_stage(profiler, 'update'):
+                playing_screen.update(game_state)
+            if self.render:
+                with profile_stage(profiler, 'draw'):
+                    playing_screen.draw(self.screen, game_state)
+                with profile_stage(profiler, 'ui'):
+                    self.manager.update(1 / FPS)
+                    self.manager.draw_ui(self.screen)
+            if profiler:
+                frame_blocks.append(profiler.end_frame())
+
+            frame_times.append((time.perf_counter() - frame_start) * 1000.0)
+            for name in TRACKED_ENTITIES:
+                peaks[name] = max(peaks[name], len(getattr(playing_screen, name)))
+
+            if playing_screen.game_over:
+                outcome = 'defeat'
+                break
+            if game_state.boss_defeated:
+                outcome = 'victory'
+                break
+            if playing_screen.level_complete_timer > 0:
+                outcome = 'complete'
+                break
+
+        result = {
+            'run': run_id,
+            'level': level,
+            'seed': seed,
+            'input': input_name,
+            'outcome': outcome,
+            'frames': len(frame_times),
+            'frame_ms': summarize_frame_times(frame_times),
+            'peak_entities': peaks,
+            'kills': playing_screen.kills,
+            'score': playing_screen.score,
+            'player_health': playing_screen.player.health if playing_screen.player else 0,
+            'wall_seconds': round(time.perf_counter() - started, 3)
+        }
+        if profiler:
+            profiler.stop()
+            playing_screen.profiler = None
+            result['memory'] = profiler.report()
+            result['memory']['net_blocks_per_frame'] = summarize_frame_times(frame_blocks)
+        return result
+
+
+    def select_ability(self, game_state):
+        """Answer the ability selection screen the controller opened"""
+        screen = self.ability_selection_screen
+        player = self.playing_screen.player
+        # Roll the offered abilities from the run's own random state
+        screen.setup_ui()
+        index = self.playing_screen.input_controller.choose_ability(screen.chosen_abilities, player)
+        screen.select_ability(index, game_state, player)
+
+
+def summarize_frame_times(frame_times):
+    """Mean, percentiles and max of a list of per-frame values (frame times in ms, block counts)"""
+    if not frame_times:
+        return {}
+    ordered = sorted(frame_times)
+
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    return {
+        'mean': round(sum(ordered) / len(ordered), 4),
+        'p50': round(percentile(50), 4),
+        'p95': round(percentile(95), 4),
+        'p99': round(percentile(99), 4),
+        'max': round(ordered[-1], 4)
+    }
+
+
+def init_worker(render, memprofile):
+    global _worker
+    _worker = HeadlessWorker(render, memprofile)
+
+
+def run_mission(run_id, level, seed, input_name, max_frames):
+    """Process pool entry point"""
+    return _worker.run(run_id, level, seed, input_name, max_frames)
+
+
+def parse_levels(text):
+    """Parse "1-5", "2,4" or "1-3,5" into a sorted list of level numbers"""
+    levels = set()
+    for part in text.split(','):
+        if '-' in part:
+            low, high = part.split('-')
+            levels.update(range(int(low), int(high) + 1))
+        elif part:
+            levels.add(int(part))
+    if not levels or min(levels) < 1 or max(levels) > 5:
+        raise argparse.ArgumentTypeError("levels must be between 1 and 5")
+    return sorted(levels)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless Starfall missions in parallel.")
+    parser.add_argument('--runs', type=int, default=100, help="total number of missions to play")
+    parser.add_argument('--levels', type=parse_levels, default=[1, 2, 3, 4, 5],
+                        help="levels to cycle through, e.g. 1-5 or 2,4 (default: 1-5)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument('--seed', type=int, default=0, help="base seed; run N uses seed + N")
+    parser.add_argument('--input', choices=sorted(INPUT_CONTROLLERS), default='autopilot',
+                        help="what flies the ship (default: autopilot)")
+    parser.add_argument('--max-frames', type=int, default=60 * 60 * 10,
+                        help="frames before a run counts as a timeout (default: 10 minutes at 60 FPS)")
+    parser.add_argument('--render', action='store_true', help="also draw every frame and the UI (slower)")
+    parser.add_argument('--memprofile', action='store_true',
+                        help="record allocations and GC pauses per stage with tracemalloc (much slower)")
+    parser.add_argument('--out', default='batch_results.jsonl', help="JSONL file to write, - for stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out = sys.stdout if args.out == '-' else open(args.out, 'w')
+    outcomes = {}
+    started = time.perf_counter()
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                                 initargs=(args.render, args.memprofile)) as executor:
+            futures = [
+                executor.submit(run_mission, run_id, args.levels[run_id % len(args.levels)],
+                                args.seed + run_id, args.input, args.max_frames)
+                for run_id in range(args.runs)
+            ]
+            # Stream each result as soon as its run finishes
+            for future in as_completed(futures):
+                result = future.result()
+                out.write(json.dumps(result) + '\n')
+                out.flush()
+                outcomes[result['outcome']] = outcomes.get(result['outcome'], 0) + 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    summary = ', '.join(f"{name}: {count}" for name, count in sorted(outcomes.items()))
+    print(f"{args.runs} runs in {elapsed:.1f}s ({summary})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
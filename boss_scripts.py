@@ -0,0 +1,66 @@
+"""Behavior scripts for the boss's attack phases.
+
+Each phase is a generator that takes the BossEnemy and yields commands:
+Wait(frames) holds the boss still, and Move(frames, speed, path, until)
+sweeps it sideways at speed * BOSS_SPEED, bouncing off the screen edges,
+while the movement path (MOVEMENT_PATHS id, sampled by phase_timer) adds its
+precomputed offset each frame. A Move with an until callable ends early on
+the first frame it returns true. Code between yields runs when the previous
+command has finished, so timed behavior reads top to bottom:
+
+    def phase_3(boss):
+        while True:
+            yield Move(110, 1.8, 'boss_bob_3')
+            boss.dash(20)
+            yield Wait(10)
+
+BossEnemy.update resumes the script only when its current command is done;
+during a Wait it does nothing but read a timer.
+"""
+import math
+import random
+from collections import namedtuple
+
+Wait = namedtuple('Wait', 'frames')
+Move = namedtuple('Move', 'frames speed path until', defaults=(None, None))
+
+
+def phase_1(boss):
+    # Simple left-right movement
+    while True:
+        yield Move(600, 1.0)
+
+def phase_2(boss):
+    # Faster movement with slight vertical oscillation
+    while True:
+        yield Move(600, 1.5, 'boss_bob_2')
+
+def phase_3(boss):
+    # More aggressive movement with a quick dash every 2 seconds, then a brief hover
+    while True:
+        yield Move(110, 1.8, 'boss_bob_3')
+        boss.dash(20)
+        yield Wait(10)
+
+def phase_4(boss):
+    # Erratic movement that slows down and stabilizes while the beam charges
+    charging = lambda: boss.beam_charge_time > 0
+    while True:
+        if charging():
+            yield Move(boss.beam_charge_time, 1.0, 'boss_bob_4')
+        else:
+            yield Move(600, 1.5, 'boss_bob_4', until=charging)
+
+def phase_5(boss):
+    # Desperate, frantic movement with random direction changes (1% chance per frame)
+    while True:
+        yield Move(int(math.log(1.0 - random.random()) / math.log(0.99)) + 1, 2.5, 'boss_bob_5')
+        boss.direction *= -1
+
+PHASE_SCRIPTS = {
+    1: phase_1,
+    2: phase_2,
+    3: phase_3,
+    4: phase_4,
+    5: phase_5
+}
@@ -0,0 +1,99 @@
+import math
+import random
+from constants import *
+from game_objects import EnemyProjectile
+
+class BulletPattern:
+    """One BULLET_PATTERNS entry, compiled into per-shot tables.
+
+    Every shot's direction, velocity and start offset is worked out once
+    here. Emitting a volley is then a walk over those tables; aimed and
+    jittered patterns only add one rotation per volley, and spirals pick the
+    precomputed turn for the volley number.
+    """
+
+    def __init__(self, name, definition):
+        self.name = name
+        self.emitter = definition['emitter']
+        self.projectile = definition['projectile']
+        self.count = definition.get('count', 1)
+        self.jitter = definition.get('jitter', 0)
+        self.flash = definition.get('flash')
+        self.speed = definition.get('speed')
+        self.damage = definition.get('damage')
+        self.width = definition.get('width')
+        self.height = definition.get('height')
+        self.health = definition.get('health')
+        # Default speed of the projectile type, for the velocity tables
+        speed = self.speed if self.speed is not None else EnemyProjectile(0, 0, 90, self.projectile).speed
+        radius = definition.get('radius', 0)
+        offsets = definition.get('offsets', [0] * self.count)
+
+        if self.emitter == 'spiral':
+            step = definition['step']
+            turns = max(1, round(360 / math.gcd(int(step), 360)))
+            angle_sets = [self.ring_angles(definition.get('angle', 90) + turn * step, 360) for turn in range(turns)]
+        elif self.emitter == 'ring':
+            angle_sets = [self.ring_angles(definition.get('angle', 90), definition.get('arc', 360))]
+        elif self.emitter == 'aimed':
+            # Relative to the direction of the target, rotated when the volley is fired
+            angle_sets = [self.spread_angles(0, definition.get('arc', 0))]
+        else:
+            angle_sets = [self.spread_angles(definition.get('angle', 90), definition.get('arc', 0))]
+
+        # One table per turn: (angle, vx, vy, x offset, y offset) for every shot
+        self.tables = []
+        for angles in angle_sets:
+            table = []
+            for angle, offset_x in zip(angles, offsets):
+                cos_a, sin_a = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+                table.append((angle, cos_a * speed, sin_a * speed, offset_x + cos_a * radius, sin_a * radius))
+            self.tables.append(table)
+        # Line emitters place shots by fraction of the screen width instead
+        self.line_fractions = [(i + 1) / (self.count + 1) for i in range(self.count)]
+
+    def spread_angles(self, center, arc):
+        if self.count == 1:
+            return [center]
+        return [center - arc / 2 + arc * i / (self.count - 1) for i in range(self.count)]
+
+    def ring_angles(self, start, arc):
+        if arc >= 360:
+            return [start + 360 * i / self.count for i in range(self.count)]
+        return self.spread_angles(start, arc)
+
+    def emit(self, store, x, y, target=None, screen_width=None, volley=0, rng=random):
+        """Append one volley fired from (x, y) to store; returns the number of projectiles"""
+        table = self.tables[volley % len(self.tables)]
+        turn = 0.0
+        if self.emitter == 'aimed':
+            turn = math.degrees(math.atan2(target[1] - y, target[0] - x)) if target else 90.0
+        if self.jitter:
+            turn += rng.uniform(-self.jitter, self.jitter)
+
+        if turn:
+            cos_t, sin_t = math.cos(math.radians(turn)), math.sin(math.radians(turn))
+            table = [(angle + turn, vx * cos_t - vy * sin_t, vx * sin_t + vy * cos_t,
+                      ox * cos_t - oy * sin_t, ox * sin_t + oy * cos_t)
+                     for angle, vx, vy, ox, oy in table]
+
+        if self.emitter == 'line':
+            starts = [(screen_width * fraction, y) for fraction in self.line_fractions]
+        else:
+            starts = [(x + ox, y + oy) for _, _, _, ox, oy in table]
+
+        store.extend([
+            EnemyProjectile(start_x, start_y, angle, self.projectile, damage=self.damage, speed=self.speed,
+                            width=self.width, height=self.height, health=self.health, velocity=(vx, vy))
+            for (start_x, start_y), (angle, vx, vy, _, _) in zip(starts, table)
+        ])
+        return len(table)
+
+
+def compile_patterns(definitions=BULLET_PATTERNS):
+    """Pattern name -> BulletPattern"""
+    return {name: BulletPattern(name, definition) for name, definition in definitions.items()}
+
+
+# Compiled once, shared by every PlayingScreen
+bullet_patterns = compile_patterns()
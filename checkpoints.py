@@ -0,0 +1,75 @@
+import pickle
+
+# Gameplay state a retry has to put back; stars, background, nebula, UI and
+# images are left alone because a retry reuses the ones already built for the level
+PLAYING_SCREEN_FIELDS = (
+    'timers',  # First: the timer fields below are restored relative to its clock
+    'player', 'enemies', 'player_lasers', 'enemy_projectiles', 'pattern_volleys', 'power_ups', 'boss',
+    'score', 'kills', 'enemy_spawn_timer', 'next_burst', 'power_up_spawn_timer', 'frame_count',
+    'game_over', 'level_completing', 'level_complete_timer', 'show_boss_intro', 'boss_intro_timer',
+    'notification_active', 'notification_timer'
+)
+GAME_STATE_FIELDS = ('enemies_defeated_this_level', 'ability_kill_counter')
+
+CHECKPOINT_LEVEL_START = 'level_start'
+CHECKPOINT_BOSS_PHASE = 'boss_phase'
+
+
+class CheckpointStore:
+    """Pickled snapshots of a mission's gameplay state, for instant retries.
+
+    A snapshot is taken when a level starts and again whenever the boss
+    enters a new phase. Each one remembers the level and screen size it was
+    taken at and only restores into the same ones; anything else falls back
+    to a full PlayingScreen.reset. Restoring unpickles a few dozen small
+    objects, so a retry no longer rebuilds the stars, background or boss.
+    Cosmetic effects are not saved and start empty after a restore.
+    """
+
+    def __init__(self):
+        self.snapshots = {}  # name -> (level, screen size, extra info, pickled state)
+
+    def capture(self, name, playing_screen, game_state, info=None):
+        state = {
+            'playing_screen': {field: getattr(playing_screen, field) for field in PLAYING_SCREEN_FIELDS},
+            'game_state': {field: getattr(game_state, field) for field in GAME_STATE_FIELDS}
+        }
+        data = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+        self.snapshots[name] = (game_state.current_level, playing_screen.screen.get_size(), info, data)
+
+    def get(self, name, playing_screen, game_state):
+        """The snapshot usable for this level and screen size, or None"""
+        snapshot = self.snapshots.get(name)
+        if snapshot is None:
+            return None
+        level, size, _, _ = snapshot
+        if level != game_state.current_level or size != playing_screen.screen.get_size():
+            return None
+        return snapshot
+
+    def get_info(self, name, playing_screen, game_state):
+        snapshot = self.get(name, playing_screen, game_state)
+        return snapshot[2] if snapshot else None
+
+    def restore(self, name, playing_screen, game_state):
+        """Put a snapshot back into playing_screen and game_state; returns False if there is none"""
+        snapshot = self.get(name, playing_screen, game_state)
+        if snapshot is None:
+            return False
+        state = pickle.loads(snapshot[3])
+        for field, value in state['playing_screen'].items():
+            setattr(playing_screen, field, value)
+        for field, value in state['game_state'].items():
+            setattr(game_state, field, value)
+        playing_screen.particles = []
+        playing_screen.explosions = []
+        return True
+
+    def discard(self, name):
+        self.snapshots.pop(name, None)
+
+    def clear(self):
+        self.snapshots = {}
+
+    def get_size_bytes(self):
+        return sum(len(snapshot[3]) for snapshot in self.snapshots.values())
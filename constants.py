@@ -40,6 +40,7 @@ PLAYER_SHIELD_MAX = 7  # Reduced shield health to absorb about 5 bullets
 LASER_COOLDOWN = 15
 POWER_UP_DURATION = 300  # 5 seconds at 60 FPS
 ABILITY_ENEMY_KILL_THRESHOLD = 5  # Changed from 2 to 5 enemies needed for ability selection
+TIMER_WHEEL_SLOTS = 256  # Frames per turn of the timer wheel; longer timers wait in their slot for later turns
 
 # Notification settings
 NOTIFICATION_DURATION = 180  # 3 seconds at 60 FPS
@@ -72,6 +73,7 @@ ABILITIES = {
 ENEMY_SPAWN_RATE = 60  # Frames between spawns
 ENEMY_TYPES = ["Swarmer", "Striker", "Destroyer", "Harvester", "SporeLauncher"]
 ENEMY_SPAWN_WEIGHTS = [0.4, 0.2, 0.1, 0.2, 0.1]  # Probability weights for each type
+SPAWN_TABLE_PATH = "waves.json"  # Per-level wave data in the assets package; levels it leaves out use the settings above
 
 # Enemy level progression (which level each enemy first appears in)
 ENEMY_LEVEL_PROGRESSION = {
@@ -119,6 +121,93 @@ BOSS_NAME = "Kryll Command Carrier"
 # Boss phase health thresholds (percentage of max health)
 BOSS_PHASE_THRESHOLDS = [1.0, 0.8, 0.6, 0.4, 0.2]  # 5 phases at 100%, 80%, 60%, 40%, and 20% health
 
+# Bullet patterns (compiled by bullet_patterns.py). Angles are in degrees, 90 is straight down.
+# emitter: 'spread' (count shots across arc around angle), 'ring' (count shots around the
+#   full circle, or across arc), 'aimed' (a spread around the direction to the player),
+#   'spiral' (a ring turned by step degrees every volley) or 'line' (count shots spaced
+#   evenly across the screen width, all heading along angle)
+# Optional: offsets (x offset of each shot), radius (shots start this far out along their
+#   direction), jitter (random turn of the whole volley), flash ((explosion size, color) at
+#   the muzzle), and speed, damage, width, height, health for the projectiles
+BULLET_PATTERNS = {
+    # Boss
+    'boss_laser_fan': {'emitter': 'spread', 'projectile': 'laser', 'count': 5, 'arc': 30,
+                       'speed': 7, 'damage': 1, 'flash': (0.3, (255, 50, 50))},
+    'boss_laser_wall': {'emitter': 'spread', 'projectile': 'laser', 'count': 6, 'arc': 70,
+                        'speed': 7, 'damage': 1, 'flash': (0.3, (255, 50, 50))},
+    'boss_laser_wall_wide': {'emitter': 'spread', 'projectile': 'laser', 'count': 8, 'arc': 90,
+                             'speed': 7, 'damage': 1, 'flash': (0.3, (255, 50, 50))},
+    'boss_plasma_aimed': {'emitter': 'aimed', 'projectile': 'plasma', 'count': 1, 'speed': 4, 'damage': 2,
+                          'width': 15, 'height': 15, 'health': 3, 'flash': (1.0, (255, 100, 255))},
+    'boss_plasma_burst': {'emitter': 'aimed', 'projectile': 'plasma', 'count': 3, 'arc': 30, 'speed': 4, 'damage': 2,
+                          'width': 15, 'height': 15, 'health': 3, 'flash': (1.0, (255, 100, 255))},
+    'boss_spread_ring': {'emitter': 'ring', 'projectile': 'small', 'count': 6, 'arc': 180, 'radius': 30,
+                         'speed': 5, 'damage': 1},
+    'boss_spiral': {'emitter': 'spiral', 'projectile': 'small', 'count': 3, 'step': 17, 'radius': 30,
+                    'speed': 4, 'damage': 1},
+    'boss_mine_line': {'emitter': 'line', 'projectile': 'mine', 'count': 3, 'speed': 2, 'damage': 3,
+                       'width': 20, 'height': 20, 'health': 5},
+    # Regular enemies (one shot each)
+    'swarmer_shot': {'emitter': 'spread', 'projectile': 'bullet', 'count': 1, 'speed': 6, 'damage': 1},
+    'striker_shot': {'emitter': 'spread', 'projectile': 'plasma', 'count': 1, 'speed': 5, 'damage': 1,
+                     'width': 10, 'height': 10},
+    'destroyer_shot': {'emitter': 'spread', 'projectile': 'plasma', 'count': 1, 'speed': 3, 'damage': 2,
+                       'width': 15, 'height': 15, 'health': 2},
+    'harvester_shot': {'emitter': 'spread', 'projectile': 'bullet', 'count': 1, 'jitter': 15, 'speed': 4, 'damage': 1},
+    'spore_shot': {'emitter': 'spread', 'projectile': 'spore', 'count': 1, 'speed': 2, 'damage': 1,
+                   'width': 20, 'height': 20, 'health': 1}
+}
+ENEMY_PATTERNS = {
+    "Swarmer": 'swarmer_shot',
+    "Striker": 'striker_shot',
+    "Destroyer": 'destroyer_shot',
+    "Harvester": 'harvester_shot',
+    "SporeLauncher": 'spore_shot'
+}
+
+# Movement paths (compiled by movement_paths.py into per-frame (dx, dy) tables sampled by integer phase)
+# kind: 'sinusoid' (sum of terms (wave, rate in radians per frame, amplitude) along axis,
+#   starting start frames in), 'spline' (closed Catmull-Rom loop through points, offsets
+#   from the start, taking frames per lap) or 'formation' (spawn offsets of each member,
+#   used by burst groups in the wave file)
+PATH_TABLE_SIZE = 3770  # Frames in a sinusoid table; whole periods (to within 0.1 frames) of every rate below
+MOVEMENT_PATHS = {
+    'swarmer_wobble': {'kind': 'sinusoid', 'axis': 'x', 'terms': [('sin', 0.3, 2.0)],
+                       'start': -47 / 3},  # sin(0.1 * y) for y = -50 + 3 per frame
+    'spore_arc': {'kind': 'sinusoid', 'axis': 'x', 'terms': [('sin', 0.2, 2.0)]},  # sin(0.1 * y), 2 per update
+    'boss_bob_2': {'kind': 'sinusoid', 'axis': 'y', 'terms': [('sin', 0.05, 0.5)]},
+    'boss_bob_3': {'kind': 'sinusoid', 'axis': 'y', 'terms': [('sin', 0.08, 0.8)]},
+    'boss_bob_4': {'kind': 'sinusoid', 'axis': 'y', 'terms': [('sin', 0.05, 1.0), ('sin', 0.1, 0.5)]},
+    'boss_bob_5': {'kind': 'sinusoid', 'axis': 'y', 'terms': [('sin', 0.1, 1.2), ('sin', 0.2, 0.8), ('cos', 0.15, 0.5)]},
+    'figure_eight': {'kind': 'spline', 'frames': 240,
+                     'points': [(0, 0), (40, 20), (0, 40), (-40, 20), (0, 0), (40, -20), (0, -40), (-40, -20)]},
+    'v_wing': {'kind': 'formation', 'slots': [(0, 0), (-40, -30), (40, -30), (-80, -60), (80, -60)]},
+    'line_abreast': {'kind': 'formation', 'slots': [(-120, 0), (-60, 0), (0, 0), (60, 0), (120, 0)]}
+}
+ENEMY_PATHS = {"Swarmer": 'swarmer_wobble'}  # Enemy type -> path added to its straight descent
+PROJECTILE_PATHS = {"spore": 'spore_arc'}  # Projectile type -> path added to its velocity
+
+# Boss attacks per phase: (attack, pattern, cooldown frames). The attack names the boss
+# cooldown it runs on (shoot_cooldown_<attack>); the beam has no pattern
+BOSS_PHASE_ATTACKS = {
+    1: [('laser', 'boss_laser_fan', BOSS_SHOOT_COOLDOWN_LASER // 2),
+        ('plasma', 'boss_plasma_aimed', BOSS_SHOOT_COOLDOWN_PLASMA // 2)],
+    2: [('laser', 'boss_laser_fan', BOSS_SHOOT_COOLDOWN_LASER // 2),
+        ('plasma', 'boss_plasma_aimed', BOSS_SHOOT_COOLDOWN_PLASMA // 2)],
+    3: [('laser', 'boss_laser_wall', int(BOSS_SHOOT_COOLDOWN_LASER * 0.8) // 2),
+        ('plasma', 'boss_plasma_aimed', BOSS_SHOOT_COOLDOWN_PLASMA // 2),
+        ('spread', 'boss_spread_ring', BOSS_SHOOT_COOLDOWN_SPREAD)],
+    4: [('laser', 'boss_laser_wall_wide', int(BOSS_SHOOT_COOLDOWN_LASER * 0.8) // 2),
+        ('plasma', 'boss_plasma_burst', int(BOSS_SHOOT_COOLDOWN_PLASMA * 0.7) // 2),
+        ('spread', 'boss_spiral', 30),
+        ('beam', None, BOSS_SHOOT_COOLDOWN_BEAM)],
+    5: [('laser', 'boss_laser_wall_wide', int(BOSS_SHOOT_COOLDOWN_LASER * 0.8) // 2),
+        ('plasma', 'boss_plasma_burst', int(BOSS_SHOOT_COOLDOWN_PLASMA * 0.7) // 2),
+        ('spread', 'boss_spiral', 20),
+        ('beam', None, BOSS_SHOOT_COOLDOWN_BEAM),
+        ('mines', 'boss_mine_line', BOSS_SHOOT_COOLDOWN_MINES)]
+}
+
 # Nebula Colors per Level (RGB, alpha added later)
 # Getting progressively more red/brown
 NEBULA_COLORS = [
@@ -185,6 +274,70 @@ FADE_DURATION = 30  # Frames for fade transitions
 SCREEN_TRANSITION_DURATION = 45  # Frames for screen transitions
 BUTTON_HOVER_ALPHA = 40  # Alpha value for button hover effect
 ANIMATION_ENABLED = True  # Can be toggled for performance
+STARFIELD_DENSITY = 1.0  # Multiplier for background star counts on every screen
+TITLE_PULSE_FRAMES = 12  # Number of pre-scaled frames used for pulsing menu titles
+
+# Performance overlay settings (toggle in game with F3)
+SHOW_PERF_OVERLAY = False
+PERF_OVERLAY_SAMPLES = 120  # Frames averaged for the frame time readout
+PERF_OVERLAY_REFRESH = 15  # Frames between text refreshes
+
+# Adaptive quality settings: effects are scaled down when frames run over budget
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_FRAME_BUDGET_MS = 1000.0 / 60  # Work time allowed per frame
+QUALITY_LEVELS = (1.0, 0.75, 0.5, 0.3)  # Effect detail multipliers, best first
+QUALITY_SAMPLE_FRAMES = 30  # Frames averaged before each decision
+QUALITY_DOWNGRADE_RATIO = 0.95  # Drop a level when the average exceeds this share of the budget
+QUALITY_UPGRADE_RATIO = 0.6  # Raise a level when the average is below this share of the budget
+QUALITY_UPGRADE_DELAY = 180  # Frames to wait after any change before raising the level again
+
+# Entity budgets: cosmetic effects beyond these are evicted every frame
+PARTICLE_BUDGET = 400  # Oldest particles are dropped first
+EXPLOSION_BUDGET = 40  # Hit effects are dropped before kill explosions
+ENEMY_PROJECTILE_BUDGET = 200  # Never evicted (they can hit the player); overflow is only counted
+EFFECT_PRIORITY_HIT = 0  # Hit sparks, muzzle flashes, mine pulses
+EFFECT_PRIORITY_KILL = 1  # Kills, player damage and other effects worth keeping
+
+# Internal render resolution (set with --render-size): everything is drawn at this size and SDL scales it to the window
+RENDER_RESOLUTION = None  # e.g. (1280, 720); None draws directly at the window size
+RENDER_SCALE_SMOOTH = True  # Linear filtering when scaling up; False keeps hard pixel edges
+RENDER_BACKEND = 'surface'  # 'surface' blits, 'texture' uses the SDL2 renderer, 'software' is the renderer without a GPU
+TEXT_CACHE_SIZE = 256  # Rendered HUD strings kept for reuse (and as textures) before the cache is emptied
+
+# Audio settings
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER_SIZE = 256  # Samples per mixer buffer: about 6 ms at 44.1 kHz (pygame's default is 512+)
+AUDIO_CHANNEL_POOLS = {'weapons': 4, 'effects': 8, 'ui': 2}  # Reserved channels per sound category
+AUDIO_SHOOT_VOICES = 3  # Overlapping laser shots before the oldest is restarted
+
+# Synthesized sound effects: name -> (synth kind, size, pitch, channel pool, max voices, priority)
+SOUND_EFFECTS = {
+    'hit': ('hit', 1.0, 1.0, 'effects', 3, 0),
+    'explosion': ('explosion', 1.0, 1.0, 'effects', 3, 1),
+    'explosion_large': ('explosion', 2.0, 0.7, 'effects', 2, 2),
+    'shield_hit': ('shield_hit', 1.0, 1.0, 'effects', 2, 2),
+    'shield_break': ('shield_break', 1.0, 1.0, 'effects', 1, 3),
+    'player_damage': ('player_damage', 1.0, 1.0, 'effects', 2, 3),
+    'beam_charge': ('beam_charge', 1.0, 1.0, 'effects', 1, 3),
+    'phase_transition': ('phase_transition', 1.0, 1.0, 'effects', 1, 4)
+}
+SFX_CACHE_SIZE = 32  # Synthesized Sounds kept in memory
+SFX_CACHE_DIR = None  # Directory to persist synthesized effects as WAV files, e.g. "sound_cache"
+
+# Image assets (paths inside the assets package)
+ASSET_IMAGE_PATH = "images"
+ASSET_CACHE_SIZE = 64  # Scaled, display-format copies kept before the least recently used is dropped
+
+# Memory profiling settings (enable with --memprofile)
+MEMPROFILE_SNAPSHOT_INTERVAL = 60  # Frames between allocation site samples (0 disables them)
+MEMPROFILE_TOP_SITES = 8  # Allocation sites reported per stage
+MEMPROFILE_REPORT_PATH = "memprofile.json"  # Written on exit by the windowed game
+
+# Autopilot settings (enable with --autopilot)
+AUTOPILOT_DODGE_LOOKAHEAD = 45  # Frames ahead to check for incoming projectiles
+AUTOPILOT_DODGE_MARGIN = 12  # Extra pixels of clearance when dodging
+AUTOPILOT_HOME_ROW = 0.8  # Preferred height as a fraction of the screen
+AUTOPILOT_MENU_DELAY = 45  # Frames to wait on a menu before choosing
 
 # Animation curves
 def ease_in_out(t):
@@ -1,6 +1,8 @@
 import pygame
 import pygame_gui
 from constants import *
+from utils import create_surface
+from render_backend import blit_cached
 
 class DebugMenu:
     def __init__(self, screen, manager):
@@ -123,7 +125,7 @@ class DebugMenu:
         )
 
         # Create overlay
-        self.overlay = pygame.Surface((screen_width, screen_height))
+        self.overlay = create_surface((screen_width, screen_height))
         self.overlay.fill(BLACK)
         self.overlay.set_alpha(192)  # Darker than pause menu
 
@@ -163,17 +165,18 @@ class DebugMenu:
             self.close_button.hide()
         self.is_visible = False
         
+    def draw_overlay(self, surface):
+        # Draw semi-transparent overlay (baked into the frozen background by the main loop)
+        if self.overlay:
+            surface.blit(self.overlay, (0, 0))
+        
     def draw(self, surface):
         if not self.is_visible:
             return
-            
-        # Draw semi-transparent overlay
-        if self.overlay:
-            surface.blit(self.overlay, (0, 0))
         
         # Draw debug menu title
         if self.title_text:
-            surface.blit(self.title_text, self.title_rect)
+            blit_cached(surface, [(self.title_text, self.title_rect)])
         
     def handle_event(self, event, game_state, playing_screen):
         if not self.is_visible:
@@ -1,8 +1,9 @@
 import pygame
 import pygame_gui
-import random
 from constants import *
+from utils import create_surface
 from game_objects import Enemy
+from starfield import Starfield
 
 class EnemyGallery:
     def __init__(self, screen, manager):
@@ -15,6 +16,7 @@ class EnemyGallery:
         self.title_text = None
         self.title_rect = None
         self.overlay = None
+        self.stars = None
         
         # Enemy gallery data
         self.current_enemy_index = 0
@@ -80,9 +82,13 @@ class EnemyGallery:
         )
         
         # Create overlay
-        self.overlay = pygame.Surface((screen_width, screen_height))
+        self.overlay = create_surface((screen_width, screen_height))
         self.overlay.fill(BLACK)
         
+        # Twinkling star background for the new size
+        self.stars = Starfield(screen_width, screen_height, 100, size_range=(1, 4), direction=0,
+                               pulse=True, brightness_range=(100, 255))
+        
         # Restore visibility state
         if was_visible:
             self.show()
@@ -103,7 +109,7 @@ class EnemyGallery:
         display_width = int(500 * scale)
         display_height = int(400 * scale)
         
-        self.enemy_display = pygame.Surface((display_width, display_height), pygame.SRCALPHA)
+        self.enemy_display = create_surface((display_width, display_height), alpha=True)
         
         # Calculate position for the enemy_display
         self.enemy_display_rect = self.enemy_display.get_rect(center=(screen_width // 2, screen_height // 2))
@@ -134,14 +140,9 @@ class EnemyGallery:
         if self.overlay:
             surface.fill(BLACK)  # Fill with black
             
-            # Draw a fancy background with stars
-            for _ in range(100):
-                x = random.randint(0, surface.get_width())
-                y = random.randint(0, surface.get_height())
-                size = random.randint(1, 3)
-                brightness = random.randint(100, 255)
-                color = (brightness, brightness, brightness)
-                pygame.draw.circle(surface, color, (x, y), size)
+            # Draw a fancy background with twinkling stars
+            self.stars.update()
+            self.stars.draw(surface)
         
         # Draw title
         if self.title_text:
@@ -0,0 +1,62 @@
+from constants import *
+
+class EntityBudget:
+    """Caps the PlayingScreen's cosmetic entity lists once per frame.
+
+    Particles are appended in creation order, so the oldest are at the front
+    and are the first to go. Explosions are evicted lowest priority first
+    (hit effects before kill explosions) and oldest first within a priority.
+    Enemy projectiles affect gameplay and are never removed; frames where
+    they exceed their budget are only counted so a runaway pattern shows up
+    in the perf overlay.
+    """
+
+    def __init__(self, particle_budget=PARTICLE_BUDGET, explosion_budget=EXPLOSION_BUDGET,
+                 projectile_budget=ENEMY_PROJECTILE_BUDGET):
+        self.particle_budget = particle_budget
+        self.explosion_budget = explosion_budget
+        self.projectile_budget = projectile_budget
+        self.reset()
+
+    def reset(self):
+        self.evicted_particles = 0
+        self.evicted_explosions = 0
+        self.projectile_overflow_frames = 0
+
+    def enforce(self, playing_screen):
+        """Trim the cosmetic lists in place and record what was dropped"""
+        particles = playing_screen.particles
+        excess = len(particles) - self.particle_budget
+        if excess > 0:
+            del particles[:excess]
+            self.evicted_particles += excess
+
+        explosions = playing_screen.explosions
+        excess = len(explosions) - self.explosion_budget
+        if excess > 0:
+            self.evict_explosions(explosions, excess)
+            self.evicted_explosions += excess
+
+        if len(playing_screen.enemy_projectiles) > self.projectile_budget:
+            self.projectile_overflow_frames += 1
+
+    def evict_explosions(self, explosions, excess):
+        # Stable sort keeps creation order within a priority
+        order = sorted(range(len(explosions)), key=lambda index: explosions[index].priority)
+        doomed = set(order[:excess])
+        explosions[:] = [explosion for index, explosion in enumerate(explosions) if index not in doomed]
+
+    def get_stats(self):
+        """Eviction counts as a dict, for reports"""
+        return {
+            'particles': self.evicted_particles,
+            'explosions': self.evicted_explosions,
+            'projectile_overflow_frames': self.projectile_overflow_frames
+        }
+
+    def describe(self):
+        """One-line summary for the perf overlay"""
+        text = f"{self.evicted_particles} particles, {self.evicted_explosions} explosions"
+        if self.projectile_overflow_frames:
+            text += f", projectiles over budget for {self.projectile_overflow_frames} frames"
+        return text
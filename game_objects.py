@@ -2,22 +2,12 @@ import pygame
 import math
 import random
 from constants import *
-
-class Star:
-    def __init__(self, x, y, speed):
-        self.x = x
-        self.y = y
-        self.speed = speed
-        self.size = random.randint(1, 3)
-        
-    def update(self, screen_width, screen_height):
-        self.y += self.speed
-        if self.y > screen_height:
-            self.y = 0
-            self.x = random.randint(0, screen_width)
-            
-    def draw(self, surface):
-        pygame.draw.circle(surface, WHITE, (int(self.x), int(self.y)), self.size)
+from utils import create_surface, render_text
+from render_backend import blit_cached
+from audio_manager import audio
+from timer_wheel import Countdown
+from boss_scripts import PHASE_SCRIPTS, Wait
+from movement_paths import movement_paths
 
 class Nebula:
     def __init__(self):
@@ -41,7 +31,7 @@ class Nebula:
 
         # Create the nebula surface if it doesn't exist or screen size changed
         if self.surface is None or self.surface.get_size() != (screen_width, screen_height * 2):
-            self.surface = pygame.Surface((screen_width, screen_height * 2), pygame.SRCALPHA) # Use SRCALPHA for per-pixel alpha
+            self.surface = create_surface((screen_width, screen_height * 2), alpha=True) # Use SRCALPHA for per-pixel alpha
             self.surface.fill(self.base_color) # Fill with the semi-transparent color
             # Optional: Add more complex drawing here later if needed
 
@@ -50,7 +40,14 @@ class Nebula:
         surface.blit(self.surface, (0, self.y_pos))
 
 class PlayerShip:
-    def __init__(self):
+    # Timers run on the mission's TimerWheel (see timer_wheel.Countdown)
+    shoot_cooldown = Countdown()
+    damage_flash_timer = Countdown()
+    ability_timer = Countdown(on_expire='end_ability')
+    power_up_timer = Countdown(on_expire='end_power_up')
+
+    def __init__(self, timers=None):
+        self.timers = timers
         self.x = DEFAULT_WIDTH // 2 # Start relative to default size
         self.y = DEFAULT_HEIGHT * 2 // 3 # Start relative to default size
         self.speed = PLAYER_SPEED # Use constant
@@ -119,7 +116,7 @@ class PlayerShip:
         if self.has_shield:
             self.has_shield = False # Shield absorbs one hit
             self.active_ability = None # Deactivate shield ability
-            # Add visual/sound effect for shield break here
+            audio.play('shield_break')
             return False
 
         # Then check regular shield health
@@ -127,7 +124,7 @@ class PlayerShip:
             # Shield takes the damage first
             if amount <= self.shield:
                 self.shield -= amount
-                # Add visual/sound effect for shield damage here
+                audio.play('shield_hit')
                 return False
             else:
                 # Damage exceeds shield, shield is depleted
@@ -136,40 +133,28 @@ class PlayerShip:
                 self.shield = 0
                 self.health -= remaining_damage
                 self.damage_flash_timer = 10  # Flash for 10 frames
-                # Add visual/sound effect for shield break here
+                audio.play('shield_break')
                 return self.health <= 0
 
         # No shield, damage goes directly to health
         self.health -= amount
         self.damage_flash_timer = 10  # Flash for 10 frames
-        # Add visual/sound effect for taking damage here
+        audio.play('player_damage')
         
         # Return True if player is killed (health depleted), False otherwise
         return self.health <= 0
         
-    def update(self):
-        # Cooldowns
-        if self.shoot_cooldown > 0:
-            self.shoot_cooldown -= 1
-        if self.damage_flash_timer > 0:
-            self.damage_flash_timer -= 1
-
-        # Ability Timer
-        if self.ability_timer > 0:
-            self.ability_timer -= 1
-            if self.ability_timer <= 0:
-                # Deactivate timed abilities
-                if self.active_ability == ABILITY_RAPID_FIRE:
-                    pass # Effect ends automatically via cooldown check
-                elif self.active_ability == ABILITY_PIERCING:
-                    self.piercing_active = False
-                self.active_ability = None # Clear active ability
+    def end_ability(self):
+        # Deactivate timed abilities when ability_timer runs out
+        if self.active_ability == ABILITY_RAPID_FIRE:
+            pass # Effect ends automatically via cooldown check
+        elif self.active_ability == ABILITY_PIERCING:
+            self.piercing_active = False
+        self.active_ability = None # Clear active ability
 
+    def end_power_up(self):
         # PowerUp compatibility
-        if self.power_up_timer > 0:
-            self.power_up_timer -= 1
-            if self.power_up_timer <= 0:
-                self.power_up_active = False
+        self.power_up_active = False
                 
     def draw(self, surface):
         screen_width = surface.get_width()
@@ -187,13 +172,13 @@ class PlayerShip:
         # Draw ability Shield visual if active
         if self.has_shield:
             shield_radius = max(self.width, self.height) // 2 + 5
-            pygame.draw.circle(surface, (100, 100, 255, 100), (int(self.x), int(self.y)), shield_radius, 2) # Thin blue circle
+            pygame.draw.circle(surface, (100, 100, 255), (int(self.x), int(self.y)), shield_radius, 2) # Thin blue circle (opaque: the frame has no alpha)
             
         # Draw regular shield glow based on shield amount
         if self.shield > 0:
             shield_alpha = min(150, int(100 * (self.shield / self.max_shield)) + 50)  # 50-150 alpha based on shield amount
             shield_radius = max(self.width, self.height) // 2 + 3
-            shield_surface = pygame.Surface((shield_radius*2, shield_radius*2), pygame.SRCALPHA)
+            shield_surface = create_surface((shield_radius*2, shield_radius*2), alpha=True)
             pygame.draw.circle(shield_surface, (0, 150, 255, shield_alpha), (shield_radius, shield_radius), shield_radius)
             surface.blit(shield_surface, (int(self.x - shield_radius), int(self.y - shield_radius)))
 
@@ -219,24 +204,23 @@ class PlayerShip:
             
         # Draw labels for the bars
         font_size = int(14 * scale)
-        font = load_font(font_size)
-        health_label = font.render("HULL", True, GREEN)
-        shield_label = font.render("SHIELD", True, BLUE)
+        health_label = render_text(font_size, "HULL", GREEN)
+        shield_label = render_text(font_size, "SHIELD", BLUE)
         
         # Position labels to the right of the bars
         label_x = health_bar_x + bar_max_width + int(5 * scale)
         health_label_y = health_bar_y
         shield_label_y = shield_bar_y
         
-        surface.blit(health_label, (label_x, health_label_y))
-        surface.blit(shield_label, (label_x, shield_label_y))
+        # Blitted in software: ships drawn after the player cover the labels along with the bars
+        surface.blits([(health_label, (label_x, health_label_y)), (shield_label, (label_x, shield_label_y))], doreturn=False)
 
     def draw_damage_flash(self, surface):
         if self.damage_flash_timer > 0:
             # Use current surface dimensions
             screen_width = surface.get_width()
             screen_height = surface.get_height()
-            flash_surface = pygame.Surface((screen_width, screen_height))
+            flash_surface = create_surface((screen_width, screen_height))
             flash_surface.fill(RED)
             flash_surface.set_alpha(100)  # Semi-transparent
             surface.blit(flash_surface, (0, 0))
@@ -281,20 +265,25 @@ class Laser:
         
         # Add a small glow effect if this is a piercing laser
         if self.piercing:
-            pygame.draw.circle(surface, (100, 100, 255, 150), (int(self.x), int(self.y)), 3)
+            pygame.draw.circle(surface, (100, 100, 255), (int(self.x), int(self.y)), 3)
         
     def is_off_screen(self, screen_height):
         # Only need to check top boundary for player lasers
         return self.y < 0
 
 class Enemy:
-    def __init__(self, x, y, enemy_type):
+    shoot_cooldown = Countdown()
+
+    def __init__(self, x, y, enemy_type, timers=None):
+        self.timers = timers
         self.x = x
         self.y = y
         self.type = enemy_type
         self.health = self.get_health()
         self.max_health = self.health
         self.speed = self.get_speed()
+        self.path = ENEMY_PATHS.get(enemy_type)  # Movement path on top of the descent (movement_paths.py)
+        self.path_phase = 0
         self.shoot_cooldown = 0
         self.width = int(self.get_width() * 1.2)  # Increased size by 20%
         self.height = int(self.get_height() * 1.2)  # Increased size by 20%
@@ -397,7 +386,7 @@ class Enemy:
                          abilities.get_width(), description.get_width()) + 20
         panel_height = name.get_height() * 5 + 30
         
-        panel = pygame.Surface((panel_width, panel_height))
+        panel = create_surface((panel_width, panel_height))
         panel.fill((0, 0, 0, 200))
         panel.set_alpha(200)
         
@@ -413,11 +402,20 @@ class Enemy:
         panel.blit(description, (10, y_offset))
         
         return panel
+
+    def __getstate__(self):
+        # Surfaces cannot be pickled (checkpoints.py); the panel is redrawn on restore
+        state = self.__dict__.copy()
+        del state['info_panel']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.info_panel = self.create_info_panel()
             
     def update(self):
+        # The path (e.g. the Swarmer's erratic wobble) is applied by movement_paths.advance_paths
         self.y += self.speed
-        if self.type == "Swarmer":
-            self.x += math.sin(self.y * 0.1) * 2  # Erratic movement
             
     def take_damage(self, amount):
         """Reduce enemy health by the given amount"""
@@ -500,11 +498,11 @@ class Enemy:
                 self.shoot_cooldown = 180
                  # Pass angle (90) and type ("spore") correctly
                 return [EnemyProjectile(self.x, self.y, shoot_angle, "spore")]
-        self.shoot_cooldown -= 1
         return []
 
 class EnemyProjectile:
-    def __init__(self, x, y, angle, projectile_type, damage=None, speed=None, width=None, height=None, health=None):
+    def __init__(self, x, y, angle, projectile_type, damage=None, speed=None, width=None, height=None, health=None,
+                 velocity=None):
         self.x = x
         self.y = y
         self.type = projectile_type
@@ -516,6 +514,13 @@ class EnemyProjectile:
         self.height = int(height if height is not None else self.get_height() * 1.25)  # Increased size by 25%
         self.health = health if health is not None else self.get_health()
         self.max_health = self.health
+        # Per-frame movement; bullet patterns pass it in from their precomputed tables
+        if velocity is None:
+            angle_rad = math.radians(angle)
+            velocity = (math.cos(angle_rad) * self.speed, math.sin(angle_rad) * self.speed)  # Pygame: +y is down
+        self.vx, self.vy = velocity
+        self.path = PROJECTILE_PATHS.get(projectile_type)  # e.g. the spore's arc, applied by movement_paths.advance_paths
+        self.path_phase = 0
         self.show_health_bar = False
         self.health_bar_width = 20
         self.health_bar_height = 3
@@ -581,21 +586,16 @@ class EnemyProjectile:
             return 5
             
     def update(self):
-        # Calculate movement based on angle
-        angle_rad = math.radians(self.angle)
-        dx = math.cos(angle_rad) * self.speed  # Standard calculation for X
-        dy = math.sin(angle_rad) * self.speed  # Standard calculation for Y (Pygame: +y is down)
-        
-        self.x += dx
-        self.y += dy
-        
-        # Special movement for spore type
-        if self.type == "spore":
-            self.x += math.sin(self.y * 0.1) * 2  # Additional arc movement
+        self.x += self.vx
+        self.y += self.vy
             
     def take_damage(self, amount):
         self.health -= amount
         return self.health <= 0
+
+    def stop(self):
+        self.speed = 0
+        self.vx = self.vy = 0
             
     def draw(self, surface):
         if self.type == "small":
@@ -608,6 +608,8 @@ class EnemyProjectile:
             pygame.draw.circle(surface, GREEN, (int(self.x), int(self.y)), self.width//2)
         elif self.type == "bullet":
             pygame.draw.circle(surface, ORANGE, (int(self.x), int(self.y)), self.width//2)
+        elif self.type == "mine":
+            pygame.draw.circle(surface, RED, (int(self.x), int(self.y)), self.width//2)
             
         # Draw health bar if active
         if self.show_health_bar:
@@ -643,7 +645,20 @@ class PowerUp:
         ])
 
 class BossEnemy:
-    def __init__(self, screen_width):
+    # Timers run on the mission's TimerWheel (see timer_wheel.Countdown)
+    shoot_cooldown_laser = Countdown()
+    shoot_cooldown_plasma = Countdown()
+    shoot_cooldown_spread = Countdown()
+    shoot_cooldown_beam = Countdown()
+    shoot_cooldown_mines = Countdown()
+    phase_transition_time = Countdown()
+    flash_timer = Countdown()
+    script_wait = Countdown()
+    beam_charge_time = Countdown(on_expire='fire_beam')
+    beam_duration = Countdown(on_expire='end_beam')
+
+    def __init__(self, screen_width, timers=None):
+        self.timers = timers
         self.x = screen_width // 2
         self.y = -BOSS_HEIGHT # Start off-screen top
         self.width = BOSS_WIDTH
@@ -674,6 +689,54 @@ class BossEnemy:
         # Mine deployment state
         self.mines = []
 
+        # Behavior script of the current phase (see boss_scripts.py)
+        self.start_script()
+
+    def __getstate__(self):
+        # Generators cannot be pickled (checkpoints.py); the phase script starts over on restore
+        state = self.__dict__.copy()
+        del state['script']
+        del state['move']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.start_script()
+
+    def start_script(self):
+        self.script = PHASE_SCRIPTS[self.attack_phase](self)
+        self.move = None
+        self.move_frames = 0  # Frames left of the current Move
+        self.script_wait = 0
+
+    def run_script(self):
+        """Do one frame of the current Move, resuming the script only once its last command is done"""
+        if self.move_frames > 0 and self.move.until is not None and self.move.until():
+            self.move_frames = 0
+        while self.move_frames <= 0:
+            if self.script_wait > 0:
+                return
+            command = next(self.script, None)
+            if command is None:
+                return # The script has finished; hold position
+            if isinstance(command, Wait):
+                self.script_wait = command.frames
+            else:
+                self.move = command
+                self.move_frames = command.frames
+
+        self.move_frames -= 1
+        self.x += (self.speed * self.move.speed) * self.direction
+        if self.x <= self.width // 2 or self.x >= self.screen_width - self.width // 2:
+            self.direction *= -1 # Reverse direction at edges
+        if self.move.path:
+            dx, dy = movement_paths[self.move.path].step(self.phase_timer)
+            self.x += dx
+            self.y += dy
+
+    def dash(self, distance):
+        self.x += self.direction * distance  # Quick dash
+
     def update(self):
         # Entry sequence
         if not self.entry_complete:
@@ -681,74 +744,21 @@ class BossEnemy:
             if self.y >= self.height // 2:
                 self.y = self.height // 2
                 self.entry_complete = True
+                # Cooldowns are only armed by shoot(), which waits for the entry; a phase change
+                # during the entry gets its whole transition from here
+                if self.phase_transition_time > 0:
+                    self.phase_transition_time = 60
             return # Don't move sideways or shoot during entry
         
-        # Update phase transition timer
+        # Don't move or attack during a phase transition
         if self.phase_transition_time > 0:
-            self.phase_transition_time -= 1
-            # Don't move or attack during transition
             return
             
         # Update phase timer (used for movement patterns)
         self.phase_timer += 1
             
-        # Movement behavior changes based on phase
-        if self.attack_phase == 1:
-            # Phase 1: Simple left-right movement
-            self.x += self.speed * self.direction
-            if self.x <= self.width // 2 or self.x >= self.screen_width - self.width // 2:
-                self.direction *= -1 # Reverse direction at edges
-        elif self.attack_phase == 2:
-            # Phase 2: Faster movement with slight vertical oscillation
-            self.x += (self.speed * 1.5) * self.direction
-            if self.x <= self.width // 2 or self.x >= self.screen_width - self.width // 2:
-                self.direction *= -1
-            # Small vertical movement
-            self.y += math.sin(self.phase_timer * 0.05) * 0.5
-        elif self.attack_phase == 3:
-            # Phase 3: More aggressive movement pattern
-            self.x += (self.speed * 1.8) * self.direction
-            if self.x <= self.width // 2 or self.x >= self.screen_width - self.width // 2:
-                self.direction *= -1
-            # More pronounced vertical movement
-            self.y += math.sin(self.phase_timer * 0.08) * 0.8
-            # Occasional quick dashes
-            if self.phase_timer % 120 == 0:  # Every 2 seconds
-                self.x += self.direction * 20  # Quick dash
-        elif self.attack_phase == 4:
-            # Phase 4: Erratic movement with beam attack preparation
-            self.x += (self.speed * 1.5) * self.direction
-            if self.x <= self.width // 2 or self.x >= self.screen_width - self.width // 2:
-                self.direction *= -1
-            
-            # More complex vertical movement
-            vertical_offset = (
-                math.sin(self.phase_timer * 0.05) * 1.0 + 
-                math.sin(self.phase_timer * 0.1) * 0.5
-            )
-            self.y += vertical_offset
-            
-            # During beam charging, slow down movement
-            if self.beam_charge_time > 0:
-                self.x -= self.direction * (self.speed * 0.5)  # Slow down and stabilize
-        elif self.attack_phase == 5:
-            # Phase 5: Desperate final phase with frantic movement
-            # Faster, more erratic movement
-            self.x += (self.speed * 2.5) * self.direction
-            if self.x <= self.width // 2 or self.x >= self.screen_width - self.width // 2:
-                self.direction *= -1
-            
-            # Chaotic movement pattern
-            vertical_movement = (
-                math.sin(self.phase_timer * 0.1) * 1.2 + 
-                math.sin(self.phase_timer * 0.2) * 0.8 +
-                math.cos(self.phase_timer * 0.15) * 0.5
-            )
-            self.y += vertical_movement
-            
-            # Random direction changes
-            if random.random() < 0.01:  # 1% chance per frame
-                self.direction *= -1
+        # Movement comes from the phase's behavior script
+        self.run_script()
             
         # Clamp position to screen bounds
         self.x = max(self.width // 2, min(self.screen_width - self.width // 2, self.x))
@@ -757,174 +767,55 @@ class BossEnemy:
         min_y = self.height // 2        # Minimum height
         self.y = max(min_y, min(max_y, self.y))
 
-        # Update cooldowns
-        if self.shoot_cooldown_laser > 0:
-            self.shoot_cooldown_laser -= 1
-        if self.shoot_cooldown_plasma > 0:
-            self.shoot_cooldown_plasma -= 1
-        if self.shoot_cooldown_spread > 0:
-            self.shoot_cooldown_spread -= 1
-        if self.shoot_cooldown_beam > 0:
-            self.shoot_cooldown_beam -= 1
-        if self.shoot_cooldown_mines > 0:
-            self.shoot_cooldown_mines -= 1
-            
-        # Beam attack state management
-        if self.beam_charge_time > 0:
-            self.beam_charge_time -= 1
-            if self.beam_charge_time <= 0:
-                self.beam_active = True
-                self.beam_duration = 90  # Beam lasts for 1.5 seconds
-        
-        if self.beam_duration > 0:
-            self.beam_duration -= 1
-            if self.beam_duration <= 0:
-                self.beam_active = False
-                
-        # Update damage flash
-        if self.flash_timer > 0:
-            self.flash_timer -= 1
+    # Beam attack state management, called by the timer wheel
+    def fire_beam(self):
+        self.beam_active = True
+        self.beam_duration = 90  # Beam lasts for 1.5 seconds
 
-    def shoot(self):
-        # Don't shoot during phase transitions
-        if self.phase_transition_time > 0:
-            return []
-            
-        projectiles = []
-        
-        # Phase 1: Basic laser attacks
-        if self.attack_phase >= 1:
-            # Laser attack
-            if self.shoot_cooldown_laser <= 0:
-                cooldown_multiplier = 1.0
-                if self.attack_phase >= 3:
-                    cooldown_multiplier = 0.8  # Faster in later phases
-                
-                self.shoot_cooldown_laser = int(BOSS_SHOOT_COOLDOWN_LASER * cooldown_multiplier)
-                
-                # Basic laser pattern
-                if self.attack_phase == 1:
-                    # Simple 3-way laser spread
-                    for offset in [-self.width//4, 0, self.width//4]:
-                        projectiles.append(EnemyProjectile(
-                            self.x + offset, 
-                            self.y + self.height//2, 
-                            90, 
-                            "laser",
-                            damage=1,
-                            speed=7
-                        ))
-                else:
-                    # Enhanced laser pattern for higher phases
-                    num_lasers = 3 + self.attack_phase  # More lasers in higher phases
-                    spread = 40 + (self.attack_phase * 10)  # Wider spread in higher phases
-                    
-                    for i in range(num_lasers):
-                        angle = 90 - spread/2 + (spread / (num_lasers-1)) * i
-                        projectiles.append(EnemyProjectile(
-                            self.x, 
-                            self.y + self.height//2, 
-                            angle, 
-                            "laser",
-                            damage=1,
-                            speed=7
-                        ))
+    def end_beam(self):
+        self.beam_active = False
 
-        # Phase 2+: Add plasma attacks
-        if self.attack_phase >= 2:
-            # Plasma attack
-            if self.shoot_cooldown_plasma <= 0:
-                cooldown_multiplier = 1.0
-                if self.attack_phase >= 4:
-                    cooldown_multiplier = 0.7  # Faster in last phases
-                
-                self.shoot_cooldown_plasma = int(BOSS_SHOOT_COOLDOWN_PLASMA * cooldown_multiplier)
-                
-                # Basic plasma shot
-                projectiles.append(EnemyProjectile(
-                    self.x, 
-                    self.y + self.height//2, 
-                    90, 
-                    "plasma",
-                    damage=2,
-                    speed=4,
-                    width=15,
-                    height=15,
-                    health=2 + self.attack_phase  # Stronger in higher phases
-                ))
-                
-                # Add side shots in later phases
-                if self.attack_phase >= 3:
-                    for offset in [-self.width//3, self.width//3]:
-                        projectiles.append(EnemyProjectile(
-                            self.x + offset, 
-                            self.y + self.height//3, 
-                            90, 
-                            "plasma",
-                            damage=2,
-                            speed=4,
-                            width=15,
-                            height=15,
-                            health=2
-                        ))
+    def hold_attacks(self, frames):
+        """Push back running cooldowns and the beam: attacks stand still during a phase transition"""
+        for name in ('shoot_cooldown_laser', 'shoot_cooldown_plasma', 'shoot_cooldown_spread',
+                     'shoot_cooldown_beam', 'shoot_cooldown_mines', 'beam_charge_time', 'beam_duration'):
+            remaining = getattr(self, name)
+            if remaining > 0:
+                setattr(self, name, remaining + frames)
 
-        # Phase 3+: Add spread attack
-        if self.attack_phase >= 3:
-            if self.shoot_cooldown_spread <= 0:
-                self.shoot_cooldown_spread = BOSS_SHOOT_COOLDOWN_SPREAD
-                
-                # Create a spread of small projectiles
-                num_projectiles = 6 + (self.attack_phase - 3) * 2  # More projectiles in higher phases
-                for i in range(num_projectiles):
-                    angle = (i / num_projectiles) * 180  # Spread in semicircle down
-                    rad_angle = math.radians(angle)
-                    offset_x = math.cos(rad_angle) * 30
-                    projectile = EnemyProjectile(
-                        self.x + offset_x, 
-                        self.y + self.height//2, 
-                        angle - 90, 
-                        "small",
-                        damage=1,
-                        speed=5
-                    )
-                    projectiles.append(projectile)
+    def shoot(self):
+        """Return the volleys due this frame as (pattern name, x, y) and start the beam charge when due.
 
-        # Phase 4+: Add death beam attack
-        if self.attack_phase >= 4:
-            if self.shoot_cooldown_beam <= 0 and not self.beam_active and self.beam_charge_time <= 0:
-                self.shoot_cooldown_beam = BOSS_SHOOT_COOLDOWN_BEAM
-                # Start charging the beam
-                self.beam_charge_time = 60  # 1 second charge time
-                # Pick a target point (to be used when the beam activates)
-                self.beam_target_x = random.randint(
-                    int(self.width), 
-                    int(self.screen_width - self.width)
-                )
+        The attacks of each phase and their cooldowns are listed in BOSS_PHASE_ATTACKS;
+        PlayingScreen fires the patterns (see bullet_patterns.py).
+        """
+        # Don't shoot during entry or phase transitions
+        if not self.entry_complete or self.phase_transition_time > 0:
+            return []
 
-        # Phase 5: Add mine deployment
-        if self.attack_phase >= 5:
-            if self.shoot_cooldown_mines <= 0:
-                self.shoot_cooldown_mines = BOSS_SHOOT_COOLDOWN_MINES
-                
-                # Deploy mines in a pattern
-                num_mines = 3
-                spacing = self.screen_width // (num_mines + 1)
-                
-                for i in range(num_mines):
-                    x_pos = spacing * (i + 1)
-                    projectiles.append(EnemyProjectile(
-                        x_pos, 
-                        self.y + self.height//2, 
-                        90, 
-                        "mine",
-                        damage=3,
-                        speed=2,
-                        width=20,
-                        height=20,
-                        health=5
-                    ))
+        volleys = []
+        for attack, pattern, cooldown in BOSS_PHASE_ATTACKS[self.attack_phase]:
+            cooldown_name = 'shoot_cooldown_' + attack
+            if getattr(self, cooldown_name) > 0:
+                continue
+            if pattern is None:
+                # Death beam: charge first, the timer wheel fires it
+                if self.beam_active or self.beam_charge_time > 0:
+                    continue
+                self.start_beam_charge()
+            else:
+                volleys.append((pattern, self.x, self.y + self.height//2))
+            setattr(self, cooldown_name, cooldown)
+        return volleys
 
-        return projectiles
+    def start_beam_charge(self):
+        self.beam_charge_time = 60  # 1 second charge time
+        audio.play('beam_charge')
+        # Pick a target point (to be used when the beam activates)
+        self.beam_target_x = random.randint(
+            int(self.width), 
+            int(self.screen_width - self.width)
+        )
 
     def take_damage(self, amount):
         old_health_percentage = self.health / self.max_health
@@ -943,7 +834,11 @@ class BossEnemy:
             if old_health_percentage > threshold and new_health_percentage <= threshold:
                 # Transition to the new phase (add one because phases are 1-indexed)
                 self.attack_phase = i + 2  # Skip to this phase
+                # Attacks stay held for the whole transition, including one that restarts a running one
+                self.hold_attacks(60 - self.phase_transition_time)
                 self.phase_transition_time = 60  # 1 second transition time
+                self.start_script()
+                audio.play('phase_transition')
                 break
 
     def draw(self, surface):
@@ -1079,7 +974,7 @@ class BossEnemy:
             if self.beam_active and self.beam_duration > 0:
                 # Draw the actual beam
                 beam_color = (255, 50, 0, 150)  # Semi-transparent red
-                beam_surface = pygame.Surface((10, 1000), pygame.SRCALPHA)
+                beam_surface = create_surface((10, 1000), alpha=True)
                 pygame.draw.rect(beam_surface, beam_color, (0, 0, 10, 1000))
                 
                 # Rotate beam to point at target
@@ -1154,7 +1049,7 @@ class BossEnemy:
         return self.health <= 0 
 
 class Explosion:
-    def __init__(self, x, y, size, duration=30, color=None):
+    def __init__(self, x, y, size, duration=30, color=None, detail=1.0, priority=EFFECT_PRIORITY_KILL):
         self.x = x
         self.y = y
         self.size = size
@@ -1162,10 +1057,12 @@ class Explosion:
         self.current_frame = 0
         self.max_frames = duration
         self.color = color or (255, 165, 0)  # Default orange if no color provided
+        self.priority = priority  # Lower priorities are evicted first when over budget
         self.particles = []
+        self.sprites = {}  # (radius, color) -> circle sprite, kept while the explosion lasts
         
-        # Create explosion particles
-        num_particles = int(size / 2)
+        # Create explosion particles (fewer at reduced detail)
+        num_particles = int(size / 2 * detail)
         for _ in range(num_particles):
             angle = random.uniform(0, math.pi * 2)
             speed = random.uniform(1, 3)
@@ -1200,41 +1097,32 @@ class Explosion:
         size_factor = 1 - progress * 0.5  # Explosion grows a bit then shrinks
         
         # Draw each particle
+        sprites = []
         for particle in self.particles:
             particle_x = int(self.x + particle['x'] * progress * self.size / 2)
             particle_y = int(self.y + particle['y'] * progress * self.size / 2)
             particle_size = int(particle['size'] * size_factor * (self.size / 10))
             
-            # Create a surface with per-pixel alpha for the particle
             if particle_size > 0:
-                particle_surface = pygame.Surface((particle_size * 2, particle_size * 2), pygame.SRCALPHA)
-                color_with_alpha = particle['color'] + (alpha,)
-                pygame.draw.circle(
-                    particle_surface, 
-                    color_with_alpha, 
-                    (particle_size, particle_size), 
-                    particle_size
-                )
-                surface.blit(
-                    particle_surface, 
-                    (particle_x - particle_size, particle_y - particle_size)
-                )
+                sprites.append((self.get_sprite(particle_size, particle['color'], alpha),
+                                (particle_x - particle_size, particle_y - particle_size)))
         
         # Draw central glow
         center_size = int(self.size * (1.0 - progress * 0.8))
         if center_size > 0:
-            glow_surface = pygame.Surface((center_size * 2, center_size * 2), pygame.SRCALPHA)
-            center_color = self.color + (alpha,)
-            pygame.draw.circle(
-                glow_surface, 
-                center_color, 
-                (center_size, center_size), 
-                center_size
-            )
-            surface.blit(
-                glow_surface,
-                (int(self.x - center_size), int(self.y - center_size))
-            )
+            sprites.append((self.get_sprite(center_size, self.color, alpha),
+                            (int(self.x - center_size), int(self.y - center_size))))
+        blit_cached(surface, sprites)
+
+    def get_sprite(self, radius, color, alpha):
+        """Solid circle sprite faded to this frame's alpha"""
+        sprite = self.sprites.get((radius, color))
+        if sprite is None:
+            sprite = create_surface((radius * 2, radius * 2), alpha=True)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self.sprites[(radius, color)] = sprite
+        sprite.set_alpha(alpha)
+        return sprite
             
     def is_finished(self):
         return self.current_frame >= self.max_frames 
\ No newline at end of file
@@ -1,6 +1,9 @@
 import pygame
 import pygame_gui
 from constants import *
+from utils import create_surface
+from render_backend import blit_cached
+from checkpoints import CHECKPOINT_LEVEL_START, CHECKPOINT_BOSS_PHASE
 
 class GameOverScreen:
     def __init__(self, screen, manager):
@@ -14,6 +17,9 @@ class GameOverScreen:
         self.score_rect = None
         self.hint_text = None
         self.hint_rect = None
+        self.hint_font = None
+        self.phase_hint_text = None
+        self.phase_hint_phase = None  # Boss phase phase_hint_text was rendered for
         self.overlay = None
         self.is_visible = False
         self.setup_ui()
@@ -72,12 +78,13 @@ class GameOverScreen:
 
         # Hint text
         hint_font_size = int(24 * scale)
-        hint_font = load_font(hint_font_size)
-        self.hint_text = hint_font.render("Press R to restart", True, WHITE)
+        self.hint_font = load_font(hint_font_size)
+        self.hint_text = self.hint_font.render("Press R to restart", True, WHITE)
+        self.phase_hint_text = None
         self.hint_rect = self.hint_text.get_rect(center=(center_x, self.menu_button.relative_rect.bottom + int(50 * scale)))
 
         # Create overlay
-        self.overlay = pygame.Surface((screen_width, screen_height))
+        self.overlay = create_surface((screen_width, screen_height))
         self.overlay.fill(BLACK)
         self.overlay.set_alpha(128)  # Semi-transparent
 
@@ -101,16 +108,18 @@ class GameOverScreen:
             self.menu_button.hide()
         self.is_visible = False
         
+    def draw_overlay(self, surface):
+        # Draw semi-transparent overlay (baked into the frozen background by the main loop)
+        if self.overlay:
+            surface.blit(self.overlay, (0, 0))
+        
     def draw(self, surface, game_state):
         if not self.is_visible:
             return
-        # Draw semi-transparent overlay
-        if self.overlay:
-            surface.blit(self.overlay, (0, 0))
         
         # Draw "GAME OVER" text
         if self.game_over_text:
-            surface.blit(self.game_over_text, self.game_over_rect)
+            blit_cached(surface, [(self.game_over_text, self.game_over_rect)])
         
         # Update and draw score
         self.score_text = self.score_font.render(f"Final Score: {game_state.score}", True, WHITE)
@@ -119,19 +128,39 @@ class GameOverScreen:
         
         # Draw restart hint
         if self.hint_text:
-            surface.blit(self.hint_text, self.hint_rect)
+            blit_cached(surface, [(self.hint_text, self.hint_rect)])
+
+        # Offer the boss phase checkpoint when there is one
+        if game_state.checkpoint_phase and self.hint_font:
+            if self.phase_hint_text is None or self.phase_hint_phase != game_state.checkpoint_phase:
+                self.phase_hint_text = self.hint_font.render(
+                    f"Press B to retry from boss phase {game_state.checkpoint_phase}", True, WHITE)
+                self.phase_hint_phase = game_state.checkpoint_phase
+            phase_hint_rect = self.phase_hint_text.get_rect(
+                midtop=(self.hint_rect.centerx, self.hint_rect.bottom + self.hint_rect.height // 2))
+            blit_cached(surface, [(self.phase_hint_text, phase_hint_rect)])
         
     def handle_event(self, event, game_state):
         if not self.is_visible:
             return True
         if event.type == pygame_gui.UI_BUTTON_PRESSED:
             if event.ui_element == self.play_again_button:
-                game_state.reset_for_retry()
-                game_state.change_state(STATE_PLAYING)
+                self.retry(game_state)
             elif event.ui_element == self.menu_button:
-                game_state.change_state(STATE_TITLE)
+                self.return_to_title(game_state)
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_r:
-                game_state.reset_for_retry()
-                game_state.change_state(STATE_PLAYING)
-        return True 
\ No newline at end of file
+                self.retry(game_state)
+            elif event.key == pygame.K_b and game_state.checkpoint_phase:
+                self.retry(game_state, from_boss_phase=True)
+        return True
+
+    def retry(self, game_state, from_boss_phase=False):
+        """Restart the current level, or the boss fight from the last phase reached"""
+        game_state.reset_for_retry()
+        game_state.retry_from = CHECKPOINT_BOSS_PHASE if from_boss_phase else CHECKPOINT_LEVEL_START
+        game_state.change_state(STATE_PLAYING) 
+
+    def return_to_title(self, game_state):
+        """Give up on the level and go back to the title screen"""
+        game_state.change_state(STATE_TITLE)
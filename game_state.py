@@ -14,6 +14,8 @@ class GameState:
         self.ability_kill_counter = 0 # Counter for ability screen trigger
         self.boss_defeated = False  # Track if the final boss has been defeated
         self.game = None  # Reference to main game instance, set after initialization
+        self.retry_from = None  # Checkpoint PlayingScreen.reset restores instead of rebuilding the level
+        self.checkpoint_phase = None  # Boss phase a retry can start from, if any
         
     def change_state(self, new_state):
         # Store previous state before changing
@@ -113,12 +115,15 @@ class GameState:
             
     def get_max_enemies(self):
         # Return the maximum number of enemies that can be on the screen at once
-        # This can be adjusted based on the current level difficulty
-        if self.is_boss_level():
+        return self.get_max_enemies_for_level(self.current_level)
+
+    def get_max_enemies_for_level(self, level):
+        # This can be adjusted based on the level difficulty (spawn_tables.py compiles it per level)
+        if level == 5:
             return 1  # Only the boss should be present
         else:
             # Base number of max enemies, can be adjusted by level
             base_max = 5
             # Increase max enemies for higher levels
-            level_bonus = min(3, self.current_level - 1)  # Up to +3 enemies for higher levels
+            level_bonus = min(3, level - 1)  # Up to +3 enemies for higher levels
             return base_max + level_bonus
@@ -0,0 +1,55 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from utils import get_display_templates
+
+class LevelPreloader:
+    """Prepares a level's heavy assets on a worker thread before they are needed.
+
+    Requests are keyed by (level, width, height). PlayingScreen.reset takes the
+    prepared result, waiting for it if the worker is still busy, and falls back
+    to building synchronously when nothing was requested. The display's
+    surface formats are looked up here, on the main thread, and handed to
+    the build with the seed.
+    """
+
+    def __init__(self, build_fn):
+        self.build_fn = build_fn  # build_fn(level, width, height, seed, templates) -> dict of assets
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-preload")
+        self.pending = {}  # (level, width, height) -> Future
+
+    def request(self, level, width, height):
+        """Start preparing a level unless it is already prepared or in progress"""
+        key = (level, width, height)
+        if key in self.pending:
+            return
+
+        # Drop work prepared for a different screen size
+        for old_key in list(self.pending):
+            if old_key[1:] != key[1:]:
+                self.pending.pop(old_key).cancel()
+
+        # Draw the seed and take the display formats here so the worker never touches the
+        # shared random state or converts surfaces
+        seed = random.getrandbits(32)
+        self.pending[key] = self.executor.submit(self.build_fn, level, width, height, seed, get_display_templates())
+
+    def is_ready(self, level, width, height):
+        future = self.pending.get((level, width, height))
+        return future is not None and future.done()
+
+    def take(self, level, width, height):
+        """Return the prepared assets for a level, building them now if they were never requested"""
+        future = self.pending.pop((level, width, height), None)
+        if future is None:
+            return self.build_fn(level, width, height, random.getrandbits(32), get_display_templates())
+        return future.result()
+
+    def clear(self):
+        """Forget every request, prepared or not"""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending = {}
+
+    def shutdown(self):
+        self.clear()
+        self.executor.shutdown(wait=False)
@@ -1,8 +1,10 @@
 import pygame
 import pygame_gui
-import random
 import math
 from constants import *
+from starfield import Starfield
+from utils import build_scaled_frames, pick_scaled_frame, get_glow_sprite
+from render_backend import blit_cached
 
 class LevelSelect:
     def __init__(self, screen, manager):
@@ -12,6 +14,7 @@ class LevelSelect:
         self.back_button = None
         self.title_text = None
         self.title_rect = None
+        self.title_frames = []
         self.is_visible = False
         
         # Animation properties
@@ -21,7 +24,7 @@ class LevelSelect:
         self.title_min_scale = 0.95
         
         # Background stars
-        self.stars = []
+        self.stars = None
         self.setup_stars()
         
         self.setup_ui()
@@ -29,25 +32,10 @@ class LevelSelect:
         
     def setup_stars(self):
         """Setup animated background stars"""
-        self.stars = []
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
-        
-        for _ in range(40):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            size = random.uniform(0.5, 3)
-            speed = random.uniform(0.2, 1.0)
-            pulse_speed = random.uniform(0.02, 0.05)
-            self.stars.append({
-                'x': x,
-                'y': y,
-                'size': size,
-                'base_size': size,
-                'speed': speed,
-                'pulse': random.uniform(0, 2 * math.pi),
-                'pulse_speed': pulse_speed
-            })
+        self.stars = Starfield(screen_width, screen_height, 40, speed_range=(0.2, 1.0), size_range=(0.5, 3),
+                               direction=-1, pulse=True)
         
     def setup_ui(self):
         screen_width = self.screen.get_width()
@@ -69,6 +57,8 @@ class LevelSelect:
         font = load_font(title_font_size)
         self.title_text = font.render("SELECT MISSION", True, WHITE)
         self.title_rect = self.title_text.get_rect(centerx=screen_width//2, y=int(50 * scale))
+        self.title_frames = build_scaled_frames(self.title_text, self.title_min_scale, self.title_max_scale,
+                                                TITLE_PULSE_FRAMES)
 
         # Calculate scaled dimensions
         button_size = int(LEVEL_BUTTON_SIZE * scale)
@@ -140,24 +130,8 @@ class LevelSelect:
             self.title_scale = self.title_min_scale
             self.title_direction = abs(self.title_direction)
             
-        # Animate background stars
-        screen_width = self.screen.get_width()
-        screen_height = self.screen.get_height()
-        
-        for star in self.stars:
-            # Move stars slowly upward
-            star['y'] -= star['speed']
-            if star['y'] < 0:
-                star['y'] = screen_height
-                star['x'] = random.randint(0, screen_width)
-                
-            # Make stars pulse
-            star['pulse'] += star['pulse_speed']
-            if star['pulse'] > 2 * math.pi:
-                star['pulse'] -= 2 * math.pi
-                
-            # Calculate current size based on pulse
-            star['size'] = star['base_size'] * (1 + 0.3 * math.sin(star['pulse']))
+        # Animate background stars (drift upward and pulse)
+        self.stars.update()
         
     def show(self):
         for button in self.level_buttons:
@@ -178,24 +152,17 @@ class LevelSelect:
             return
             
         # Draw animated background stars
-        for star in self.stars:
-            pygame.draw.circle(
-                surface, 
-                WHITE, 
-                (int(star['x']), int(star['y'])), 
-                star['size']
-            )
+        self.stars.draw(surface)
         
         # Draw animated title
-        if self.title_text:
-            # Create scaled version of the title
-            scaled_width = int(self.title_text.get_width() * self.title_scale)
-            scaled_height = int(self.title_text.get_height() * self.title_scale)
-            scaled_title = pygame.transform.scale(self.title_text, (scaled_width, scaled_height))
+        if self.title_frames:
+            # Pick the pre-scaled frame nearest to the current scale
+            scaled_title = pick_scaled_frame(self.title_frames, self.title_scale,
+                                             self.title_min_scale, self.title_max_scale)
             
             # Update the rect to center the scaled title
             scaled_rect = scaled_title.get_rect(center=self.title_rect.center)
-            surface.blit(scaled_title, scaled_rect)
+            blit_cached(surface, [(scaled_title, scaled_rect)], background=True)
         
         # Draw level availability indicators
         screen_width = surface.get_width()
@@ -219,16 +186,12 @@ class LevelSelect:
                 # Create a pulsing glow effect
                 pulse_value = 0.5 + 0.5 * math.sin(pygame.time.get_ticks() * 0.003)
                 glow_radius = int(indicator_radius * 1.5 * pulse_value) + indicator_radius
-                glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
                 
-                # Draw the glow as a gradient circle
-                for r in range(glow_radius, 0, -1):
-                    alpha = max(0, int(100 * (1 - r / glow_radius)))
-                    pygame.draw.circle(glow_surface, (*indicator_color, alpha), 
-                                     (glow_radius, glow_radius), r)
-                                     
+                # The gradient circle comes from a cache keyed by radius
+                glow_surface = get_glow_sprite(glow_radius, indicator_color)
                 glow_rect = glow_surface.get_rect(center=(indicator_x, indicator_y))
-                surface.blit(glow_surface, glow_rect)
+                # Under the indicator, which is drawn in software
+                blit_cached(surface, [(glow_surface, glow_rect)], background=True)
             
             # Draw a solid indicator in all cases
             pygame.draw.circle(surface, indicator_color, (indicator_x, indicator_y), indicator_radius)
@@ -236,23 +199,39 @@ class LevelSelect:
     def handle_event(self, event, game_state):
         if not self.is_visible:
             return True
-        if event.type == pygame_gui.UI_BUTTON_PRESSED:
+        if event.type == pygame_gui.UI_BUTTON_ON_HOVERED:
+            # Start preparing a mission as soon as the player hovers it
+            for i, button in enumerate(self.level_buttons):
+                if event.ui_element == button and game_state.is_level_available(i + 1):
+                    self.preload_level(game_state, i + 1)
+                    break
+        elif event.type == pygame_gui.UI_BUTTON_PRESSED:
             if event.ui_element == self.back_button:
-                # Use transition when returning to title
+                # Cross-fade back to the title
                 if hasattr(game_state.game, 'change_state_with_transition'):
-                    game_state.game.change_state_with_transition(STATE_TITLE)
+                    game_state.game.change_state_with_transition(STATE_TITLE, "crossfade")
                 else:
                     game_state.change_state(STATE_TITLE)
             else:
                 for i, button in enumerate(self.level_buttons):
                     if event.ui_element == button:
-                        level_num = i + 1
-                        if game_state.is_level_available(level_num):
-                            game_state.set_current_level(level_num)
-                            # Use transition when starting a level
-                            if hasattr(game_state.game, 'change_state_with_transition'):
-                                game_state.game.change_state_with_transition(STATE_PLAYING)
-                            else:
-                                game_state.change_state(STATE_PLAYING)
+                        self.start_level(game_state, i + 1)
                         break
-        return True 
\ No newline at end of file
+        return True
+
+    def start_level(self, game_state, level_num):
+        """Start a mission if it is unlocked"""
+        if not game_state.is_level_available(level_num):
+            return
+        game_state.set_current_level(level_num)
+        self.preload_level(game_state, level_num)
+        # Use transition when starting a level
+        if hasattr(game_state.game, 'change_state_with_transition'):
+            game_state.game.change_state_with_transition(STATE_PLAYING)
+        else:
+            game_state.change_state(STATE_PLAYING)
+
+    def preload_level(self, game_state, level_num):
+        """Ask the playing screen to build a mission's assets in the background"""
+        if hasattr(game_state.game, 'playing_screen'):
+            game_state.game.playing_screen.preload_level(level_num)
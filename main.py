@@ -1,8 +1,12 @@
 import pygame
 import pygame_gui
 import sys
+import argparse
 import math
+import time
+import json
 from constants import *
+from utils import create_surface, take_slow_blit_count, load_theme
 from game_state import GameState
 from title_screen import TitleScreen
 from level_select import LevelSelect
@@ -13,8 +17,22 @@ from ability_selection_screen import AbilitySelectionScreen
 from debug_menu import DebugMenu
 from enemy_gallery import EnemyGallery
 from victory_screen import VictoryScreen
+from perf_overlay import PerfOverlay
+from autopilot import Autopilot
+from mem_profiler import MemoryProfiler, profile_stage
+from quality_governor import quality
+from render_backend import create_backend, blit_cached
+from audio_manager import audio
+from asset_manager import image_assets
 
 class TransitionSystem:
+    """Screen transitions composed from cached frames.
+
+    The outgoing frame is captured once when the transition starts and the
+    incoming frame is captured lazily, the first time it is drawn after the
+    state switch, so neither screen runs its full draw path while the
+    effect plays.
+    """
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -25,18 +43,29 @@ class TransitionSystem:
         self.from_state = None
         self.to_state = None
         self.callback = None
+        self.switched = False  # True once the callback has changed the state
+        self.outgoing_frame = None
+        self.incoming_frame = None
+        self.render_time_ms = 0.0  # Cost of the last transition frame
         
         # Create fade surface
-        self.fade_surface = pygame.Surface((self.screen_width, self.screen_height))
+        self.fade_surface = create_surface((self.screen_width, self.screen_height))
         self.fade_surface.fill(BLACK)
         
-    def start_transition(self, from_state, to_state, transition_type="fade", callback=None):
+    def start_transition(self, from_state, to_state, transition_type="fade", callback=None, outgoing_frame=None):
         self.is_active = True
         self.timer = 0
         self.from_state = from_state
         self.to_state = to_state
         self.transition_type = transition_type
         self.callback = callback
+        self.switched = False
+        self.outgoing_frame = outgoing_frame
+        self.incoming_frame = None
+        
+    def get_switch_point(self):
+        # Cross-fades need the incoming frame from the start, the others switch while the screen is covered
+        return 0.0 if self.transition_type == "crossfade" else 0.5
         
     def update(self):
         if not self.is_active:
@@ -44,69 +73,113 @@ class TransitionSystem:
             
         self.timer += 1
         
+        # Change state at the switch point so level setup happens behind a covered screen
+        if not self.switched and self.timer >= self.duration * self.get_switch_point():
+            self.switched = True
+            if self.callback:
+                self.callback()
+        
         # Check if transition completed
         if self.timer >= self.duration:
             self.is_active = False
             self.timer = 0
-            # Execute callback if provided
-            if self.callback:
-                self.callback()
+            self.outgoing_frame = None
+            self.incoming_frame = None
             return True
             
         return False
         
+    def blocks_state_change(self):
+        """True while the outgoing screen should stay active"""
+        return self.is_active and not self.switched
+        
+    def needs_incoming_frame(self):
+        return self.is_active and self.switched and self.incoming_frame is None
+        
+    def capture_incoming(self, surface):
+        start = time.perf_counter()
+        self.incoming_frame = surface.copy()
+        self.render_time_ms = (time.perf_counter() - start) * 1000.0
+        
     def draw(self, surface):
         if not self.is_active:
             return
             
+        start = time.perf_counter()
         progress = self.timer / self.duration
         
-        if self.transition_type == "fade":
-            # First half: fade out, second half: fade in
-            if progress < 0.5:
-                # Fade out (0 to 255)
-                alpha = int(ease_in_out(progress * 2) * 255)
-            else:
-                # Fade in (255 to 0)
-                alpha = int(255 - ease_in_out((progress - 0.5) * 2) * 255)
-                
-            self.fade_surface.set_alpha(alpha)
-            surface.blit(self.fade_surface, (0, 0))
+        if self.transition_type == "crossfade":
+            # Blend the two cached frames
+            if self.outgoing_frame:
+                blit_cached(surface, [(self.outgoing_frame, (0, 0))], background=True)
+            if self.incoming_frame:
+                self.incoming_frame.set_alpha(int(ease_in_out(progress) * 255))
+                blit_cached(surface, [(self.incoming_frame, (0, 0))], background=True)
             
-        elif self.transition_type == "wipe_left":
-            if progress < 0.5:
-                # Wipe from right to left (covering old screen)
-                width = int(self.screen_width * ease_in_out(progress * 2))
-                pygame.draw.rect(surface, BLACK, (self.screen_width - width, 0, width, self.screen_height))
-            else:
-                # Wipe from left to right (revealing new screen)
-                width = int(self.screen_width * (1 - ease_in_out((progress - 0.5) * 2)))
-                pygame.draw.rect(surface, BLACK, (0, 0, width, self.screen_height))
+        else:
+            # First half shows the outgoing frame, second half the incoming one
+            frame = self.outgoing_frame if progress < 0.5 else self.incoming_frame
+            if frame:
+                blit_cached(surface, [(frame, (0, 0))], background=True)
+            
+            if self.transition_type == "fade":
+                # First half: fade out, second half: fade in
+                if progress < 0.5:
+                    # Fade out (0 to 255)
+                    alpha = int(ease_in_out(progress * 2) * 255)
+                else:
+                    # Fade in (255 to 0)
+                    alpha = int(255 - ease_in_out((progress - 0.5) * 2) * 255)
+                    
+                self.fade_surface.set_alpha(alpha)
+                blit_cached(surface, [(self.fade_surface, (0, 0))], background=True)
+                
+            elif self.transition_type == "wipe_left":
+                if progress < 0.5:
+                    # Wipe from right to left (covering old screen)
+                    width = int(self.screen_width * ease_in_out(progress * 2))
+                    pygame.draw.rect(surface, BLACK, (self.screen_width - width, 0, width, self.screen_height))
+                else:
+                    # Wipe from left to right (revealing new screen)
+                    width = int(self.screen_width * (1 - ease_in_out((progress - 0.5) * 2)))
+                    pygame.draw.rect(surface, BLACK, (0, 0, width, self.screen_height))
+                    
+        self.render_time_ms = (time.perf_counter() - start) * 1000.0
     
     def resize(self, new_width, new_height):
         self.screen_width = new_width
         self.screen_height = new_height
-        self.fade_surface = pygame.Surface((self.screen_width, self.screen_height))
+        self.fade_surface = create_surface((self.screen_width, self.screen_height))
         self.fade_surface.fill(BLACK)
+        # Cached frames no longer match the screen
+        self.outgoing_frame = None
+        self.incoming_frame = None
 
 class StarfallGame:
-    def __init__(self):
+    def __init__(self, autopilot=False, memprofile=False, render_size=RENDER_RESOLUTION, renderer=RENDER_BACKEND):
         pygame.init()
         
         # Initialize sound system
-        pygame.mixer.init()
-        self.shoot_sound = pygame.mixer.Sound('shoot.wav')
+        self.audio = audio
+        self.audio.open()
+        self.audio.load('shoot', 'shoot.wav', 'weapons', max_voices=AUDIO_SHOOT_VOICES, priority=1)
         
-        self.screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT), pygame.RESIZABLE)
+        # The backend owns the window; with a fixed render size the frame never changes size, whatever the window does
+        self.backend = create_backend(renderer, render_size)
+        self.screen = self.backend.open((DEFAULT_WIDTH, DEFAULT_HEIGHT))
         pygame.display.set_caption("Starfall: The Kryll Invasion")
+        screen_width, screen_height = self.screen.get_size()
         
         self.clock = pygame.time.Clock()
         self.game_state = GameState()
         self.game_state.game = self  # Set reference to this game instance
-        self.manager = pygame_gui.UIManager((DEFAULT_WIDTH, DEFAULT_HEIGHT), 'theme.json')
+        self.manager = pygame_gui.UIManager((screen_width, screen_height), load_theme())
         
         # Initialize transition system
-        self.transition = TransitionSystem(DEFAULT_WIDTH, DEFAULT_HEIGHT)
+        self.transition = TransitionSystem(screen_width, screen_height)
+        
+        # Frame timing readout
+        self.perf_overlay = PerfOverlay()
         
         # Initialize screens
         self.title_screen = TitleScreen(self.screen, self.manager)
@@ -119,6 +192,29 @@ class StarfallGame:
         self.enemy_gallery = EnemyGallery(self.screen, self.manager)
         self.victory_screen = VictoryScreen(self.screen, self.manager)
         
+        # Overlay states draw on top of a frozen PlayingScreen scene
+        self.overlay_screens = {
+            STATE_PAUSED: self.pause_screen,
+            STATE_ABILITY_SELECT: self.ability_selection_screen,
+            STATE_DEBUG_MENU: self.debug_menu,
+            STATE_GAME_OVER: self.game_over_screen,
+            STATE_VICTORY: self.victory_screen
+        }
+        self.frozen_frame = None  # Snapshot of the scene with the overlay's dim layer applied
+        self.frozen_state = None  # Overlay state the snapshot was captured for
+        
+        # Optional bot that flies the ship and answers menus for unattended sessions
+        self.autopilot = Autopilot() if autopilot else None
+        self.playing_screen.input_controller = self.autopilot
+        
+        # Optional per-stage allocation profiling, reported on exit
+        self.profiler = MemoryProfiler() if memprofile else None
+        self.playing_screen.profiler = self.profiler
+
+        # Main loop state, kept on the game so frames can be stepped one at a time
+        self.running = True
+        self.last_state = self.game_state.current_state
+
         # Show initial screen
         self.title_screen.show()
         
@@ -148,8 +244,11 @@ class StarfallGame:
         # Clear all UI elements
         self.manager.clear_and_reset()
         
+        # Frozen overlay background no longer matches the screen size
+        self.frozen_frame = None
+        
         # Update screen size
-        self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+        self.screen = self.backend.open((event.w, event.h))
         
         # Update transition system
         self.transition.resize(event.w, event.h)
@@ -203,10 +302,15 @@ class StarfallGame:
         # Store current window state
         current_state = self.game_state.current_state
         
+        if self.backend.scales_to_window:
+            # SDL rescales the fixed-size frame, so nothing on our side changes size
+            self.backend.toggle_fullscreen()
+            return
+        
         # Get current display info
         info = pygame.display.Info()
         
-        if self.screen.get_flags() & pygame.FULLSCREEN:
+        if self.backend.is_fullscreen():
             # Switch to windowed mode
             new_screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT), pygame.RESIZABLE)
             self.handle_resize(pygame.event.Event(pygame.VIDEORESIZE, {'w': DEFAULT_WIDTH, 'h': DEFAULT_HEIGHT}))
@@ -216,164 +320,241 @@ class StarfallGame:
             self.handle_resize(pygame.event.Event(pygame.VIDEORESIZE, {'w': info.current_w, 'h': info.current_h}))
             
     def run(self):
-        running = True
-        last_state = self.game_state.current_state
+        if self.profiler:
+            self.profiler.start()
         
-        while running:
-            time_delta = self.clock.tick(FPS)/1000.0
-            
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.VIDEORESIZE:
-                    self.handle_resize(event)
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_F11:
-                        self.toggle_fullscreen()
-                    elif event.key == pygame.K_g and DEBUG_MODE:
-                        # Toggle debug menu with G key from any state if debug mode is on
-                        if self.game_state.current_state == STATE_PLAYING or self.game_state.current_state == STATE_TITLE:
-                            self.change_state_with_transition(STATE_DEBUG_MENU)
-                    
-                # Pass event to the currently active screen's handler
-                # The player object is needed for ability selection
-                player_obj = self.playing_screen.player if hasattr(self.playing_screen, 'player') else None
-
-                if self.game_state.current_state == STATE_TITLE:
-                    if not self.title_screen.handle_event(event, self.game_state):
-                        running = False
-                elif self.game_state.current_state == STATE_LEVEL_SELECT:
-                    if not self.level_select.handle_event(event, self.game_state):
-                        running = False
-                elif self.game_state.current_state == STATE_PLAYING:
-                    # Playing screen doesn't need player passed to its handler
-                    if not self.playing_screen.handle_event(event, self.game_state):
-                        running = False
-                elif self.game_state.current_state == STATE_PAUSED:
-                    if not self.pause_screen.handle_event(event, self.game_state):
-                        running = False
-                elif self.game_state.current_state == STATE_GAME_OVER:
-                    if not self.game_over_screen.handle_event(event, self.game_state):
-                        running = False
-                elif self.game_state.current_state == STATE_ABILITY_SELECT:
-                    if player_obj:
-                         if not self.ability_selection_screen.handle_event(event, self.game_state, player_obj):
-                              running = False # Should not happen, but safety check
-                    else:
-                         # Should not happen - can't select ability without player
-                         self.game_state.change_state(STATE_PLAYING)
-                elif self.game_state.current_state == STATE_DEBUG_MENU:
-                    if not self.debug_menu.handle_event(event, self.game_state, self.playing_screen):
-                        running = False
-                elif self.game_state.current_state == STATE_ENEMY_GALLERY:
-                    if not self.enemy_gallery.handle_event(event, self.game_state):
-                        running = False
-                elif self.game_state.current_state == STATE_VICTORY:
-                    if not self.victory_screen.handle_event(event, self.game_state):
-                        running = False
+        while self.run_frame():
+            pass
+        
+        if self.profiler:
+            self.write_memory_report()
+        pygame.quit()
+        sys.exit()
 
-                # Always process manager events
-                self.manager.process_events(event)
-            
-            # Update transition system
-            transition_complete = self.transition.update()
-            
-            # Only change screen visibility if not transitioning
-            if last_state != self.game_state.current_state and not self.transition.is_active:
-                # Handle state changes
-                # Hide all screens first
-                self.title_screen.hide()
-                self.level_select.hide()
-                self.playing_screen.hide()
-                self.pause_screen.hide()
-                self.game_over_screen.hide()
-                self.ability_selection_screen.hide()
-                self.debug_menu.hide()
-                self.enemy_gallery.hide()
-                self.victory_screen.hide()
-                
-                # Show only the current screen
-                if self.game_state.current_state == STATE_TITLE:
-                    self.title_screen.show()
-                elif self.game_state.current_state == STATE_LEVEL_SELECT:
-                    self.level_select.show()
-                elif self.game_state.current_state == STATE_PLAYING:
-                    # Reset is only needed when STARTING a level, not resuming
-                    if last_state != STATE_PAUSED and last_state != STATE_ABILITY_SELECT and last_state != STATE_DEBUG_MENU:
-                         self.playing_screen.reset(self.game_state)
-                    self.playing_screen.show()
-                elif self.game_state.current_state == STATE_PAUSED:
-                    self.pause_screen.show()
-                elif self.game_state.current_state == STATE_GAME_OVER:
-                    self.game_over_screen.show()
-                elif self.game_state.current_state == STATE_ABILITY_SELECT:
-                     # setup_ui was called above when state change was detected
-                    self.ability_selection_screen.show()
-                elif self.game_state.current_state == STATE_DEBUG_MENU:
-                    self.debug_menu.show()
-                elif self.game_state.current_state == STATE_ENEMY_GALLERY:
-                    self.enemy_gallery.show()
-                    self.enemy_gallery.update_enemy_display() # Make sure enemy display is updated
-                elif self.game_state.current_state == STATE_VICTORY:
-                    self.victory_screen.show() # Show victory screen
+    def run_frame(self):
+        """Handle input, update and draw one frame. Returns False once the game should quit."""
+        time_delta = self.clock.tick(FPS)/1000.0
+        self.perf_overlay.begin_frame()
+        self.audio.begin_frame()
+        
+        # Handle events
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.VIDEORESIZE and not self.backend.scales_to_window:
+                self.handle_resize(event)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F11:
+                    self.toggle_fullscreen()
+                elif event.key == pygame.K_F3:
+                    self.perf_overlay.toggle()
+                elif event.key == pygame.K_g and DEBUG_MODE:
+                    # Toggle debug menu with G key from any state if debug mode is on
+                    if self.game_state.current_state == STATE_PLAYING or self.game_state.current_state == STATE_TITLE:
+                        self.change_state_with_transition(STATE_DEBUG_MENU)
                 
-                last_state = self.game_state.current_state
+            # Pass event to the currently active screen's handler
+            # The player object is needed for ability selection
+            player_obj = self.playing_screen.player if hasattr(self.playing_screen, 'player') else None
 
-            # Update game state if playing
-            if self.game_state.current_state == STATE_PLAYING:
-                self.playing_screen.update(self.game_state)
-                # Don't automatically show ability screen anymore - player must press O key
-                # This section is now handled in PlayingScreen.handle_event
-            
-            # Update UI manager
-            self.manager.update(time_delta)
-            
-            # Update animations
             if self.game_state.current_state == STATE_TITLE:
-                self.title_screen.update_animation()
+                if not self.title_screen.handle_event(event, self.game_state):
+                    self.running = False
             elif self.game_state.current_state == STATE_LEVEL_SELECT:
-                self.level_select.update_animation()
-            
-            # Draw
-            self.screen.fill(BLACK)
+                if not self.level_select.handle_event(event, self.game_state):
+                    self.running = False
+            elif self.game_state.current_state == STATE_PLAYING:
+                # Playing screen doesn't need player passed to its handler
+                if not self.playing_screen.handle_event(event, self.game_state):
+                    self.running = False
+            elif self.game_state.current_state == STATE_PAUSED:
+                if not self.pause_screen.handle_event(event, self.game_state):
+                    self.running = False
+            elif self.game_state.current_state == STATE_GAME_OVER:
+                if not self.game_over_screen.handle_event(event, self.game_state):
+                    self.running = False
+            elif self.game_state.current_state == STATE_ABILITY_SELECT:
+                if player_obj:
+                     if not self.ability_selection_screen.handle_event(event, self.game_state, player_obj):
+                          self.running = False # Should not happen, but safety check
+                else:
+                     # Should not happen - can't select ability without player
+                     self.game_state.change_state(STATE_PLAYING)
+            elif self.game_state.current_state == STATE_DEBUG_MENU:
+                if not self.debug_menu.handle_event(event, self.game_state, self.playing_screen):
+                    self.running = False
+                # Debug actions (heal, shield...) change the frozen scene
+                if event.type == pygame_gui.UI_BUTTON_PRESSED:
+                    self.frozen_frame = None
+            elif self.game_state.current_state == STATE_ENEMY_GALLERY:
+                if not self.enemy_gallery.handle_event(event, self.game_state):
+                    self.running = False
+            elif self.game_state.current_state == STATE_VICTORY:
+                if not self.victory_screen.handle_event(event, self.game_state):
+                    self.running = False
+
+            # Always process manager events
+            self.manager.process_events(event)
+        
+        # The autopilot answers menus like button presses, once the screen has settled
+        if self.autopilot and not self.transition.is_active:
+            self.autopilot.drive_menus(self)
+        
+        # Update transition system
+        transition_complete = self.transition.update()
+        
+        # Only change screen visibility once the transition has switched states
+        if self.last_state != self.game_state.current_state and not self.transition.blocks_state_change():
+            # Handle state changes
+            # Hide all screens first
+            self.title_screen.hide()
+            self.level_select.hide()
+            self.playing_screen.hide()
+            self.pause_screen.hide()
+            self.game_over_screen.hide()
+            self.ability_selection_screen.hide()
+            self.debug_menu.hide()
+            self.enemy_gallery.hide()
+            self.victory_screen.hide()
             
+            # Show only the current screen
             if self.game_state.current_state == STATE_TITLE:
-                self.title_screen.draw(self.screen)
+                self.title_screen.show()
             elif self.game_state.current_state == STATE_LEVEL_SELECT:
-                self.level_select.draw(self.screen, self.game_state)
-            elif self.game_state.current_state in [STATE_PLAYING, STATE_PAUSED, STATE_ABILITY_SELECT, STATE_DEBUG_MENU]:
-                 if self.playing_screen.player: # Check if player exists (after reset)
-                    self.playing_screen.draw(self.screen, self.game_state)
+                self.level_select.show()
+            elif self.game_state.current_state == STATE_PLAYING:
+                # Reset is only needed when STARTING a level, not resuming
+                if self.last_state != STATE_PAUSED and self.last_state != STATE_ABILITY_SELECT and self.last_state != STATE_DEBUG_MENU:
+                     self.playing_screen.reset(self.game_state)
+                self.playing_screen.show()
+            elif self.game_state.current_state == STATE_PAUSED:
+                self.pause_screen.show()
             elif self.game_state.current_state == STATE_GAME_OVER:
-                # Draw the playing screen first, then the game over overlay
-                if self.playing_screen.player:
-                    self.playing_screen.draw(self.screen, self.game_state)
-                self.game_over_screen.draw(self.screen, self.game_state)
+                self.game_over_screen.show()
+            elif self.game_state.current_state == STATE_ABILITY_SELECT:
+                 # setup_ui was called above when state change was detected
+                self.ability_selection_screen.show()
+            elif self.game_state.current_state == STATE_DEBUG_MENU:
+                self.debug_menu.show()
             elif self.game_state.current_state == STATE_ENEMY_GALLERY:
-                self.enemy_gallery.draw(self.screen)
+                self.enemy_gallery.show()
+                self.enemy_gallery.update_enemy_display() # Make sure enemy display is updated
             elif self.game_state.current_state == STATE_VICTORY:
-                 # Draw playing screen background then victory overlay
-                 if self.playing_screen.player:
-                    self.playing_screen.draw(self.screen, self.game_state)
-                 self.victory_screen.draw(self.screen, self.game_state)
+                self.victory_screen.show() # Show victory screen
             
-            # Draw overlays on top
-            if self.game_state.current_state == STATE_PAUSED:
-                self.pause_screen.draw(self.screen, self.game_state)
-            elif self.game_state.current_state == STATE_ABILITY_SELECT:
-                 self.ability_selection_screen.draw(self.screen)
-            elif self.game_state.current_state == STATE_DEBUG_MENU:
-                 self.debug_menu.draw(self.screen)
-                 
-            # Draw transition effect on top of everything
+            self.last_state = self.game_state.current_state
+
+        # Update game state if playing (the scene is frozen while a transition plays)
+        if self.game_state.current_state == STATE_PLAYING and not self.transition.is_active:
+            with profile_stage(self.profiler, 'update'):
+                self.playing_screen.update(self.game_state)
+            # Don't automatically show ability screen anymore - player must press O key
+            # This section is now handled in PlayingScreen.handle_event
+        
+        # Update UI manager
+        with profile_stage(self.profiler, 'ui'):
+            self.manager.update(time_delta)
+        
+        # Update animations
+        if self.transition.is_active:
+            pass  # Screens are shown from cached frames during transitions
+        elif self.game_state.current_state == STATE_TITLE:
+            self.title_screen.update_animation()
+        elif self.game_state.current_state == STATE_LEVEL_SELECT:
+            self.level_select.update_animation()
+        
+        # Draw
+        if self.transition.is_active and not self.transition.needs_incoming_frame():
+            # Compose the transition from its cached frames only
             self.transition.draw(self.screen)
+            with profile_stage(self.profiler, 'ui'):
+                self.manager.draw_ui(self.screen)
+            self.finish_frame()
+            return self.running
             
+        if self.game_state.current_state in self.overlay_screens:
+            # The scene under an overlay is frozen: blit the cached snapshot
+            if self.frozen_frame is None or self.frozen_state != self.game_state.current_state:
+                self.capture_frozen_frame()
+            blit_cached(self.screen, [(self.frozen_frame, (0, 0))], background=True)
+        else:
+            self.frozen_frame = None
+            self.screen.fill(BLACK)
+        
+        if self.game_state.current_state == STATE_TITLE:
+            self.title_screen.draw(self.screen)
+        elif self.game_state.current_state == STATE_LEVEL_SELECT:
+            self.level_select.draw(self.screen, self.game_state)
+        elif self.game_state.current_state == STATE_PLAYING:
+             if self.playing_screen.player: # Check if player exists (after reset)
+                with profile_stage(self.profiler, 'draw'):
+                    self.playing_screen.draw(self.screen, self.game_state)
+        elif self.game_state.current_state == STATE_ENEMY_GALLERY:
+            self.enemy_gallery.draw(self.screen)
+        
+        # Draw overlay content on top of the frozen scene
+        if self.game_state.current_state == STATE_PAUSED:
+            self.pause_screen.draw(self.screen, self.game_state)
+        elif self.game_state.current_state == STATE_ABILITY_SELECT:
+             self.ability_selection_screen.draw(self.screen)
+        elif self.game_state.current_state == STATE_DEBUG_MENU:
+             self.debug_menu.draw(self.screen)
+        elif self.game_state.current_state == STATE_GAME_OVER:
+            self.game_over_screen.draw(self.screen, self.game_state)
+        elif self.game_state.current_state == STATE_VICTORY:
+             self.victory_screen.draw(self.screen, self.game_state)
+             
+        # Capture the incoming screen once, then draw the transition on top of everything
+        if self.transition.needs_incoming_frame():
+            self.transition.capture_incoming(self.screen)
+            self.transition.draw(self.screen)
+        
+        with profile_stage(self.profiler, 'ui'):
             self.manager.draw_ui(self.screen)
-            pygame.display.flip()
+        self.finish_frame()
         
-        pygame.quit()
-        sys.exit()
+        return self.running
+
+    def finish_frame(self):
+        """Draw the perf overlay and present the frame"""
+        if self.transition.is_active:
+            self.perf_overlay.set_stat("Transition", f"{self.transition.render_time_ms:.2f} ms")
+        else:
+            self.perf_overlay.clear_stat("Transition")
+        self.perf_overlay.end_frame()
+        # Only gameplay frames steer effect quality; menus and transitions are cheap or one-off
+        if self.game_state.current_state == STATE_PLAYING and not self.transition.is_active:
+            quality.record_frame(self.perf_overlay.frame_times[-1])
+        if quality.enabled:
+            self.perf_overlay.set_stat("Quality", f"{int(quality.detail * 100)}%")
+        self.perf_overlay.set_stat("Evicted", self.playing_screen.entity_budget.describe())
+        if self.profiler:
+            self.perf_overlay.set_stat("Alloc blocks", self.profiler.end_frame())
+        if DEBUG_MODE:
+            self.perf_overlay.set_stat("Slow blits", take_slow_blit_count())
+        if self.audio.enabled:
+            self.perf_overlay.set_stat("Audio", self.audio.describe())
+        if image_assets.originals:
+            self.perf_overlay.set_stat("Assets", image_assets.describe())
+        self.perf_overlay.draw(self.backend, self.clock.get_fps())
+        self.backend.present()
+
+    def write_memory_report(self):
+        self.profiler.stop()
+        with open(MEMPROFILE_REPORT_PATH, 'w') as report_file:
+            json.dump(self.profiler.report(), report_file, indent=2)
+        print(f"Memory profile written to {MEMPROFILE_REPORT_PATH}")
+
+    def capture_frozen_frame(self):
+        """Render the paused scene once, with the current overlay's dim/tint layer applied"""
+        state = self.game_state.current_state
+        frame = create_surface(self.screen.get_size())
+        frame.fill(BLACK)
+        if self.playing_screen.player:
+            self.playing_screen.draw(frame, self.game_state)
+        self.overlay_screens[state].draw_overlay(frame)
+        self.frozen_frame = frame
+        self.frozen_state = state
 
     def change_state_with_transition(self, new_state, transition_type="fade"):
         """Change game state with a smooth transition animation"""
@@ -387,14 +568,42 @@ class StarfallGame:
         def change_state_after_transition():
             self.game_state.change_state(new_state)
         
-        # Start the transition
+        # Start the transition from a snapshot of the last presented frame
         self.transition.start_transition(
             current_state,
             new_state,
             transition_type=transition_type,
-            callback=change_state_after_transition
+            callback=change_state_after_transition,
+            outgoing_frame=self.screen.copy()
         )
 
-if __name__ == "__main__":
-    game = StarfallGame()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Starfall: The Kryll Invasion")
+    parser.add_argument('--autopilot', action='store_true',
+                        help="let the built-in bot fly the ship and answer menus")
+    parser.add_argument('--memprofile', action='store_true',
+                        help=f"profile allocations per stage and write them to {MEMPROFILE_REPORT_PATH} on exit")
+    parser.add_argument('--render-size', type=parse_size, default=RENDER_RESOLUTION, metavar='WxH',
+                        help="draw at a fixed internal resolution (e.g. 1280x720) and scale it to the window")
+    parser.add_argument('--renderer', choices=('surface', 'texture', 'software'), default=RENDER_BACKEND,
+                        help="surface blits, the SDL2 texture renderer, or that renderer without a GPU")
+    return parser.parse_args(argv)
+
+def parse_size(text):
+    """Parse a WIDTHxHEIGHT argument such as 1280x720"""
+    try:
+        width, height = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive, got {text!r}")
+    return (width, height)
+
+def main(argv=None):
+    args = parse_args(argv)
+    game = StarfallGame(autopilot=args.autopilot, memprofile=args.memprofile, render_size=args.render_size,
+                        renderer=args.renderer)
     game.run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import gc
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import nullcontext
+from constants import *
+
+class MemoryProfiler:
+    """Per-frame allocation and garbage collection stats, broken down by stage.
+
+    Stages (update, collisions, particles, draw, ui) are entered with
+    `with profiler.stage(name)` and may nest; work inside a nested stage is
+    charged to the nested stage only. For every stage the profiler records the
+    net change in allocated blocks (sys.getallocatedblocks) and the bytes
+    allocated, measured as the tracemalloc peak above the stage's starting
+    point. GC collections are timed with gc.callbacks and charged to the stage
+    that triggered them.
+
+    Every snapshot_interval frames one stage, in rotation, is sampled: tracemalloc
+    snapshots taken around it are compared to find its top allocation sites.
+    A snapshot pair costs tens of milliseconds, so frame times of a profiled
+    run are not comparable with normal runs.
+    """
+
+    STAGES = ('update', 'collisions', 'particles', 'draw', 'ui')
+
+    def __init__(self, snapshot_interval=MEMPROFILE_SNAPSHOT_INTERVAL, top_sites=MEMPROFILE_TOP_SITES):
+        self.snapshot_interval = snapshot_interval
+        self.top_sites = top_sites
+        self.running = False
+        self.started_tracing = False  # Leave tracemalloc running if someone else started it
+        self.frames = 0
+        self.stack = []  # Names of the stages currently entered, innermost last
+        self.stats = {}  # Stage name -> running totals
+        self.sites = {}  # Stage name -> Counter of bytes allocated per source line
+        self.frame_blocks = 0  # Net blocks allocated during the current frame
+        self.gc_start = 0.0
+        self.gc_stats = {generation: {'collections': 0, 'collected': 0, 'pause_ms': 0.0, 'max_pause_ms': 0.0}
+                         for generation in range(3)}
+        self.sample_stage = None  # Stage whose allocation sites are sampled this frame
+        self.snapshot = None
+        self.segment_blocks = 0
+        self.segment_bytes = 0
+
+    def start(self):
+        if self.running:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        gc.callbacks.append(self.on_gc)
+        self.running = True
+        self.begin_segment()
+
+    def stop(self):
+        if not self.running:
+            return
+        gc.callbacks.remove(self.on_gc)
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+        self.running = False
+        self.snapshot = None
+
+    def get_stage_stats(self, name):
+        if name not in self.stats:
+            self.stats[name] = {'calls': 0, 'net_blocks': 0, 'alloc_bytes': 0, 'max_alloc_bytes': 0,
+                                'gc_collections': 0, 'gc_pause_ms': 0.0}
+            self.sites[name] = Counter()
+        return self.stats[name]
+
+    def begin_segment(self):
+        """Start measuring from here"""
+        # Snapshot first so its own allocations are not charged to the stage
+        if self.sample_stage and self.stack and self.stack[-1] == self.sample_stage:
+            self.snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        self.segment_bytes = tracemalloc.get_traced_memory()[0]
+        self.segment_blocks = sys.getallocatedblocks()
+
+    def end_segment(self):
+        """Charge everything since begin_segment to the innermost stage"""
+        blocks = sys.getallocatedblocks() - self.segment_blocks
+        peak = tracemalloc.get_traced_memory()[1] - self.segment_bytes
+        self.frame_blocks += blocks
+        if not self.stack:
+            return
+        stats = self.get_stage_stats(self.stack[-1])
+        stats['net_blocks'] += blocks
+        stats['alloc_bytes'] += peak
+        stats['max_alloc_bytes'] = max(stats['max_alloc_bytes'], peak)
+
+        if self.snapshot is not None:
+            sites = self.sites[self.stack[-1]]
+            for diff in tracemalloc.take_snapshot().compare_to(self.snapshot, 'lineno'):
+                frame = diff.traceback[0]
+                # Leave out the profiler's own bookkeeping
+                if diff.size_diff > 0 and frame.filename not in (__file__, tracemalloc.__file__):
+                    sites[f"{frame.filename}:{frame.lineno}"] += diff.size_diff
+            # One segment per sampled frame keeps the snapshot cost bounded
+            self.snapshot = None
+            self.sample_stage = None
+
+    def enter(self, name):
+        self.end_segment()
+        self.stack.append(name)
+        self.get_stage_stats(name)['calls'] += 1
+        self.begin_segment()
+
+    def leave(self):
+        self.end_segment()
+        self.stack.pop()
+        self.begin_segment()
+
+    def stage(self, name):
+        """Context manager that charges the enclosed work to a stage"""
+        return ProfilerStage(self, name)
+
+    def end_frame(self):
+        """Close the current frame; returns the net blocks it allocated"""
+        self.end_segment()
+        self.frames += 1
+        frame_blocks = self.frame_blocks
+        self.frame_blocks = 0
+        self.snapshot = None
+        self.sample_stage = None
+        if self.snapshot_interval > 0 and self.frames % self.snapshot_interval == 0:
+            self.sample_stage = self.STAGES[(self.frames // self.snapshot_interval) % len(self.STAGES)]
+        self.begin_segment()
+        return frame_blocks
+
+    def on_gc(self, phase, info):
+        if phase == 'start':
+            self.gc_start = time.perf_counter()
+            return
+        pause_ms = (time.perf_counter() - self.gc_start) * 1000.0
+        stats = self.gc_stats[info['generation']]
+        stats['collections'] += 1
+        stats['collected'] += info['collected']
+        stats['pause_ms'] += pause_ms
+        stats['max_pause_ms'] = max(stats['max_pause_ms'], pause_ms)
+        if self.stack:
+            stage_stats = self.get_stage_stats(self.stack[-1])
+            stage_stats['gc_collections'] += 1
+            stage_stats['gc_pause_ms'] += pause_ms
+
+    def report(self):
+        """Summary as a JSON-friendly dict"""
+        frames = max(1, self.frames)
+        stages = {}
+        for name, stats in self.stats.items():
+            stages[name] = {
+                'net_blocks_per_frame': round(stats['net_blocks'] / frames, 2),
+                'alloc_kb_per_frame': round(stats['alloc_bytes'] / frames / 1024, 3),
+                'max_alloc_kb': round(stats['max_alloc_bytes'] / 1024, 3),
+                'gc_collections': stats['gc_collections'],
+                'gc_pause_ms': round(stats['gc_pause_ms'], 3),
+                'top_sites': [{'site': site, 'kb': round(size / 1024, 3)}
+                              for site, size in self.sites[name].most_common(self.top_sites)]
+            }
+        return {
+            'frames': self.frames,
+            'stages': stages,
+            'gc': {str(generation): {key: round(value, 3) for key, value in stats.items()}
+                   for generation, stats in self.gc_stats.items()}
+        }
+
+
+class ProfilerStage:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.enter(self.name)
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.profiler.leave()
+
+
+def profile_stage(profiler, name):
+    """profiler.stage(name), or a no-op when profiling is off"""
+    return profiler.stage(name) if profiler else nullcontext()
@@ -0,0 +1,95 @@
+import numpy as np
+from constants import *
+
+class MovementPath:
+    """Per-frame movement (dx, dy) precomputed for every integer phase of a path.
+
+    Entities on a path carry its id in `path` and their frames on it in
+    `path_phase`. The table is built with NumPy once and kept as a list of
+    (dx, dy) tuples, so each frame is a plain index per entity: advance()
+    moves an entity that carries its own phase and step() serves callers
+    that keep their own timer, like the boss. Tables wrap around, so
+    sinusoids are built over whole periods and splines as closed loops.
+    """
+
+    def __init__(self, path_id, steps):
+        self.id = path_id
+        table = np.asarray(steps, dtype=np.float64).reshape(-1, 2)
+        self.length = len(table)
+        self.steps = [tuple(step) for step in table.tolist()]
+
+    def step(self, phase):
+        return self.steps[phase % self.length]
+
+    def advance(self, entity):
+        """Move the entity by its next step and count the frame on the path"""
+        dx, dy = self.steps[entity.path_phase % self.length]
+        entity.x += dx
+        entity.y += dy
+        entity.path_phase += 1
+
+
+class Formation:
+    """Spawn offsets of each member of a group, relative to its leader"""
+
+    def __init__(self, formation_id, slots):
+        self.id = formation_id
+        self.slots = [tuple(slot) for slot in slots]
+
+    def positions(self, x, y, count):
+        """Spawn points of count members around a leader at (x, y); bigger groups repeat the formation further back"""
+        depth = max(-oy for _, oy in self.slots) + 30
+        positions = []
+        for i in range(count):
+            ox, oy = self.slots[i % len(self.slots)]
+            positions.append((x + ox, y + oy - depth * (i // len(self.slots))))
+        return positions
+
+
+WAVES = {'sin': np.sin, 'cos': np.cos}
+
+def sinusoid_steps(terms, axis, start=0.0, length=PATH_TABLE_SIZE):
+    t = np.arange(length) + start
+    offsets = sum(WAVES[wave](t * rate) * amplitude for wave, rate, amplitude in terms)
+    zeros = np.zeros(length)
+    return np.column_stack((offsets, zeros) if axis == 'x' else (zeros, offsets))
+
+def spline_steps(points, frames):
+    """Per-frame movement along a closed Catmull-Rom loop through points"""
+    points = np.asarray(points, dtype=np.float64)
+    count = len(points)
+    u = np.arange(frames) * count / frames
+    index = u.astype(int)
+    t = (u - index)[:, None]
+    p0, p1, p2, p3 = (points[(index + k) % count] for k in (-1, 0, 1, 2))
+    positions = 0.5 * (2 * p1 + (p2 - p0) * t + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t ** 2 +
+                       (3 * p1 - p0 - 3 * p2 + p3) * t ** 3)
+    return np.roll(positions, -1, axis=0) - positions
+
+def compile_paths(definitions=MOVEMENT_PATHS):
+    """Path id -> MovementPath (or Formation)"""
+    paths = {}
+    for path_id, definition in definitions.items():
+        kind = definition['kind']
+        if kind == 'sinusoid':
+            paths[path_id] = MovementPath(path_id, sinusoid_steps(
+                definition['terms'], definition['axis'], definition.get('start', 0.0),
+                definition.get('length', PATH_TABLE_SIZE)))
+        elif kind == 'spline':
+            paths[path_id] = MovementPath(path_id, spline_steps(definition['points'], definition['frames']))
+        elif kind == 'formation':
+            paths[path_id] = Formation(path_id, definition['slots'])
+        else:
+            raise ValueError(f"Unknown movement path kind {kind!r} for {path_id!r}")
+    return paths
+
+
+def advance_paths(entities):
+    """Apply each entity's path for one frame"""
+    for entity in entities:
+        if entity.path is not None:
+            movement_paths[entity.path].advance(entity)
+
+
+# Compiled once, shared by every PlayingScreen
+movement_paths = compile_paths()
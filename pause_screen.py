@@ -1,6 +1,8 @@
 import pygame
 import pygame_gui
 from constants import *
+from utils import create_surface
+from render_backend import blit_cached
 
 class PauseScreen:
     def __init__(self, screen, manager):
@@ -63,7 +65,7 @@ class PauseScreen:
         )
 
         # Create overlay
-        self.overlay = pygame.Surface((screen_width, screen_height))
+        self.overlay = create_surface((screen_width, screen_height))
         self.overlay.fill(BLACK)
         self.overlay.set_alpha(128)  # Semi-transparent
 
@@ -87,16 +89,18 @@ class PauseScreen:
             self.quit_button.hide()
         self.is_visible = False
         
+    def draw_overlay(self, surface):
+        # Draw semi-transparent overlay (baked into the frozen background by the main loop)
+        if self.overlay:
+            surface.blit(self.overlay, (0, 0))
+        
     def draw(self, surface, game_state):
         if not self.is_visible:
             return
-        # Draw semi-transparent overlay
-        if self.overlay:
-            surface.blit(self.overlay, (0, 0))
         
         # Draw "MISSION PAUSED" text
         if self.pause_text:
-            surface.blit(self.pause_text, self.pause_rect)
+            blit_cached(surface, [(self.pause_text, self.pause_rect)])
         
     def handle_event(self, event, game_state):
         if not self.is_visible:
@@ -0,0 +1,63 @@
+import pygame
+import time
+from collections import deque
+from constants import *
+
+class PerfOverlay:
+    """Small on-screen readout of frame timings and subsystem stats (toggle with F3)"""
+
+    def __init__(self):
+        self.visible = SHOW_PERF_OVERLAY
+        self.frame_times = deque(maxlen=PERF_OVERLAY_SAMPLES)  # Work time per frame in ms
+        self.stats = {}  # Extra named values reported by subsystems
+        self.frame_start = 0.0
+        self.frame_count = 0
+        self.font = None
+        self.lines = []  # Rendered text, refreshed every few frames
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.lines = []
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Record the time spent since begin_frame (excludes the clock's sleep)"""
+        self.frame_times.append((time.perf_counter() - self.frame_start) * 1000.0)
+        self.frame_count += 1
+
+    def set_stat(self, name, value):
+        self.stats[name] = value
+
+    def clear_stat(self, name):
+        self.stats.pop(name, None)
+
+    def get_average_ms(self):
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def draw(self, backend, fps=None):
+        """Draw through the render backend so the text can stay cached as textures"""
+        if not self.visible:
+            return
+
+        # Re-render the text a few times per second rather than every frame
+        if not self.lines or self.frame_count % PERF_OVERLAY_REFRESH == 0:
+            if self.font is None:
+                self.font = load_font(18)
+            text = []
+            if fps is not None:
+                text.append(f"FPS: {fps:.1f}")
+            if self.frame_times:
+                text.append(f"Frame: {self.get_average_ms():.2f} ms avg / {max(self.frame_times):.2f} ms max")
+            for name, value in self.stats.items():
+                text.append(f"{name}: {value}")
+            self.lines = [self.font.render(line, True, GREEN) for line in text]
+
+        y = 5
+        for line in self.lines:
+            backend.fill_rect(pygame.Rect(5, y, line.get_width() + 6, line.get_height()), BLACK)
+            backend.draw_cached(line, (8, y))
+            y += line.get_height()
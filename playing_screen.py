@@ -3,11 +3,28 @@ import pygame_gui
 import math
 import random
 from constants import *
-from game_objects import Star, Nebula, PlayerShip, Laser, Enemy, EnemyProjectile, PowerUp, BossEnemy, Explosion
-from utils import load_font, get_scale_factor, load_image
+from game_objects import Nebula, PlayerShip, Laser, Enemy, EnemyProjectile, PowerUp, BossEnemy, Explosion
+from utils import load_font, get_scale_factor, create_surface, render_text
+from starfield import Starfield
+from level_preloader import LevelPreloader
+from mem_profiler import profile_stage
+from quality_governor import quality
+from entity_budget import EntityBudget
+from audio_manager import audio
+from spawn_tables import get_spawn_table
+from bullet_patterns import bullet_patterns
+from movement_paths import movement_paths, advance_paths
+from timer_wheel import TimerWheel, Countdown
+from checkpoints import CheckpointStore, CHECKPOINT_LEVEL_START, CHECKPOINT_BOSS_PHASE
+from render_backend import blit_cached, fill_rect
 from pygame_gui.elements import UIButton
 
 class PlayingScreen:
+    # Banner and notification timers run on the timer wheel like the game objects' cooldowns
+    level_complete_timer = Countdown()
+    boss_intro_timer = Countdown()
+    notification_timer = Countdown()
+
     def __init__(self, screen, manager):
         self.screen = screen
         self.manager = manager
@@ -17,20 +34,26 @@ class PlayingScreen:
 
         # Game objects - initialize empty
         self.player = None
-        self.stars = []
+        self.stars = None
         self.nebula = Nebula()
         self.enemies = []
         self.player_lasers = []
         self.enemy_projectiles = []
+        self.pattern_volleys = {} # Pattern name -> volleys fired this mission (turns spirals)
         self.power_ups = []
         self.boss = None
+        self.timers = TimerWheel() # Cooldowns and timed effects of everything in the mission
 
         # Game state
         self.score = 0
+        self.kills = 0 # Enemies destroyed this mission (including the boss)
         self.enemy_spawn_timer = 0
+        self.spawn_table = None # Compiled waves for the current level, set in reset
+        self.next_burst = 0
         self.power_up_spawn_timer = 0
         self.game_over = False
-        self.level_complete_timer = -1 # Timer for showing completion message
+        self.level_completing = False # Showing the completion message
+        self.level_complete_timer = 0
         self.frame_count = 0 # For timing certain effects
         
         # Boss Intro State
@@ -42,6 +65,8 @@ class PlayingScreen:
         self.notification_timer = 0
         self.notification_text = None
         self.notification_rect = None
+        self.notification_glow = None
+        self.red_tint = None  # Solid red, faded in with surface alpha as health drops
         
         # Visual effects
         self.particles = []
@@ -49,60 +74,121 @@ class PlayingScreen:
         
         # Background
         self.background_image = None # To hold the level-specific background
+        
+        # Optional object with get_controls(playing_screen, game_state) that replaces the keyboard
+        self.input_controller = None
+
+        # Optional MemoryProfiler; collisions and particles are reported as their own stages
+        self.profiler = None
+
+        # Caps on cosmetic effects so bursts of hits cannot flood update and draw
+        self.entity_budget = EntityBudget()
+
+        # Heavy level assets are prepared ahead of time while in menus
+        self.level_preloader = LevelPreloader(self.build_level_assets)
+
+        # Snapshots taken at level start and boss phase changes, so retries skip the rebuild
+        self.checkpoints = CheckpointStore()
+        self.checkpoint_phase = None  # Boss phase of the latest boss phase snapshot
 
         self.setup_ui() # Create UI elements
         self.hide()  # Hide UI elements initially
 
     def reset(self, game_state):
         """Resets the playing screen state for the current level in game_state."""
+        # Retries restore a snapshot of the same level instead of rebuilding it
+        retry_from = game_state.retry_from
+        game_state.retry_from = None
+        self.spawn_table = get_spawn_table(game_state.current_level, game_state)
+        if retry_from and self.restore_checkpoint(retry_from, game_state):
+            return
+
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
         self.height = screen_height # Update height property
 
-        self.player = PlayerShip()
+        self.timers.clear()
+        self.player = PlayerShip(self.timers)
         self.player.x = screen_width // 2 # Center player horizontally
         self.player.y = screen_height * 2 // 3 # Position player vertically
 
-        self.stars = []
         self.enemies = []
         self.player_lasers = []
         self.enemy_projectiles = []
+        self.pattern_volleys = {}
         self.power_ups = []
         self.boss = None
+        self.particles = []
+        self.explosions = []
+        self.entity_budget.reset()
 
         self.score = 0
-        self.enemy_spawn_timer = ENEMY_SPAWN_RATE # Make sure timer is initialized with constant
+        self.kills = 0
+        self.enemy_spawn_timer = self.spawn_table.get_interval(0)
+        self.next_burst = 0  # Index into spawn_table.bursts
         self.power_up_spawn_timer = 0
         self.game_over = False
-        self.level_complete_timer = -1
+        self.level_completing = False
+        self.level_complete_timer = 0
         self.show_boss_intro = False # Reset boss intro flag
         self.boss_intro_timer = 0
+        self.notification_timer = 0
 
         # Set nebula color for the level
         self.nebula.set_color_for_level(game_state.current_level)
 
-        # Initialize stars for the current screen size
-        self.init_stars()
+        # Swap in the stars, background and boss prepared by the preloader
+        assets = self.level_preloader.take(game_state.current_level, screen_width, screen_height)
+        self.stars = assets['stars']
+        self.background_image = assets['background']
 
         # Spawn boss if it's the boss level
         if game_state.is_boss_level():
-            self.boss = BossEnemy(screen_width)
-            
-        # Generate procedural background for the level
-        self.background_image = self.generate_background(game_state.current_level, screen_width, screen_height)
+            self.boss = assets['boss']
+            self.boss.timers = self.timers
+
+        self.checkpoints.clear()
+        self.checkpoint_phase = None
+        game_state.checkpoint_phase = None
+        self.checkpoints.capture(CHECKPOINT_LEVEL_START, self, game_state)
 
         self.show() # Make sure UI (like pause button) is visible
 
+    def restore_checkpoint(self, name, game_state):
+        """Put the level back the way it was at a checkpoint; returns False if there is no usable one"""
+        if not self.checkpoints.restore(name, self, game_state):
+            return False
+        self.entity_budget.reset()
+        self.show()
+        return True
+
+    def capture_boss_phase(self, game_state):
+        """Snapshot the fight when the boss enters a new phase so a retry can start there"""
+        self.checkpoint_phase = self.boss.attack_phase
+        game_state.checkpoint_phase = self.boss.attack_phase
+        self.checkpoints.capture(CHECKPOINT_BOSS_PHASE, self, game_state, info=self.boss.attack_phase)
+
     def init_stars(self):
-        self.stars = []
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
-        for _ in range(100):
-            self.stars.append(Star(
-                random.randint(0, screen_width),
-                random.randint(0, screen_height),
-                random.uniform(1, 3)
-            ))
+        self.stars = self.create_starfield(screen_width, screen_height)
+
+    def create_starfield(self, width, height, seed=None):
+        return Starfield(width, height, 100, speed_range=(1, 3), size_range=(1, 4), seed=seed)
+
+    def preload_level(self, level):
+        """Start preparing a level's assets in the background for the current screen size"""
+        if 1 <= level <= 5:
+            self.level_preloader.request(level, self.screen.get_width(), self.screen.get_height())
+
+    def build_level_assets(self, level, width, height, seed, templates):
+        """Build the expensive per-level assets. Runs on the preloader's worker thread."""
+        rng = random.Random(seed)
+        return {
+            'background': self.generate_background(level, width, height, rng, templates),
+            'stars': self.create_starfield(width, height, rng.getrandbits(32)),
+            'boss': BossEnemy(width) if level == 5 else None
+        }
 
     def setup_ui(self):
         screen_width = self.screen.get_width()
@@ -166,14 +252,15 @@ class PlayingScreen:
             # Alpha increases as health decreases (max alpha around 120 for visibility)
             alpha = int((1 - health_percentage) * 120) 
             if alpha > 0:
-                red_tint_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-                red_tint_surface.fill((255, 0, 0, alpha))
-                surface.blit(red_tint_surface, (0, 0))
+                if self.red_tint is None or self.red_tint.get_size() != surface.get_size():
+                    self.red_tint = create_surface(surface.get_size())
+                    self.red_tint.fill(RED)
+                blit_cached(surface, [(self.red_tint, (0, 0))], alpha=alpha, background=True)
         # --- End of Red Tint --- 
 
         # Draw stars in the background
-        for star in self.stars:
-            star.draw(surface)
+        if self.stars:
+            self.stars.draw(surface)
         
         # Draw player
         if self.player:
@@ -195,7 +282,7 @@ class PlayingScreen:
             proj.draw(surface)
             
             # Special drawing for mine type projectiles
-            if hasattr(proj, 'proj_type') and proj.proj_type == "mine":
+            if proj.type == "mine":
                 # Add spikes to mines
                 for i in range(8):  # 8 spikes around the mine
                     angle = i * (math.pi/4)
@@ -222,7 +309,7 @@ class PlayingScreen:
             beam_length = math.sqrt((beam_end_y - beam_start_y)**2 + (beam_target_x - beam_start_x)**2)
             
             # Add particles along beam
-            num_particles = int(beam_length / 20)  # One particle every 20 pixels
+            num_particles = quality.scale(int(beam_length / 20))  # One particle every 20 pixels at full quality
             for i in range(num_particles):
                 # Calculate position along beam
                 t = i / num_particles
@@ -248,19 +335,13 @@ class PlayingScreen:
         
         # Draw current mission name - center at the very top
         mission_font_size = int(20 * scale)
-        mission_font = load_font(mission_font_size)
         mission_name = f"Mission: {game_state.current_level} - {list(MISSION_DESCRIPTIONS.values())[game_state.current_level-1].split('.')[0]}"
-        mission_text = mission_font.render(mission_name, True, LIGHT_GRAY)
+        mission_text = render_text(mission_font_size, mission_name, LIGHT_GRAY)
         mission_rect = mission_text.get_rect(midtop=(screen_width // 2, int(10 * scale)))
-        surface.blit(mission_text, mission_rect)
+        blit_cached(surface, [(mission_text, mission_rect)])
 
-        # Draw score in top-left (but below mission text)
+        # The score is not shown during missions; its font size is shared by the texts below
         score_font_size = int(24 * scale)
-        score_font = load_font(score_font_size)
-        score_text = score_font.render(f"Score: {self.score}", True, WHITE)
-        score_rect = score_text.get_rect(topleft=(int(20 * scale), int(40 * scale)))
-        # Score text is now invisible but still calculated for future use
-        # surface.blit(score_text, score_rect)
         
         # Get pause button area to avoid text overlap
         pause_button_area_width = self.pause_button.relative_rect.width + int(40 * scale)
@@ -268,10 +349,9 @@ class PlayingScreen:
         # Draw ship info if player exists
         if self.player:
             ship_font_size = int(16 * scale)
-            ship_font = load_font(ship_font_size)
-            ship_text = ship_font.render(f"Ship: {self.player.ship_name}", True, BLUE)
+            ship_text = render_text(ship_font_size, f"Ship: {self.player.ship_name}", BLUE)
             ship_rect = ship_text.get_rect(midbottom=(screen_width // 2, screen_height - int(10 * scale)))
-            surface.blit(ship_text, ship_rect)
+            blit_cached(surface, [(ship_text, ship_rect)])
         
         # Draw remaining enemies / Boss Health
         if game_state.is_boss_level() and self.boss:
@@ -291,40 +371,42 @@ class PlayingScreen:
             else:
                 bar_color = RED
                 
-            # Draw boss name centered above the bar
-            boss_name_font = score_font
-            boss_name_text = boss_name_font.render(f"{self.boss.name}", True, RED)
-            # Position boss name above health bar
-            boss_name_rect = boss_name_text.get_rect(midbottom=(bar_x + bar_width // 2, bar_y - int(5 * scale)))
-            surface.blit(boss_name_text, boss_name_rect)
-            
+            # The bar is filled in drawing order with the cached text, over explosions
             # Draw background bar (empty)
-            pygame.draw.rect(surface, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+            fill_rect(surface, (bar_x, bar_y, bar_width, bar_height), DARK_GRAY)
             
             # Draw filled portion of the bar
             filled_width = int(bar_width * health_percent)
-            pygame.draw.rect(surface, bar_color, (bar_x, bar_y, filled_width, bar_height))
+            if filled_width > 0:
+                fill_rect(surface, (bar_x, bar_y, filled_width, bar_height), bar_color)
             
             # Draw border
-            pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+            for edge in ((bar_x, bar_y, bar_width, 2), (bar_x, bar_y + bar_height - 2, bar_width, 2),
+                         (bar_x, bar_y, 2, bar_height), (bar_x + bar_width - 2, bar_y, 2, bar_height)):
+                fill_rect(surface, edge, WHITE)
+
+            # Draw boss name centered above the bar (after it: cached text goes over software drawing)
+            boss_name_text = render_text(score_font_size, f"{self.boss.name}", RED)
+            # Position boss name above health bar
+            boss_name_rect = boss_name_text.get_rect(midbottom=(bar_x + bar_width // 2, bar_y - int(5 * scale)))
+            blit_cached(surface, [(boss_name_text, boss_name_rect)])
             
             # Optionally show numerical health values
-            health_text = score_font.render(f"{self.boss.health}/{self.boss.max_health}", True, WHITE)
+            health_text = render_text(score_font_size, f"{self.boss.health}/{self.boss.max_health}", WHITE)
             health_text_rect = health_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
-            surface.blit(health_text, health_text_rect)
+            blit_cached(surface, [(health_text, health_text_rect)])
         else:
             # Non-boss levels: Draw Enemies Remaining text in top-right
             enemies_remaining = game_state.get_enemies_remaining()
             remaining_text_str = f"Enemies Remaining: {enemies_remaining}"
             remaining_color = WHITE
-            remaining_text = score_font.render(remaining_text_str, True, remaining_color)
+            remaining_text = render_text(score_font_size, remaining_text_str, remaining_color)
             remaining_rect = remaining_text.get_rect(topright=(screen_width - pause_button_area_width, int(40 * scale)))
-            surface.blit(remaining_text, remaining_rect)
+            blit_cached(surface, [(remaining_text, remaining_rect)])
 
         # Level Completion Message
         if self.level_complete_timer > 0:
             complete_font_size = int(48 * scale)
-            complete_font = load_font(complete_font_size) # Use helper
             next_level = game_state.current_level + 1
             
             if game_state.is_boss_level():
@@ -343,25 +425,15 @@ class PlayingScreen:
                 else:
                     alpha = int(255 * (1 - (self.level_complete_timer - 180) / 60))
             
-            # Create surfaces with alpha
-            complete_text = complete_font.render(msg, True, YELLOW)
-            complete_alpha = pygame.Surface(complete_text.get_size(), pygame.SRCALPHA)
-            complete_alpha.fill((255, 255, 255, alpha))
-            complete_text.blit(complete_alpha, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            
+            # The text is rendered once and faded with its alpha
+            complete_text = render_text(complete_font_size, msg, YELLOW)
             complete_rect = complete_text.get_rect(center=(screen_width // 2, screen_height // 2))
-            surface.blit(complete_text, complete_rect)
             
             # Draw subtitle message
             sub_font_size = int(24 * scale)
-            sub_font = load_font(sub_font_size)
-            sub_text = sub_font.render(sub_msg, True, LIGHT_GRAY)
-            sub_alpha = pygame.Surface(sub_text.get_size(), pygame.SRCALPHA)
-            sub_alpha.fill((255, 255, 255, alpha))
-            sub_text.blit(sub_alpha, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            
+            sub_text = render_text(sub_font_size, sub_msg, LIGHT_GRAY)
             sub_rect = sub_text.get_rect(center=(screen_width // 2, complete_rect.bottom + int(20 * scale)))
-            surface.blit(sub_text, sub_rect)
+            blit_cached(surface, [(complete_text, complete_rect), (sub_text, sub_rect)], alpha=alpha)
 
         # Draw damage flash
         if self.player:
@@ -374,80 +446,56 @@ class PlayingScreen:
             if self.notification_timer < NOTIFICATION_FADE_TIME:
                 alpha = int(255 * (self.notification_timer / NOTIFICATION_FADE_TIME))
             
-            # Ensure notification text is created
+            # Ensure notification text and its glow are created; both are faded with their alpha
             if not self.notification_text:
                 notification_font_size = int(20 * scale)
                 notification_font = load_font(notification_font_size)
                 self.notification_text = notification_font.render("Systems Override Ready! (Press O)", True, YELLOW)
                 self.notification_rect = self.notification_text.get_rect(
                     topright=(screen_width - int(20 * scale), int(70 * scale)))
-            
-            # Create a copy with adjusted alpha
-            text_surface = self.notification_text.copy()
-            # Create a surface with per pixel alpha
-            alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-            # Fill with color and alpha
-            alpha_surface.fill((255, 255, 255, alpha))
-            # Blit using the alpha surface as a mask
-            text_surface.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                self.notification_glow = create_surface((self.notification_rect.width + 10, self.notification_rect.height + 10), alpha=True)
+                pygame.draw.rect(self.notification_glow, YELLOW,
+                                 pygame.Rect(0, 0, self.notification_glow.get_width(), self.notification_glow.get_height()),
+                                 border_radius=5)
             
             # Draw notification with glow effect for visibility
-            glow_surface = pygame.Surface((self.notification_rect.width + 10, self.notification_rect.height + 10), 
-                                           pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (255, 255, 0, min(100, alpha // 2)), 
-                             pygame.Rect(0, 0, glow_surface.get_width(), glow_surface.get_height()), 
-                             border_radius=5)
-            glow_rect = glow_surface.get_rect(center=self.notification_rect.center)
-            surface.blit(glow_surface, glow_rect)
-            surface.blit(text_surface, self.notification_rect)
+            glow_rect = self.notification_glow.get_rect(center=self.notification_rect.center)
+            blit_cached(surface, [(self.notification_glow, glow_rect)], alpha=min(100, alpha // 2))
+            blit_cached(surface, [(self.notification_text, self.notification_rect)], alpha=alpha)
 
         # Handle game over state - Simplified check
         if self.game_over:
+            if not self.checkpoints.get(CHECKPOINT_LEVEL_START, self, game_state):
+                self.preload_level(game_state.current_level)  # Get a retry ready
             self.hide()  # Hide pause button
             game_state.score = self.score # Pass score before changing state
             game_state.change_state(STATE_GAME_OVER)
 
-    def spawn_enemy(self, game_state):
+    def spawn_enemy(self, game_state, enemy_type=None, x=None, y=-50):
         screen_width = self.screen.get_width()
-        
-        # Determine available enemy types based on current level
-        available_types = []
-        available_weights = []
-        
-        # Filter enemy types based on current level using ENEMY_LEVEL_PROGRESSION
-        for enemy_type, min_level in ENEMY_LEVEL_PROGRESSION.items():
-            if game_state.current_level >= min_level:
-                available_types.append(enemy_type)
-                
-                # Add corresponding weight from original weights list
-                if enemy_type in ENEMY_TYPES:
-                    index = ENEMY_TYPES.index(enemy_type)
-                    weight = ENEMY_SPAWN_WEIGHTS[index]
-                    
-                    # Adjust weights based on level progression
-                    # Lower-tier enemies become less common in higher levels
-                    level_difference = game_state.current_level - min_level
-                    if level_difference > 0:
-                        weight = max(0.1, weight - (level_difference * 0.1))
-                        
-                    available_weights.append(weight)
-                else:
-                    available_weights.append(0.1)  # Default weight if not found
-        
-        # If somehow no enemies are available, default to Swarmer
-        if not available_types:
-            available_types = ["Swarmer"]
-            available_weights = [1.0]
-            
-        # Normalize weights to sum to 1
-        weight_sum = sum(available_weights)
-        if weight_sum > 0:
-            available_weights = [w / weight_sum for w in available_weights]
-            
-        # Choose from available enemy types with their weights
-        enemy_type = random.choices(available_types, weights=available_weights)[0]
-        x = random.randint(50, screen_width - 50)
-        self.enemies.append(Enemy(x, -50, enemy_type))
+        # The level's spawn table holds the weights precomputed (see spawn_tables.py)
+        if enemy_type is None:
+            enemy_type = self.spawn_table.pick_type(random)
+        if x is None:
+            x = random.randint(50, screen_width - 50)
+        self.enemies.append(Enemy(x, y, enemy_type, self.timers))
+
+    def spawn_burst(self, game_state):
+        """Spawn the level's next burst group once enough enemies have been defeated"""
+        bursts = self.spawn_table.bursts
+        if self.next_burst >= len(bursts) or game_state.enemies_defeated_this_level < bursts[self.next_burst][0]:
+            return
+        _, enemy_type, count, formation = bursts[self.next_burst]
+        self.next_burst += 1
+        if formation is None:
+            for _ in range(count):
+                self.spawn_enemy(game_state, enemy_type)
+            return
+        # Members enter together in formation (MOVEMENT_PATHS) around a random leader position
+        screen_width = self.screen.get_width()
+        leader_x = random.randint(150, max(150, screen_width - 150))
+        for x, y in movement_paths[formation].positions(leader_x, -50, count):
+            self.spawn_enemy(game_state, enemy_type, x, y)
 
     def spawn_power_up(self, x=None, y=None):
         screen_width = self.screen.get_width()
@@ -459,55 +507,56 @@ class PlayingScreen:
         self.power_ups.append(PowerUp(x, y))
         
     def update(self, game_state):
-        if self.game_over or self.level_complete_timer > 0: # Pause updates during completion message
-            if self.level_complete_timer > 0:
-                self.level_complete_timer -= 1
-                if self.level_complete_timer == 0:
-                    if hasattr(game_state.game, 'change_state_with_transition'):
-                        game_state.game.change_state_with_transition(STATE_LEVEL_SELECT)
-                    else:
-                        game_state.change_state(STATE_LEVEL_SELECT)
+        # Run the cooldowns and timed effects that expire this frame
+        self.timers.tick()
+
+        if self.game_over or self.level_completing: # Pause updates during completion message
+            if self.level_completing and self.level_complete_timer == 0:
+                self.level_completing = False
+                if hasattr(game_state.game, 'change_state_with_transition'):
+                    game_state.game.change_state_with_transition(STATE_LEVEL_SELECT)
+                else:
+                    game_state.change_state(STATE_LEVEL_SELECT)
             return
 
         # Increment frame counter
         self.frame_count += 1
         
-        screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
 
-        # Update background
-        for star in self.stars:
-            star.update(screen_width, screen_height)
+        # Update background, thinning the stars when the quality governor asks for less detail
+        if self.stars:
+            self.stars.set_density(quality.detail)
+            self.stars.update()
         self.nebula.update(screen_height)
 
         # Update explosions
-        for explosion in self.explosions[:]:
-            explosion.update()
-            if explosion.is_finished():
-                self.explosions.remove(explosion)
+        with profile_stage(self.profiler, 'particles'):
+            for explosion in self.explosions[:]:
+                explosion.update()
+                if explosion.is_finished():
+                    self.explosions.remove(explosion)
                 
         # Handle all projectile collisions and explosions
-        self.handle_projectiles()
+        with profile_stage(self.profiler, 'collisions'):
+            self.handle_projectiles()
 
         # Update notification system
         if game_state.ability_kill_counter >= ABILITY_ENEMY_KILL_THRESHOLD and not self.notification_active:
             self.notification_active = True
             self.notification_timer = NOTIFICATION_DURATION
         
-        if self.notification_active:
-            self.notification_timer -= 1
-            if self.notification_timer <= 0:
-                self.notification_active = False
+        if self.notification_active and self.notification_timer <= 0:
+            self.notification_active = False
                 
         # Reset notification if abilities are not ready
         if game_state.ability_kill_counter < ABILITY_ENEMY_KILL_THRESHOLD:
             self.notification_active = False
 
-        # Update player (Check added for player existence)
+        # Update player (Check added for player existence); its cooldowns and ability run on the timer wheel
         if self.player:
             # Handle player input (movement and shooting)
             self.handle_player_input(game_state)
-            self.player.update()
             
         # Update player lasers
         for i, laser in enumerate(self.player_lasers[:]):
@@ -520,22 +569,22 @@ class PlayingScreen:
                 if i < len(self.player_lasers):
                     self.player_lasers.remove(laser)
 
-        # Update enemy projectiles
+        # Update enemy projectiles (movement paths are applied from their step tables)
+        advance_paths(self.enemy_projectiles)
         for projectile in self.enemy_projectiles[:]:
             projectile.update()
             if projectile.y > screen_height:
                 self.enemy_projectiles.remove(projectile)
         
         # Update enemies
+        advance_paths(self.enemies)
         for enemy in self.enemies[:]:
             enemy.update()
             enemy.is_hovered = False # Reset hover state
             
             # Enemy shooting
             if random.random() < 0.01:  # 1% chance to shoot per frame
-                projectile = self.create_enemy_projectile(enemy)
-                if projectile:
-                    self.enemy_projectiles.append(projectile)
+                self.create_enemy_projectile(enemy)
             
             # Enemy offscreen check
             if enemy.y > screen_height:
@@ -545,26 +594,18 @@ class PlayingScreen:
         if self.boss:
             self.boss.update()
             
-            # Boss shooting patterns
-            if self.boss.shoot_cooldown_laser <= 0:
-                self.boss.shoot_cooldown_laser = BOSS_SHOOT_COOLDOWN_LASER
-                # Create laser projectiles in a pattern
-                self.create_boss_projectiles()
-                
-            if self.boss.shoot_cooldown_plasma <= 0:
-                self.boss.shoot_cooldown_plasma = BOSS_SHOOT_COOLDOWN_PLASMA
-                # Create plasma projectiles in a different pattern
-                self.create_boss_plasma()
-                
-            self.boss.shoot_cooldown_laser -= 1
-            self.boss.shoot_cooldown_plasma -= 1
+            # Boss shooting patterns for the current phase
+            for pattern, x, y in self.boss.shoot():
+                self.emit_pattern(pattern, x, y)
         
         # Spawn enemies according to level
-        if not game_state.is_boss_level() and len(self.enemies) < game_state.get_max_enemies() and not game_state.check_level_complete():
-            self.enemy_spawn_timer -= 1
-            if self.enemy_spawn_timer <= 0:
-                self.spawn_enemy(game_state)
-                self.enemy_spawn_timer = ENEMY_SPAWN_RATE
+        if not game_state.is_boss_level() and not game_state.check_level_complete():
+            self.spawn_burst(game_state)
+            if len(self.enemies) < self.spawn_table.max_enemies:
+                self.enemy_spawn_timer -= 1
+                if self.enemy_spawn_timer <= 0:
+                    self.spawn_enemy(game_state)
+                    self.enemy_spawn_timer = self.spawn_table.get_interval(game_state.enemies_defeated_this_level)
         
         # Power-Up Spawning
         if self.player:  # Only spawn power-ups if player exists
@@ -581,7 +622,8 @@ class PlayingScreen:
                 self.power_ups.remove(power_up)
         
         # Update particles
-        self.update_particles()
+        with profile_stage(self.profiler, 'particles'):
+            self.update_particles()
                 
         # Check if we should spawn boss (for level 5)
         if game_state.is_boss_level() and not self.boss and not game_state.check_level_complete():
@@ -591,21 +633,39 @@ class PlayingScreen:
                 self.show_boss_intro = True
                 self.boss_intro_timer = 180 # Show for 3 seconds (60 FPS * 3)
                 
-        # Update boss intro timer
-        if self.show_boss_intro:
-            self.boss_intro_timer -= 1
-            if self.boss_intro_timer <= 0:
-                self.show_boss_intro = False
+        # Hide the boss intro once its timer runs out
+        if self.show_boss_intro and self.boss_intro_timer <= 0:
+            self.show_boss_intro = False
         
         # Check collisions
-        self.check_collisions(game_state)
+        with profile_stage(self.profiler, 'collisions'):
+            self.check_collisions(game_state)
+
+        # Drop surplus cosmetic effects before they are drawn
+        self.entity_budget.enforce(self)
+
+        # A new boss phase is a retry point
+        if (self.boss and not self.game_over and self.boss.attack_phase > 1 and
+                self.boss.attack_phase != self.checkpoint_phase):
+            self.capture_boss_phase(game_state)
         
         # Check for level completion
-        if game_state.check_level_complete() and self.level_complete_timer < 0:
-            self.level_complete_timer = 240  # Timer for showing completion message (4 seconds)
+        if game_state.check_level_complete() and not self.level_completing:
+            self.begin_level_complete(game_state, 240)  # Show completion message for 4 seconds
             
-    def create_explosion(self, x, y, size=1.0, color=None):
-        """Create an explosion effect at the given position"""
+    def begin_level_complete(self, game_state, duration):
+        """Show the "Mission Complete" banner and prepare the next mission behind it"""
+        self.level_completing = True
+        self.level_complete_timer = duration
+        self.preload_level(game_state.current_level + 1)
+
+    def create_explosion(self, x, y, size=1.0, color=None, priority=EFFECT_PRIORITY_KILL):
+        """Create an explosion effect at the given position (hit effects pass EFFECT_PRIORITY_HIT)"""
+        if priority == EFFECT_PRIORITY_HIT:
+            audio.play('hit')
+        else:
+            audio.play('explosion_large' if size >= 2.0 else 'explosion')
+
         if not ANIMATION_ENABLED:
             return
             
@@ -613,12 +673,12 @@ class PlayingScreen:
             color = (255, 150, 50)  # Default orange explosion
             
         # Create an Explosion object and add it to explosions list
-        explosion = Explosion(x, y, size * 20, duration=30, color=color)
+        explosion = Explosion(x, y, size * 20, duration=30, color=color, detail=quality.detail, priority=priority)
         self.explosions.append(explosion)
         
         # Still create particles for additional effect if wanted
         # Create multiple particles for the explosion
-        num_particles = int(20 * size)
+        num_particles = quality.scale(int(20 * size))
         for _ in range(num_particles):
             angle = random.uniform(0, math.pi * 2)
             speed = random.uniform(1, 3) * size
@@ -661,7 +721,7 @@ class PlayingScreen:
             if ANIMATION_ENABLED:
                 # Create a surface with per-pixel alpha for the particle
                 size = int(particle['size'] * 2)  # Diameter
-                particle_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+                particle_surface = create_surface((size, size), alpha=True)
                 pygame.draw.circle(
                     particle_surface, 
                     color, 
@@ -676,7 +736,7 @@ class PlayingScreen:
             return
             
         # Create a few particles for the trail effect
-        for _ in range(3):
+        for _ in range(quality.scale(3)):
             offset_x = random.uniform(-2, 2)
             offset_y = random.uniform(5, 10)
             
@@ -703,7 +763,7 @@ class PlayingScreen:
                     
                     # Create hit effect
                     if ANIMATION_ENABLED:
-                        self.create_explosion(laser.x, laser.y, 0.5, (255, 100, 100))
+                        self.create_explosion(laser.x, laser.y, 0.5, (255, 100, 100), EFFECT_PRIORITY_HIT)
                     
                     if not laser.piercing:
                         try:
@@ -715,6 +775,7 @@ class PlayingScreen:
                         # Large explosion for boss defeat
                         self.create_explosion(self.boss.x, self.boss.y, 3.0, (255, 200, 50))
                         self.score += 1000 # Boss bonus score
+                        self.kills += 1
                         game_state.score = self.score # Update final score in game_state
                         game_state.boss_defeated = True # Ensure this is set
                         # Don't complete level here, transition to victory screen
@@ -738,7 +799,7 @@ class PlayingScreen:
                     
                     # Create small hit effect
                     if ANIMATION_ENABLED:
-                        self.create_explosion(laser.x, laser.y, 0.3, (200, 200, 255))
+                        self.create_explosion(laser.x, laser.y, 0.3, (200, 200, 255), EFFECT_PRIORITY_HIT)
                     
                     laser_removed = False
                     if not laser.piercing:
@@ -754,12 +815,13 @@ class PlayingScreen:
                         self.create_explosion(enemy.x, enemy.y, 1.0)
                         self.enemies.remove(enemy)
                         self.score += 10
+                        self.kills += 1
                         game_state.record_enemy_defeat()
                         if random.random() < POWER_UP_CHANCE:
                             self.spawn_power_up(enemy.x, enemy.y)
                         if not game_state.is_boss_level() and game_state.check_level_complete():
                             game_state.complete_current_level()
-                            self.level_complete_timer = 180
+                            self.begin_level_complete(game_state, 180)
                     
                     if laser_removed:
                         break # Laser hit an enemy and was removed, stop checking this laser
@@ -775,7 +837,7 @@ class PlayingScreen:
                     
                     # Create small hit effect
                     if ANIMATION_ENABLED and random.random() < 0.5:
-                        self.create_explosion(laser.x, laser.y, 0.2, (150, 150, 255))
+                        self.create_explosion(laser.x, laser.y, 0.2, (150, 150, 255), EFFECT_PRIORITY_HIT)
                     
                     laser_removed = False
                     if not laser.piercing:
@@ -790,7 +852,7 @@ class PlayingScreen:
                             self.enemy_projectiles.remove(projectile)
                             # Create small explosion for projectile destruction
                             if ANIMATION_ENABLED:
-                                self.create_explosion(projectile.x, projectile.y, 0.5, (100, 100, 255))
+                                self.create_explosion(projectile.x, projectile.y, 0.5, (100, 100, 255), EFFECT_PRIORITY_HIT)
                         except ValueError: 
                             pass # Already removed
 
@@ -846,7 +908,7 @@ class PlayingScreen:
                     # Check for level completion after this defeat
                     if not game_state.is_boss_level() and game_state.check_level_complete():
                         game_state.complete_current_level()
-                        self.level_complete_timer = 180
+                        self.begin_level_complete(game_state, 180)
                     
                     # Set game_over flag if player health depleted
                     if player_killed:
@@ -889,15 +951,12 @@ class PlayingScreen:
             if event.key == pygame.K_SPACE and not self.game_over:
                 new_lasers = self.player.shoot()
                 if new_lasers:  # Only play sound if lasers were actually created
-                    pygame.mixer.Sound.play(game_state.game.shoot_sound)
+                    self.play_shoot_sound(game_state.game)
                 self.player_lasers.extend(new_lasers)
             elif event.key == pygame.K_o and not self.game_over:
                 # Only open ability selection if abilities are ready
-                if game_state.ability_kill_counter >= ABILITY_ENEMY_KILL_THRESHOLD:
-                    self.hide()
-                    game_state.change_state(STATE_ABILITY_SELECT)
-                    self.notification_active = False
-                    self.notification_timer = 0
+                if game_state.can_use_ability():
+                    self.open_ability_select(game_state)
                     return True
         elif event.type == pygame.MOUSEMOTION and not self.game_over:
             # Check for enemy hover
@@ -908,142 +967,29 @@ class PlayingScreen:
                     enemy.is_hovered = True
         return True 
 
-    def create_boss_projectiles(self):
-        """Create a pattern of laser projectiles from the boss"""
-        if not self.boss:
-            return
-            
-        # Create a spread of lasers
-        num_lasers = 5
-        angle_spread = 30  # Total spread in degrees
-        start_angle = 90 - angle_spread/2
-        
-        for i in range(num_lasers):
-            angle = start_angle + (angle_spread / (num_lasers-1)) * i
-            projectile = EnemyProjectile(
-                self.boss.x, 
-                self.boss.y + self.boss.height//2,
-                angle,
-                "laser",
-                damage=1,
-                speed=7
-            )
-            self.enemy_projectiles.append(projectile)
-            
-            # Add visual effect for laser creation
-            if ANIMATION_ENABLED:
-                self.create_explosion(
-                    self.boss.x, 
-                    self.boss.y + self.boss.height//2,
-                    0.3,
-                    (255, 50, 50)
-                )
-            
-    def create_boss_plasma(self):
-        """Create homing plasma projectiles from the boss"""
-        if not self.boss or not self.player:
-            return
-            
-        # Calculate angle to player
-        dx = self.player.x - self.boss.x
-        dy = self.player.y - self.boss.y
-        angle = math.degrees(math.atan2(dy, dx)) - 90  # Adjust by 90 to match our angle system
-        
-        # Create a large plasma projectile
-        projectile = EnemyProjectile(
-            self.boss.x, 
-            self.boss.y + self.boss.height//2,
-            angle,
-            "plasma",
-            damage=2,
-            speed=4,
-            width=15,
-            height=15,
-            health=3
-        )
-        self.enemy_projectiles.append(projectile)
-        
-        # Add visual effect for plasma creation
-        if ANIMATION_ENABLED:
-            self.create_explosion(
-                self.boss.x, 
-                self.boss.y + self.boss.height//2,
-                1.0,
-                (255, 100, 255)
-            )
-            
+    def emit_pattern(self, name, x, y):
+        """Fire one volley of a bullet pattern from (x, y) straight into enemy_projectiles"""
+        pattern = bullet_patterns[name]
+        target = (self.player.x, self.player.y) if self.player else None
+        volley = self.pattern_volleys.get(name, 0)
+        self.pattern_volleys[name] = volley + 1
+        pattern.emit(self.enemy_projectiles, x, y, target, self.screen.get_width(), volley)
+
+        # Muzzle flash
+        if pattern.flash and ANIMATION_ENABLED:
+            size, color = pattern.flash
+            self.create_explosion(x, y, size, color, EFFECT_PRIORITY_HIT)
+
     def create_enemy_projectile(self, enemy):
-        """Create a projectile from an enemy"""
-        # Calculate firing angle (straight down)
-        angle = 90
-        
-        # Different enemies have different projectiles
-        if enemy.type == "Swarmer":
-            # Swarmers fire small, fast projectiles
-            return EnemyProjectile(
-                enemy.x, 
-                enemy.y + enemy.height//2,
-                angle,
-                "bullet",
-                damage=1,
-                speed=6
-            )
-        elif enemy.type == "Striker":
-            # Strikers fire medium projectiles
-            return EnemyProjectile(
-                enemy.x, 
-                enemy.y + enemy.height//2,
-                angle,
-                "plasma",
-                damage=1,
-                speed=5,
-                width=10,
-                height=10
-            )
-        elif enemy.type == "Destroyer":
-            # Destroyers fire large, slow projectiles
-            return EnemyProjectile(
-                enemy.x, 
-                enemy.y + enemy.height//2,
-                angle,
-                "plasma",
-                damage=2,
-                speed=3,
-                width=15,
-                height=15,
-                health=2
-            )
-        elif enemy.type == "Harvester":
-            # Harvesters fire medium, spreading projectiles
-            angle_offset = random.uniform(-15, 15)
-            return EnemyProjectile(
-                enemy.x, 
-                enemy.y + enemy.height//2,
-                angle + angle_offset,
-                "bullet",
-                damage=1,
-                speed=4
-            )
-        elif enemy.type == "SporeLauncher":
-            # SporeLaunchers fire slow, large spore projectiles
-            return EnemyProjectile(
-                enemy.x, 
-                enemy.y + enemy.height//2,
-                angle,
-                "spore",
-                damage=1,
-                speed=2,
-                width=20,
-                height=20,
-                health=1
-            )
-            
-        return None 
+        """Fire an enemy's bullet pattern (ENEMY_PATTERNS)"""
+        pattern = ENEMY_PATTERNS.get(enemy.type)
+        if pattern:
+            self.emit_pattern(pattern, enemy.x, enemy.y + enemy.height//2)
 
-    def generate_background(self, level, width, height):
-        """Generate a procedural background based on the level"""
+    def generate_background(self, level, width, height, rng=random, templates=None):
+        """Generate a procedural background based on the level (templates: see utils.create_surface)"""
         # Create a base surface for the background
-        bg_surface = pygame.Surface((width, height))
+        bg_surface = create_surface((width, height), templates=templates)
         
         # Choose color scheme based on level
         if level == 1:  # Blue nebula theme
@@ -1072,23 +1018,23 @@ class PlayingScreen:
         # Level 1: Circles
         if level == 1:
             for _ in range(20):
-                x = random.randint(0, width)
-                y = random.randint(0, height)
-                radius = random.randint(50, 200)
-                color = random.choice(shape_colors)
+                x = rng.randint(0, width)
+                y = rng.randint(0, height)
+                radius = rng.randint(50, 200)
+                color = rng.choice(shape_colors)
                 # Apply transparency to the circle
-                circle_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                alpha = random.randint(30, 80)
+                circle_surface = create_surface((radius * 2, radius * 2), alpha=True, templates=templates)
+                alpha = rng.randint(30, 80)
                 pygame.draw.circle(circle_surface, color + (alpha,), (radius, radius), radius)
                 bg_surface.blit(circle_surface, (x - radius, y - radius))
                 
         # Level 2: Swirls (approximated with circles)
         elif level == 2:
             for i in range(5):
-                center_x = random.randint(width // 4, 3 * width // 4)
-                center_y = random.randint(height // 4, 3 * height // 4)
-                max_radius = random.randint(100, 300)
-                color = random.choice(shape_colors)
+                center_x = rng.randint(width // 4, 3 * width // 4)
+                center_y = rng.randint(height // 4, 3 * height // 4)
+                max_radius = rng.randint(100, 300)
+                color = rng.choice(shape_colors)
                 
                 # Create a spiral effect with circles
                 for j in range(15):
@@ -1098,9 +1044,9 @@ class PlayingScreen:
                         break
                     x = center_x + int(math.cos(angle) * radius)
                     y = center_y + int(math.sin(angle) * radius)
-                    alpha = random.randint(40, 90)
+                    alpha = rng.randint(40, 90)
                     
-                    circle_surface = pygame.Surface((radius, radius), pygame.SRCALPHA)
+                    circle_surface = create_surface((radius, radius), alpha=True, templates=templates)
                     pygame.draw.circle(circle_surface, color + (alpha,), (radius // 2, radius // 2), radius // 2)
                     bg_surface.blit(circle_surface, (x - radius // 2, y - radius // 2))
                     
@@ -1110,25 +1056,25 @@ class PlayingScreen:
             line_thickness = 2
             for x in range(0, width, grid_size):
                 for y in range(0, height, grid_size):
-                    color = random.choice(shape_colors)
-                    alpha = random.randint(20, 60)
+                    color = rng.choice(shape_colors)
+                    alpha = rng.randint(20, 60)
                     pygame.draw.rect(bg_surface, color + (alpha,), 
                                      pygame.Rect(x, y, grid_size, grid_size), line_thickness)
                     
         # Level 4: Diagonal lines
         elif level == 4:
             for _ in range(30):
-                start_x = random.randint(-width // 2, width)
-                start_y = random.randint(-height // 2, height)
-                length = random.randint(300, 800)
-                thickness = random.randint(2, 8)
-                color = random.choice(shape_colors)
-                alpha = random.randint(30, 70)
+                start_x = rng.randint(-width // 2, width)
+                start_y = rng.randint(-height // 2, height)
+                length = rng.randint(300, 800)
+                thickness = rng.randint(2, 8)
+                color = rng.choice(shape_colors)
+                alpha = rng.randint(30, 70)
                 
                 end_x = start_x + length
                 end_y = start_y + length
                 
-                line_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+                line_surface = create_surface((width, height), alpha=True, templates=templates)
                 pygame.draw.line(line_surface, color + (alpha,), (start_x, start_y), (end_x, end_y), thickness)
                 bg_surface.blit(line_surface, (0, 0))
                 
@@ -1136,22 +1082,22 @@ class PlayingScreen:
         elif level == 5:
             for _ in range(15):
                 points = []
-                center_x = random.randint(0, width)
-                center_y = random.randint(0, height)
+                center_x = rng.randint(0, width)
+                center_y = rng.randint(0, height)
                 
                 # Generate triangle points
-                size = random.randint(100, 350)
+                size = rng.randint(100, 350)
                 for i in range(3):
-                    angle = i * (2*math.pi/3) + random.uniform(0, 0.5)
+                    angle = i * (2*math.pi/3) + rng.uniform(0, 0.5)
                     x = center_x + int(math.cos(angle) * size)
                     y = center_y + int(math.sin(angle) * size)
                     points.append((x, y))
                 
-                color = random.choice(shape_colors)
-                alpha = random.randint(30, 90)
+                color = rng.choice(shape_colors)
+                alpha = rng.randint(30, 90)
                 
                 # Draw the triangle with alpha
-                triangle_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+                triangle_surface = create_surface((width, height), alpha=True, templates=templates)
                 pygame.draw.polygon(triangle_surface, color + (alpha,), points)
                 bg_surface.blit(triangle_surface, (0, 0))
                 
@@ -1181,8 +1127,9 @@ class PlayingScreen:
                         self.enemies.remove(enemy)
                         # Add to score
                         self.score += 100
+                        self.kills += 1
                     # Create small explosion for projectile
-                    small_explosion = Explosion(proj.x, proj.y, 20)
+                    small_explosion = Explosion(proj.x, proj.y, 20, priority=EFFECT_PRIORITY_HIT)
                     new_explosions.append(small_explosion)
                     if proj in self.player_lasers:
                         self.player_lasers.remove(proj)
@@ -1193,7 +1140,7 @@ class PlayingScreen:
                 # Damage boss
                 self.boss.take_damage(proj.damage)
                 # Create small explosion for projectile
-                explosion = Explosion(proj.x, proj.y, 20)
+                explosion = Explosion(proj.x, proj.y, 20, priority=EFFECT_PRIORITY_HIT)
                 new_explosions.append(explosion)
                 if proj in self.player_lasers:
                     self.player_lasers.remove(proj)
@@ -1204,6 +1151,7 @@ class PlayingScreen:
                     self.player_lasers.remove(proj)
         
         # Update and check enemy projectiles
+        advance_paths(self.enemy_projectiles)
         for proj in self.enemy_projectiles[:]:
             proj.update()
             
@@ -1237,10 +1185,11 @@ class PlayingScreen:
             if proj.type == "mine":
                 # Make mines hover in place after reaching a certain Y position
                 if proj.y > self.height * 0.6:
-                    proj.speed = 0
+                    proj.stop()
                     # Mines pulse to alert player
                     if random.random() < 0.05:  # 5% chance each frame
-                        mine_pulse = Explosion(proj.x, proj.y, 15, duration=20, color=(255, 100, 0))
+                        mine_pulse = Explosion(proj.x, proj.y, 15, duration=20, color=(255, 100, 0),
+                                               priority=EFFECT_PRIORITY_HIT)
                         new_explosions.append(mine_pulse)
             
             # Remove if off screen
@@ -1292,7 +1241,8 @@ class PlayingScreen:
                     if self.frame_count % 5 == 0:  # Every 5 frames
                         self.player.take_damage(1)
                         # Small explosion effect
-                        hit_effect = Explosion(self.player.x, self.player.y, 15, duration=10, color=(255, 50, 0))
+                        hit_effect = Explosion(self.player.x, self.player.y, 15, duration=10, color=(255, 50, 0),
+                                               priority=EFFECT_PRIORITY_HIT)
                         self.explosions.append(hit_effect)
 
     def check_collision(self, proj, obj):
@@ -1313,7 +1263,7 @@ class PlayingScreen:
     def spawn_boss(self):
         """Create the boss enemy for the boss level"""
         screen_width = self.screen.get_width()
-        self.boss = BossEnemy(screen_width)
+        self.boss = BossEnemy(screen_width, self.timers)
         # Add dramatic effect
         for _ in range(5):
             explosion = Explosion(
@@ -1329,29 +1279,21 @@ class PlayingScreen:
         if not self.player:
             return
             
-        # Get pressed keys
-        keys = pygame.key.get_pressed()
+        # Controls come from the keyboard unless a controller (bot, script) is attached
+        if self.input_controller:
+            move_x, move_y, fire, use_ability = self.input_controller.get_controls(self, game_state)
+        else:
+            move_x, move_y, fire, use_ability = self.read_keyboard_controls()
         
         # Get screen dimensions
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
-        
-        # Handle movement with either WASD or Arrow keys
-        dx, dy = 0, 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            dx -= self.player.speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dx += self.player.speed
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            dy -= self.player.speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            dy += self.player.speed
             
         # Move the player
-        self.player.move(dx, dy, screen_width, screen_height)
+        self.player.move(move_x * self.player.speed, move_y * self.player.speed, screen_width, screen_height)
             
         # Check for rapid fire debug mode - only when DEBUG_MODE is enabled
-        if DEBUG_MODE and hasattr(game_state.game, 'debug_menu') and game_state.game.debug_menu.rapid_fire and keys[pygame.K_SPACE]:
+        if DEBUG_MODE and hasattr(game_state.game, 'debug_menu') and game_state.game.debug_menu.rapid_fire and fire:
             # Extreme rapid fire - shoot multiple bullets per frame when holding space
             # This simulates around 10 bullets per second (at 60 FPS)
             for _ in range(3):  # Shoot 3 bullets each frame (3 * 60 FPS / 20 frames = ~9 bullets per second)
@@ -1361,12 +1303,38 @@ class PlayingScreen:
                     self.player.shoot_cooldown = 0
         else:
             # Normal firing with spacebar (with cooldown)
-            if keys[pygame.K_SPACE] and self.player.shoot_cooldown <= 0:
+            if fire and self.player.shoot_cooldown <= 0:
                 self.fire_player_laser(game_state.game)
                 
-        # Handle special ability with O key
-        if keys[pygame.K_o] and self.player.ability_meter >= self.player.ability_meter_max:
-            self.activate_player_ability(game_state)
+        # Open the ability selection screen once enough enemies were defeated
+        if use_ability and game_state.can_use_ability():
+            self.open_ability_select(game_state)
+
+    def read_keyboard_controls(self):
+        """Return (move_x, move_y, fire, use_ability) from the keyboard.
+
+        The O key is handled as a key press in handle_event, so it is not read here.
+        """
+        keys = pygame.key.get_pressed()
+        
+        # Handle movement with either WASD or Arrow keys
+        move_x, move_y = 0, 0
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            move_x -= 1
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            move_x += 1
+        if keys[pygame.K_UP] or keys[pygame.K_w]:
+            move_y -= 1
+        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            move_y += 1
+        return move_x, move_y, keys[pygame.K_SPACE], False
+
+    def open_ability_select(self, game_state):
+        """Leave play for the ability selection screen"""
+        self.hide()
+        game_state.change_state(STATE_ABILITY_SELECT)
+        self.notification_active = False
+        self.notification_timer = 0
             
     def fire_player_laser(self, game):
         """Create laser projectiles from the player's ship"""
@@ -1376,5 +1344,10 @@ class PlayingScreen:
         # Get lasers from player's shoot method
         new_lasers = self.player.shoot()
         if new_lasers:  # Only play sound if lasers were actually created
-            pygame.mixer.Sound.play(game.shoot_sound)
-            self.player_lasers.extend(new_lasers) 
\ No newline at end of file
+            self.play_shoot_sound(game)
+            self.player_lasers.extend(new_lasers)
+
+    def play_shoot_sound(self, game):
+        # Headless runs have no game instance and no sound loaded
+        if hasattr(game, 'audio'):
+            game.audio.play('shoot') 
\ No newline at end of file
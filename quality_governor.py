@@ -0,0 +1,68 @@
+from collections import deque
+from constants import *
+
+class QualityGovernor:
+    """Scales optional effects to keep gameplay frames inside the frame budget.
+
+    The main loop reports the work time of every gameplay frame. Once a full
+    window of QUALITY_SAMPLE_FRAMES has been collected, an average above the
+    downgrade threshold drops one quality level straight away, while raising
+    the level needs an average well below budget and QUALITY_UPGRADE_DELAY
+    quiet frames since the last change, so the level does not flap around the
+    threshold. Effect code asks for counts through scale() and detail.
+
+    Nothing reports frame times in headless runs, so they stay at full
+    quality and seeded runs remain reproducible.
+    """
+
+    def __init__(self):
+        self.enabled = QUALITY_GOVERNOR_ENABLED
+        self.level_index = 0
+        self.frame_times = deque(maxlen=QUALITY_SAMPLE_FRAMES)
+        self.frames_since_change = 0
+
+    @property
+    def detail(self):
+        """Effect detail multiplier for the current level, 1.0 at full quality"""
+        return QUALITY_LEVELS[self.level_index]
+
+    def scale(self, count):
+        """Number of particles (or similar) to create instead of count"""
+        if self.level_index == 0:
+            return count
+        return int(count * self.detail)
+
+    def record_frame(self, work_ms):
+        """Feed one frame's work time; returns True if the quality level changed"""
+        if not self.enabled:
+            return False
+        self.frame_times.append(work_ms)
+        self.frames_since_change += 1
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        average = sum(self.frame_times) / len(self.frame_times)
+        if average > QUALITY_FRAME_BUDGET_MS * QUALITY_DOWNGRADE_RATIO:
+            if self.level_index < len(QUALITY_LEVELS) - 1:
+                self.set_level(self.level_index + 1)
+                return True
+        elif (average < QUALITY_FRAME_BUDGET_MS * QUALITY_UPGRADE_RATIO and
+              self.frames_since_change >= QUALITY_UPGRADE_DELAY):
+            if self.level_index > 0:
+                self.set_level(self.level_index - 1)
+                return True
+        return False
+
+    def set_level(self, level_index):
+        self.level_index = level_index
+        self.frames_since_change = 0
+        # Judge the new level on its own frames
+        self.frame_times.clear()
+
+    def reset(self):
+        """Back to full quality"""
+        self.set_level(0)
+
+
+# Shared by the main loop (which feeds it) and the screens that create effects
+quality = QualityGovernor()
@@ -0,0 +1,296 @@
+import os
+import weakref
+import pygame
+from constants import *
+from utils import create_surface
+
+# SDL_BlendMode values, as accepted by Texture.blend_mode and Renderer.draw_blend_mode
+BLENDMODE_NONE = 0
+BLENDMODE_BLEND = 1
+BLENDMODE_ADD = 2
+
+
+class SurfaceBackend:
+    """Current path: everything is blitted into the display surface, then flipped.
+
+    With a render size the display is opened with pygame.SCALED at that
+    logical size and SDL stretches it to the window. Debug builds draw into an
+    off-screen frame from create_surface, so blits onto it are audited for
+    slow source formats, and copy it to the display on present.
+    """
+    name = 'surface'
+
+    def __init__(self, render_size=None):
+        self.render_size = render_size
+        self.screen = None  # The display surface
+        self.frame = None  # What screens draw into: the display itself outside debug builds
+
+    @property
+    def scales_to_window(self):
+        """True when window size changes are absorbed by scaling instead of resizing the frame"""
+        return bool(self.render_size)
+
+    def open(self, size, fullscreen=False):
+        """Create the display and return the surface frames are drawn into"""
+        if not self.render_size:
+            self.screen = pygame.display.set_mode(size, pygame.FULLSCREEN if fullscreen else pygame.RESIZABLE)
+        else:
+            os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "linear" if RENDER_SCALE_SMOOTH else "nearest")
+            flags = pygame.SCALED | (pygame.FULLSCREEN if fullscreen else pygame.RESIZABLE)
+            self.screen = pygame.display.set_mode(self.render_size, flags)
+        self.frame = create_surface(self.screen.get_size()) if DEBUG_MODE else self.screen
+        return self.frame
+
+    def is_fullscreen(self):
+        return bool(self.screen.get_flags() & pygame.FULLSCREEN)
+
+    def toggle_fullscreen(self):
+        pygame.display.toggle_fullscreen()
+
+    def fill_rect(self, rect, color):
+        self.frame.fill(color, rect)
+
+    def draw_cached(self, surface, pos, alpha=255, additive=False):
+        """Draw a surface that does not change between frames (sprites, backgrounds, text)"""
+        if additive:
+            self.frame.blit(surface, pos, special_flags=pygame.BLEND_ADD)
+            return
+        surface.set_alpha(alpha if alpha < 255 else None)
+        self.frame.blit(surface, pos)
+
+    def present(self):
+        if self.frame is not self.screen:
+            self.screen.blit(self.frame, (0, 0))
+        pygame.display.flip()
+
+    def clear(self):
+        """Throw away the frame drawn so far"""
+        self.frame.fill(BLACK)
+
+    def capture(self):
+        """Copy of the finished frame before it is presented, for comparing backends"""
+        return self.frame.copy()
+
+
+class TextureFrame(pygame.Surface):
+    """The surface screens draw into on TextureBackend.
+
+    Software drawing lands in its pixels as on any frame, over a transparent
+    background, and is uploaded as one layer per frame. draw_cached() draws
+    surfaces from textures instead: backgrounds straight away, under that
+    layer, and everything else queued over it. Filling the whole frame starts
+    it over in that color, and copy() reads the composed frame back, textures
+    included.
+    """
+    backend = None
+
+    def fill(self, color, rect=None, special_flags=0):
+        if rect is None and not special_flags:
+            self.backend.clear_to(color)
+            return self.erase()
+        return super().fill(color, rect, special_flags)
+
+    def erase(self):
+        """Make every pixel transparent again"""
+        return super().fill((0, 0, 0, 0))
+
+    def draw_cached(self, blit_sequence, alpha=None, background=False):
+        draw = self.backend.draw_texture if background else self.backend.queue_texture
+        for source, dest in blit_sequence:
+            if alpha is None:
+                source_alpha = source.get_alpha()
+                draw(source, dest, 255 if source_alpha is None else source_alpha, BLENDMODE_BLEND)
+            else:
+                draw(source, dest, alpha, BLENDMODE_BLEND)
+
+    def copy(self):
+        return self.backend.capture()
+
+
+class TextureBackend:
+    """SDL2 Renderer backend built on pygame._sdl2.video.
+
+    Surfaces that do not change between frames (backgrounds, star and glow
+    sprites, cached text; see blit_cached) are uploaded once and drawn as
+    textured quads with alpha or additive blending. Everything else is drawn
+    in software into the TextureFrame, which is uploaded once per frame into
+    a streaming texture between the background quads and the overlay quads.
+    The frame is composed in a target texture, which keeps the last presented
+    frame for copy() until drawing starts again, and the target is scaled to
+    the window on present.
+
+    software=True asks SDL for its software renderer, which produces the same
+    pixels as SurfaceBackend (up to blend rounding, see renderer_check.py)
+    and needs no GPU.
+    """
+    name = 'texture'
+    scales_to_window = True
+
+    def __init__(self, render_size=None, software=False):
+        from pygame._sdl2.video import Window, Renderer
+
+        self.render_size = render_size
+        # Surface.convert() needs a display mode to take its pixel format from
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = Window("Starfall: The Kryll Invasion", size=render_size or (DEFAULT_WIDTH, DEFAULT_HEIGHT),
+                             resizable=True)
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1)
+        self.fullscreen = False
+        self.frame = None
+        self.target = None  # Texture the frame is composed in
+        self.layer = None  # Streaming texture the software-drawn frame is uploaded to
+        self.overlays = []  # (surface, pos, alpha, blend mode) or (None, rect, color, None), drawn over the layer
+        self.presented = True  # The target still holds the last presented frame
+        self.textures = weakref.WeakKeyDictionary()  # Surface -> Texture, dropped with the surface
+
+    def open(self, size, fullscreen=False):
+        """Create the frame surface (the window itself is created once)"""
+        size = self.render_size or size
+        if fullscreen:
+            self.window.set_fullscreen(desktop=True)
+        else:
+            self.window.size = size
+        self.fullscreen = fullscreen
+        if self.frame is None or self.frame.get_size() != size:
+            from pygame._sdl2.video import Texture
+            self.frame = TextureFrame(size, pygame.SRCALPHA, 32)
+            self.frame.backend = self
+            self.target = Texture(self.renderer, size, target=True)
+            self.target.blend_mode = BLENDMODE_NONE
+            self.layer = Texture(self.renderer, size, streaming=True)
+            self.layer.blend_mode = BLENDMODE_BLEND
+            self.renderer.target = None
+            self.renderer.logical_size = size
+            self.overlays = []
+            self.presented = True
+        return self.frame
+
+    def is_fullscreen(self):
+        return self.fullscreen
+
+    def toggle_fullscreen(self):
+        if self.fullscreen:
+            self.window.set_windowed()
+        else:
+            self.window.set_fullscreen(desktop=True)
+        self.fullscreen = not self.fullscreen
+
+    def get_texture(self, surface):
+        """Texture for a surface, uploaded on first use"""
+        texture = self.textures.get(surface)
+        if texture is None:
+            from pygame._sdl2.video import Texture
+            texture = Texture.from_surface(self.renderer, surface)
+            self.textures[surface] = texture
+        return texture
+
+    def begin(self):
+        """Start composing a new frame in the target, once the last one has been presented"""
+        if self.presented:
+            self.clear_to(BLACK)
+
+    def clear_to(self, color):
+        """Start the frame over in a solid color, dropping the queued overlays"""
+        self.renderer.target = self.target
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.clear()
+        self.overlays = []
+        self.presented = False
+
+    def compose(self):
+        """Draw the software layer and the overlays queued over it into the target"""
+        self.begin()
+        self.layer.update(self.frame)
+        self.layer.draw()
+        self.frame.erase()
+        for surface, pos, alpha, blend_mode in self.overlays:
+            if surface is None:
+                self.renderer.draw_blend_mode = BLENDMODE_NONE
+                self.renderer.draw_color = pygame.Color(alpha)
+                self.renderer.fill_rect(pygame.Rect(pos))
+            else:
+                self.draw_texture(surface, pos, alpha, blend_mode)
+        self.overlays = []
+
+    def draw_texture(self, surface, pos, alpha, blend_mode):
+        """Draw a surface's texture into the target now, under the software layer"""
+        self.begin()
+        texture = self.get_texture(surface)
+        texture.blend_mode = blend_mode
+        texture.alpha = alpha
+        texture.draw(dstrect=pygame.Rect(pos[0], pos[1], *surface.get_size()))
+
+    def queue_texture(self, surface, pos, alpha, blend_mode):
+        """Draw a surface's texture over the software layer when the frame is composed"""
+        self.overlays.append((surface, pos, alpha, blend_mode))
+
+    def fill_rect(self, rect, color):
+        self.overlays.append((None, rect, color, None))
+
+    def draw_cached(self, surface, pos, alpha=255, additive=False):
+        """Draw a cached surface as a textured quad over everything drawn so far"""
+        self.queue_texture(surface, pos, alpha, BLENDMODE_ADD if additive else BLENDMODE_BLEND)
+
+    def clear(self):
+        """Throw away the frame drawn so far"""
+        self.frame.erase()
+        self.overlays = []
+        self.presented = True
+
+    def present(self):
+        self.compose()
+        renderer = self.renderer
+        renderer.target = None
+        renderer.draw_color = (*BLACK, 255)
+        renderer.clear()
+        self.target.draw()
+        renderer.present()
+        self.presented = True
+
+    def capture(self):
+        """Read back the frame composed so far (the last presented one if drawing has not started)"""
+        if not self.presented:
+            self.compose()
+        self.renderer.target = self.target
+        return self.renderer.to_surface()
+
+
+def create_backend(name=RENDER_BACKEND, render_size=None):
+    """Build the named backend ('surface', 'texture' or 'software'), falling back to SurfaceBackend"""
+    if name in ('texture', 'software'):
+        try:
+            return TextureBackend(render_size, software=(name == 'software'))
+        except (ImportError, pygame.error) as e:
+            print(f"Warning: {name} renderer unavailable ({e}). Using surface blits.")
+    return SurfaceBackend(render_size)
+
+
+def blit_cached(surface, blit_sequence, alpha=None, background=False):
+    """Blit (source, dest) pairs whose sources are not drawn onto once they have been blitted.
+
+    Backgrounds, sprites and text go through here: on TextureBackend's frame
+    each source is uploaded once and drawn as a texture for as long as it
+    lives, anywhere else (including off-screen surfaces) this is
+    surface.blits. alpha (0-255) fades every source, in place of its own
+    surface alpha, without touching its pixels. Textures go over everything
+    drawn in software this frame, or under it with background=True, so
+    backgrounds must only cover other backgrounds and the rest must not be
+    drawn over in software.
+    """
+    if isinstance(surface, TextureFrame):
+        surface.draw_cached(blit_sequence, alpha, background)
+    elif alpha is None:
+        surface.blits(blit_sequence, doreturn=False)
+    else:
+        for source, dest in blit_sequence:
+            source.set_alpha(alpha)
+            surface.blit(source, dest)
+            source.set_alpha(None)
+
+
+def fill_rect(surface, rect, color):
+    """Fill a rect of an opaque color in drawing order with blit_cached, over software drawing on TextureBackend"""
+    if isinstance(surface, TextureFrame):
+        surface.backend.fill_rect(rect, color)
+    else:
+        surface.fill(color, rect)
@@ -0,0 +1,111 @@
+"""Compare the texture renderer with plain surface blits, frame by frame.
+
+Example:
+    python renderer_check.py --frames 3600 --every 30
+
+The autopilot plays the headless game on TextureBackend with SDL's software
+renderer. Every few frames the current screen is drawn twice, into a plain
+surface the way SurfaceBackend draws it and into the backend's frame, and
+TextureBackend.capture() is compared with the plain surface. SDL and pygame
+round alpha blending differently, so channels may differ by up to
+MAX_CHANNEL_DIFFERENCE; anything more fails the run (exit status 1).
+"""
+import os
+
+# Runs without a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import random
+import sys
+
+import numpy as np
+import pygame
+from constants import *
+from main import StarfallGame
+from render_backend import TextureBackend
+from soak_test import SimulatedClock
+from utils import create_surface
+
+# Largest per-channel difference put down to blend rounding: SDL and pygame each round every
+# blend, so stacked translucent sprites drift apart by a level or so per layer
+MAX_CHANNEL_DIFFERENCE = 8
+
+
+def draw_screen(game, surface):
+    """Draw the current screen into surface (without the UI manager); False if it is not one that is compared"""
+    state = game.game_state.current_state
+    if state == STATE_TITLE:
+        surface.fill(BLACK)
+        game.title_screen.draw(surface)
+    elif state == STATE_PLAYING and game.playing_screen.player:
+        surface.fill(BLACK)
+        game.playing_screen.draw(surface, game.game_state)
+    else:
+        return False
+    return True
+
+
+def check_frame(game):
+    """(largest channel difference, pixels that differ) between the two renderers, or None to skip the frame"""
+    backend = game.backend
+    reference = create_surface(backend.frame.get_size())
+    # Both draws see the same random numbers (beam particles), and the game the ones it would have seen
+    random_state = random.getstate()
+    if not draw_screen(game, reference):
+        return None
+    random.setstate(random_state)
+    backend.clear()
+    draw_screen(game, backend.frame)
+    random.setstate(random_state)
+    captured = backend.capture()
+    backend.clear()
+
+    difference = np.abs(pygame.surfarray.array3d(captured).astype(np.int16) -
+                        pygame.surfarray.array3d(reference).astype(np.int16))
+    return int(difference.max()), int(np.count_nonzero(difference.max(axis=2)))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Check that the texture renderer draws the same frames as surface blits.")
+    parser.add_argument('--frames', type=int, default=3600, help="frames to play (default: 3600)")
+    parser.add_argument('--every', type=int, default=30, help="frames between comparisons (default: 30)")
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    random.seed(args.seed)
+    game = StarfallGame(autopilot=True, renderer='software')
+    if not isinstance(game.backend, TextureBackend):
+        print("The SDL2 software renderer is not available here; nothing to compare")
+        return 2
+    game.clock = SimulatedClock()
+
+    compared = 0
+    mismatches = 0
+    worst = 0
+    for frame in range(1, args.frames + 1):
+        if not game.run_frame():
+            break
+        if frame % args.every:
+            continue
+        result = check_frame(game)
+        if result is None:
+            continue
+        difference, pixels = result
+        compared += 1
+        worst = max(worst, difference)
+        if difference > MAX_CHANNEL_DIFFERENCE:
+            mismatches += 1
+            print(f"Frame {frame} ({game.game_state.current_state}): {pixels} pixels differ, by up to {difference}")
+
+    print(f"{compared} frames compared, largest channel difference {worst}, {mismatches} over {MAX_CHANNEL_DIFFERENCE}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""Long-session leak test: play the headless game for hours of simulated time.
+
+Example:
+    python soak_test.py --hours 2 --out soak_report.json
+
+The autopilot cycles through every mission and retries lost ones through
+GameState.reset_for_retry (missions that run long are lost on purpose so
+retries happen on every level), and every full cycle ends with
+GameState.reset_game. The window is resized periodically so the UI
+is torn down and rebuilt the way handle_resize does it in the real game.
+
+Every sample records the process RSS, live Python objects by type, the
+PlayingScreen entity lists, pygame_gui element counts and live Surfaces. The
+run fails (exit status 1) when any of them keeps growing across the session.
+"""
+import os
+
+# Runs without a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+from collections import Counter
+
+import pygame
+from constants import *
+from main import StarfallGame
+
+# PlayingScreen lists sampled every time
+TRACKED_LISTS = ('enemies', 'enemy_projectiles', 'player_lasers', 'power_ups', 'particles', 'explosions')
+
+# Window sizes the session alternates between
+RESIZE_SIZES = ((DEFAULT_WIDTH, DEFAULT_HEIGHT), (1024, 768))
+
+# Growth above both of these, from the first window to the last, counts as a leak.
+# Keyed by metric prefix; object type counts use 'objects'.
+GROWTH_TOLERANCE = {
+    'rss_kb': (16 * 1024, 0.10),
+    'objects': (500, 0.10),
+    'lists': (50, 0.25),
+    'ui': (10, 0.10),
+    'surfaces': (50, 0.10)
+}
+
+# Types with fewer live objects than this are not reported individually
+MIN_TRACKED_OBJECTS = 50
+
+
+class SimulatedClock:
+    """Stands in for pygame.time.Clock: every tick is one frame at FPS, without sleeping"""
+
+    def __init__(self):
+        self.frames = 0
+
+    def tick(self, framerate=0):
+        self.frames += 1
+        return 1000 // FPS
+
+    def get_fps(self):
+        return float(FPS)
+
+
+class SoakTest:
+    def __init__(self, hours, sample_seconds, resize_seconds, retry_seconds, max_retries, seed):
+        random.seed(seed)
+        self.total_frames = int(hours * 3600 * FPS)
+        self.sample_frames = max(1, int(sample_seconds * FPS))
+        self.resize_frames = int(resize_seconds * FPS)
+        self.retry_frames = int(retry_seconds * FPS)
+        self.cycles = 0
+        self.forced_defeats = 0
+        self.game_overs = 0
+        self.resizes = 0
+        self.last_state = None
+        self.mission_frames = 0
+        self.samples = []
+
+        self.game = StarfallGame(autopilot=True)
+        self.game.clock = SimulatedClock()
+        # Missions the bot keeps losing are given up so every level gets played
+        self.game.autopilot.level_plan = self.level_cycle()
+        self.game.autopilot.max_retries = max_retries
+        for level in range(1, 6):
+            self.game.game_state.unlock_level(level)
+
+    def level_cycle(self):
+        """Every mission in turn, with a full reset between cycles"""
+        while True:
+            for level in range(1, 6):
+                yield level
+            self.game.game_state.reset_game()
+            self.cycles += 1
+
+    def run(self):
+        started = time.perf_counter()
+        for frame in range(1, self.total_frames + 1):
+            self.step(frame)
+            if not self.game.run_frame():
+                raise RuntimeError("game quit during the soak test")
+            if frame % self.sample_frames == 0:
+                self.samples.append(self.take_sample(frame))
+        return time.perf_counter() - started
+
+    def step(self, frame):
+        """Session events driven by the harness rather than the autopilot"""
+        game = self.game
+        if self.resize_frames and frame % self.resize_frames == 0:
+            self.resizes += 1
+            width, height = RESIZE_SIZES[self.resizes % len(RESIZE_SIZES)]
+            game.handle_resize(pygame.event.Event(pygame.VIDEORESIZE, {'w': width, 'h': height}))
+
+        state = game.game_state.current_state
+        if state == STATE_GAME_OVER and self.last_state != STATE_GAME_OVER:
+            self.game_overs += 1
+        self.last_state = state
+
+        # Lose long missions on purpose so retries are exercised as well
+        playing_screen = game.playing_screen
+        if game.game_state.current_state == STATE_PLAYING and not playing_screen.game_over:
+            self.mission_frames += 1
+            if self.retry_frames and self.mission_frames >= self.retry_frames and playing_screen.player:
+                playing_screen.player.health = 0
+                playing_screen.game_over = True
+                self.forced_defeats += 1
+        elif game.game_state.current_state not in (STATE_PAUSED, STATE_ABILITY_SELECT, STATE_DEBUG_MENU):
+            self.mission_frames = 0
+
+    def take_sample(self, frame):
+        gc.collect()
+        objects = gc.get_objects()
+        sample = {
+            'frame': frame,
+            'minutes': round(frame / FPS / 60, 2),
+            'rss_kb': get_rss_kb(),
+            'surfaces': count_surfaces(objects)
+        }
+        for name in TRACKED_LISTS:
+            sample['lists.' + name] = len(getattr(self.game.playing_screen, name))
+        sample['ui.sprites'] = len(self.game.manager.get_sprite_group())
+        sample['ui.root_elements'] = len(self.game.manager.get_root_container().elements)
+        for name, count in Counter(type(obj).__name__ for obj in objects).items():
+            if count >= MIN_TRACKED_OBJECTS:
+                sample['objects.' + name] = count
+        return sample
+
+
+def get_rss_kb():
+    """Resident set size of this process in KB"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError):
+        # Peak rather than current RSS, but it still shows growth
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def count_surfaces(objects):
+    """Live pygame Surfaces reachable from gc-tracked objects (Surfaces are not tracked themselves)"""
+    seen = set()
+    for obj in objects:
+        for referent in gc.get_referents(obj):
+            if isinstance(referent, pygame.Surface):
+                seen.add(id(referent))
+    return len(seen)
+
+
+def find_growth(samples, warmup, windows=3):
+    """Metrics whose window maxima rise in every window by more than the tolerance.
+
+    Comparing maxima over windows rather than single samples keeps metrics that
+    swing with the level being played (particles, projectiles) from looking
+    like leaks, as long as each window covers a full level cycle.
+    """
+    samples = samples[warmup:]
+    if len(samples) < windows * 2:
+        return None
+    size = len(samples) // windows
+    chunks = [samples[i * size:(i + 1) * size] for i in range(windows - 1)]
+    chunks.append(samples[(windows - 1) * size:])
+
+    metrics = set()
+    for sample in samples:
+        metrics.update(key for key in sample if key not in ('frame', 'minutes'))
+
+    growth = {}
+    for metric in sorted(metrics):
+        maxima = [max(sample.get(metric, 0) for sample in chunk) for chunk in chunks]
+        absolute, relative = GROWTH_TOLERANCE[metric.split('.')[0]]
+        increase = maxima[-1] - maxima[0]
+        rising = all(later > earlier for earlier, later in zip(maxima, maxima[1:]))
+        if rising and increase > max(absolute, relative * maxima[0]):
+            growth[metric] = {'window_max': maxima, 'increase': increase}
+    return growth
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Play the headless game for hours of simulated time and check for leaks.")
+    parser.add_argument('--hours', type=float, default=1.0, help="simulated hours to play (default: 1)")
+    parser.add_argument('--sample-seconds', type=float, default=60.0,
+                        help="simulated seconds between samples (default: 60)")
+    parser.add_argument('--resize-every', type=float, default=300.0,
+                        help="simulated seconds between window resizes, 0 to never resize (default: 300)")
+    parser.add_argument('--retry-every', type=float, default=120.0,
+                        help="lose a mission after this many simulated seconds so it is retried, 0 to never (default: 120)")
+    parser.add_argument('--max-retries', type=int, default=2,
+                        help="retries of a lost mission before moving on to the next one (default: 2)")
+    parser.add_argument('--warmup', type=int, default=3,
+                        help="samples ignored at the start while caches fill (default: 3)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='soak_report.json', help="JSON report to write")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    soak = SoakTest(args.hours, args.sample_seconds, args.resize_every, args.retry_every, args.max_retries, args.seed)
+    elapsed = soak.run()
+    growth = find_growth(soak.samples, args.warmup)
+
+    report = {
+        'hours': args.hours,
+        'frames': soak.total_frames,
+        'wall_seconds': round(elapsed, 1),
+        'cycles': soak.cycles,
+        'game_overs': soak.game_overs,
+        'forced_defeats': soak.forced_defeats,
+        'resizes': soak.resizes,
+        'growth': growth,
+        'samples': soak.samples
+    }
+    with open(args.out, 'w') as out:
+        json.dump(report, out, indent=1)
+
+    print(f"{soak.total_frames} frames in {elapsed:.1f}s: {soak.cycles} cycles, "
+          f"{soak.game_overs} game overs ({soak.forced_defeats} forced), {soak.resizes} resizes")
+    if growth is None:
+        print(f"Too few samples to judge growth; run longer or sample more often (report in {args.out})")
+        return 0
+    if not growth:
+        print(f"No unbounded growth found (report in {args.out})")
+        return 0
+    print("Unbounded growth:")
+    for metric, info in sorted(growth.items(), key=lambda item: -item[1]['increase']):
+        print(f"  {metric}: window maxima {info['window_max']}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import os
+import wave
+from collections import OrderedDict
+import numpy as np
+import pygame
+from constants import *
+from utils import get_resource
+
+class SoundEffectCache:
+    """Procedurally synthesized sound effects, kept as ready-to-play Sounds.
+
+    Effects are generated with NumPy at load time from a kind plus size and
+    pitch multipliers, which are rounded to two decimals so nearby requests
+    share one Sound. The cache holds at most SFX_CACHE_SIZE Sounds and drops
+    the least recently used beyond that. With SFX_CACHE_DIR set, synthesized
+    effects are also written there as WAV files and read back on later runs.
+    """
+
+    def __init__(self, max_size=SFX_CACHE_SIZE, cache_dir=SFX_CACHE_DIR):
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self.sounds = OrderedDict()  # (kind, size, pitch) -> Sound
+        # Synthesize at the rate and channel count the mixer was actually opened with
+        self.frequency, _, self.channels = pygame.mixer.get_init()
+        self.synthesized = 0
+        self.loaded = 0
+
+    def get(self, kind, size=1.0, pitch=1.0):
+        """Return the Sound for an effect, synthesizing it on first use"""
+        key = (kind, round(size, 2), round(pitch, 2))
+        sound = self.sounds.get(key)
+        if sound is not None:
+            self.sounds.move_to_end(key)
+            return sound
+
+        sound = self.load_from_disk(key)
+        if sound is None:
+            samples = SYNTHS[kind](self.frequency, key[1], key[2])
+            sound = pygame.sndarray.make_sound(self.to_mixer_format(samples))
+            self.synthesized += 1
+            self.save_to_disk(key, sound)
+        self.sounds[key] = sound
+        if len(self.sounds) > self.max_size:
+            self.sounds.popitem(last=False)
+        return sound
+
+    def to_mixer_format(self, samples):
+        """Mono float samples in -1..1 to the mixer's signed 16-bit layout"""
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        if self.channels > 1:
+            pcm = np.repeat(pcm[:, None], self.channels, axis=1)
+        return np.ascontiguousarray(pcm)
+
+    def get_path(self, key):
+        kind, size, pitch = key
+        return os.path.join(self.cache_dir or '', f"{kind}_{size:.2f}_{pitch:.2f}_{self.frequency}.wav")
+
+    def load_from_disk(self, key):
+        # Effects bundled with the build (see build_zipapp.py) come first
+        bundled = get_resource(f"sound_cache/{os.path.basename(self.get_path(key))}")
+        if bundled.is_file():
+            with bundled.open('rb') as sound_file:
+                self.loaded += 1
+                return pygame.mixer.Sound(file=sound_file)
+        if not self.cache_dir:
+            return None
+        path = self.get_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            sound = pygame.mixer.Sound(path)
+        except pygame.error as e:
+            print(f"Warning: Cached sound {path} could not be loaded ({e}). Synthesizing it again.")
+            return None
+        self.loaded += 1
+        return sound
+
+    def save_to_disk(self, key, sound):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with wave.open(self.get_path(key), 'wb') as wav_file:
+                wav_file.setnchannels(self.channels)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(self.frequency)
+                wav_file.writeframes(sound.get_raw())
+        except OSError as e:
+            print(f"Warning: Could not write sound cache ({e}).")
+
+
+# Synthesis helpers: every synth takes (sample rate, size, pitch) and returns mono float samples
+
+def _timeline(rate, seconds):
+    return np.arange(int(rate * seconds)) / rate
+
+def _noise(count, seed):
+    # Fixed seeds keep effects identical between runs (and the global random state untouched)
+    return np.random.default_rng(seed).uniform(-1.0, 1.0, count)
+
+def _low_pass(samples, strength):
+    """One-pole low-pass filter as a convolution; strength in 0..1, higher removes more treble"""
+    taps = int(np.ceil(5 / (1.0 - strength)))  # The impulse response has decayed to under 1% by then
+    kernel = (1.0 - strength) * strength ** np.arange(taps)
+    return np.convolve(samples, kernel)[:len(samples)]
+
+def _fade(samples, rate, seconds=0.005):
+    """Short fade in and out so effects start and stop without clicks"""
+    count = min(len(samples) // 2, int(rate * seconds))
+    if count:
+        ramp = np.linspace(0.0, 1.0, count)
+        samples[:count] *= ramp
+        samples[-count:] *= ramp[::-1]
+    return samples
+
+def synth_explosion(rate, size, pitch):
+    """Low rumbling noise burst; bigger explosions last longer and sound darker"""
+    t = _timeline(rate, 0.35 + 0.35 * size)
+    noise = _low_pass(_noise(len(t), 1), min(0.97, 0.85 + 0.05 * size / pitch))
+    thump = np.sin(2 * np.pi * 55 * pitch * t) * np.exp(-t * 12)
+    samples = (noise * 2.5 + thump) * np.exp(-t * 5 / size)
+    return _fade(samples * 0.6, rate)
+
+def synth_hit(rate, size, pitch):
+    """Short bright crack for projectile impacts"""
+    t = _timeline(rate, 0.08 * size)
+    blip = np.sin(2 * np.pi * 900 * pitch * t * (1 - t * 4))
+    samples = (_noise(len(t), 2) * 0.5 + blip * 0.5) * np.exp(-t * 40)
+    return _fade(samples * 0.5, rate)
+
+def synth_shield_hit(rate, size, pitch):
+    """Metallic ping for hits absorbed by the shield"""
+    t = _timeline(rate, 0.2 * size)
+    tone = np.sin(2 * np.pi * 1200 * pitch * t) + 0.5 * np.sin(2 * np.pi * 1810 * pitch * t)
+    return _fade(tone * np.exp(-t * 18) * 0.35, rate)
+
+def synth_shield_break(rate, size, pitch):
+    """Falling sweep with a glassy crackle when the shield gives out"""
+    t = _timeline(rate, 0.5 * size)
+    sweep = np.sin(2 * np.pi * np.cumsum(1400 * pitch * np.exp(-t * 4)) / rate)
+    crackle = _noise(len(t), 3) * (np.sin(2 * np.pi * 30 * t) > 0.6)
+    samples = (sweep * 0.6 + crackle * 0.3) * np.exp(-t * 4)
+    return _fade(samples * 0.5, rate)
+
+def synth_player_damage(rate, size, pitch):
+    """Dull square-wave thud for hull damage"""
+    t = _timeline(rate, 0.25 * size)
+    square = np.sign(np.sin(2 * np.pi * 110 * pitch * t * (1 - t)))
+    samples = _low_pass(square, 0.7) * np.exp(-t * 10)
+    return _fade(samples * 0.5, rate)
+
+def synth_beam_charge(rate, size, pitch):
+    """Rising, trembling whine for the boss beam charge (one second at size 1)"""
+    t = _timeline(rate, 1.0 * size)
+    frequency = 200 * pitch * (1 + 3 * (t / t[-1]) ** 2)
+    tone = np.sin(2 * np.pi * np.cumsum(frequency) / rate)
+    tremolo = 0.6 + 0.4 * np.sin(2 * np.pi * 14 * t)
+    return _fade(tone * tremolo * np.minimum(1.0, t * 3) * 0.35, rate)
+
+def synth_phase_transition(rate, size, pitch):
+    """Low rumble under a rising chord when the boss changes phase"""
+    t = _timeline(rate, 1.0 * size)
+    chord = sum(np.sin(2 * np.pi * base * pitch * t * (1 + t * 0.5)) for base in (110, 138.6, 164.8))
+    rumble = _low_pass(_noise(len(t), 4), 0.95) * 3
+    envelope = np.minimum(1.0, t * 4) * np.exp(-t * 2)
+    return _fade((chord / 3 + rumble) * envelope * 0.5, rate)
+
+SYNTHS = {
+    'explosion': synth_explosion,
+    'hit': synth_hit,
+    'shield_hit': synth_shield_hit,
+    'shield_break': synth_shield_break,
+    'player_damage': synth_player_damage,
+    'beam_charge': synth_beam_charge,
+    'phase_transition': synth_phase_transition
+}
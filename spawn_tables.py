@@ -0,0 +1,124 @@
+import json
+from constants import *
+from utils import get_resource
+
+class AliasTable:
+    """Weighted choice in constant time (Vose's alias method).
+
+    Building the table is O(n) and done once per level; every sample then
+    costs two random numbers and one comparison, however many enemy types
+    the level has.
+    """
+
+    def __init__(self, items, weights):
+        count = len(items)
+        total = float(sum(weights))
+        self.items = list(items)
+        self.probability = [0.0] * count
+        self.alias = [0] * count
+
+        scaled = [weight * count / total for weight in weights]
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self.probability[low] = scaled[low]
+            self.alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Whatever is left is 1.0 up to rounding error
+        for index in small + large:
+            self.probability[index] = 1.0
+
+    def sample(self, rng):
+        index = int(rng.random() * len(self.items))
+        if rng.random() < self.probability[index]:
+            return self.items[index]
+        return self.items[self.alias[index]]
+
+
+class SpawnTable:
+    """Everything PlayingScreen needs to spawn one level's waves, compiled once.
+
+    intervals holds the frames between spawns for every kill count from 0 to
+    the level's target (interpolated from the wave's interval curve), so the
+    next delay is a list lookup. Bursts are (kill count, enemy type, count,
+    formation) groups spawned at once when the kill count is reached, in a
+    MOVEMENT_PATHS formation if one is named; they may go over max_enemies.
+    """
+
+    def __init__(self, level, types, weights, interval_curve, max_enemies, bursts, target):
+        self.level = level
+        self.types = AliasTable(types, weights)
+        self.max_enemies = max_enemies
+        self.intervals = [int(round(interpolate(interval_curve, kills / max(1, target))))
+                          for kills in range(target + 1)]
+        self.bursts = sorted(((burst['after_kills'], burst['type'], burst['count'], burst.get('formation'))
+                              for burst in bursts), key=lambda burst: burst[0])
+
+    def pick_type(self, rng):
+        return self.types.sample(rng)
+
+    def get_interval(self, kills):
+        return self.intervals[min(kills, len(self.intervals) - 1)]
+
+
+def interpolate(curve, progress):
+    """Linear interpolation through [progress, value] points sorted by progress"""
+    if progress <= curve[0][0]:
+        return curve[0][1]
+    for (x0, y0), (x1, y1) in zip(curve, curve[1:]):
+        if progress <= x1:
+            return y0 + (y1 - y0) * (progress - x0) / (x1 - x0)
+    return curve[-1][1]
+
+
+def default_wave(level, game_state):
+    """The wave definition for a level that the data file leaves out, from the constants"""
+    weights = {}
+    for enemy_type, min_level in ENEMY_LEVEL_PROGRESSION.items():
+        if level >= min_level:
+            weight = ENEMY_SPAWN_WEIGHTS[ENEMY_TYPES.index(enemy_type)] if enemy_type in ENEMY_TYPES else 0.1
+            # Lower-tier enemies become less common in higher levels
+            if level > min_level:
+                weight = max(0.1, weight - (level - min_level) * 0.1)
+            weights[enemy_type] = weight
+    return {
+        'weights': weights or {"Swarmer": 1.0},
+        'interval_curve': [[0.0, ENEMY_SPAWN_RATE], [1.0, ENEMY_SPAWN_RATE]],
+        'max_enemies': game_state.get_max_enemies_for_level(level),
+        'bursts': []
+    }
+
+
+def load_waves(resource=SPAWN_TABLE_PATH):
+    """Level number -> wave definition from the data file (an empty dict if there is none)"""
+    data_file = get_resource(resource)
+    if not data_file.is_file():
+        return {}
+    try:
+        data = json.loads(data_file.read_text())
+    except (OSError, ValueError) as e:
+        print(f"Warning: Wave file {resource} could not be read ({e}). Using built-in waves.")
+        return {}
+    return {int(level): wave for level, wave in data.get('levels', {}).items()}
+
+
+_waves = None
+_tables = {}  # level -> SpawnTable
+
+def get_spawn_table(level, game_state):
+    """The compiled SpawnTable for a level, built on first use"""
+    global _waves
+    table = _tables.get(level)
+    if table is None:
+        if _waves is None:
+            _waves = load_waves()
+        wave = dict(default_wave(level, game_state))
+        wave.update(_waves.get(level, {}))
+        table = SpawnTable(level, list(wave['weights']), list(wave['weights'].values()),
+                           wave['interval_curve'], wave['max_enemies'], wave['bursts'],
+                           game_state.enemies_per_level.get(level, 0))
+        _tables[level] = table
+    return table
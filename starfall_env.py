@@ -0,0 +1,331 @@
+"""Gym-style environment around PlayingScreen for agent training.
+
+    env = StarfallEnv(observation='vector')
+    obs = env.reset(seed=1, level=2)
+    obs, reward, done, info = env.step(action)
+
+Observations are returned without copying. 'rgb' is a pygame.surfarray.pixels3d
+view of one of two render surfaces that alternate, so the observation passed
+into step() stays readable while the next frame is drawn; 'vector' is a reused
+float32 buffer that is overwritten by the next step. Copy observations to keep them.
+
+VectorStarfallEnv steps many environments in lockstep in one process. Each
+environment keeps its own `random` state, swapped in while it runs, so
+results do not depend on how many environments share the process.
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random
+import numpy as np
+import pygame
+import pygame_gui
+from constants import *
+from utils import load_theme
+from game_state import GameState
+from playing_screen import PlayingScreen
+from ability_selection_screen import AbilitySelectionScreen
+from autopilot import Autopilot
+from movement_paths import movement_paths
+
+# Discrete actions: (move_x, move_y, fire, use_ability)
+ACTIONS = [(move_x, move_y, fire, False)
+           for fire in (False, True)
+           for move_y in (-1, 0, 1)
+           for move_x in (-1, 0, 1)]
+ACTIONS.append((0, 0, True, True))
+
+# Reward weights
+REWARD_SCORE_SCALE = 0.01  # Per point of score
+REWARD_KILL = 1.0
+REWARD_DAMAGE = 5.0  # Per point of health lost
+REWARD_COMPLETE = 50.0  # Level completed or boss defeated
+REWARD_DEFEAT = -50.0
+
+# Vector observation layout: the ship, the boss, then the nearest entities of each kind
+OBS_MAX_ENEMIES = 8
+OBS_MAX_PROJECTILES = 16
+OBS_MAX_POWER_UPS = 2
+OBS_PLAYER_SIZE = 5  # x, y, health, shield, can shoot
+OBS_BOSS_SIZE = 4  # present, x, y, health
+OBS_ENEMY_SIZE = 4  # present, x, y, health
+OBS_PROJECTILE_SIZE = 5  # present, x, y, vx, vy
+OBS_POWER_UP_SIZE = 3  # present, x, y
+OBS_SIZE = (OBS_PLAYER_SIZE + OBS_BOSS_SIZE + OBS_MAX_ENEMIES * OBS_ENEMY_SIZE +
+            OBS_MAX_PROJECTILES * OBS_PROJECTILE_SIZE + OBS_MAX_POWER_UPS * OBS_POWER_UP_SIZE)
+
+# UI manager and ability screen shared by every environment of the same size
+_shared_ui = {}
+
+
+def get_shared_ui(width, height):
+    """Return the (UIManager, AbilitySelectionScreen) pair for a screen size"""
+    if (width, height) not in _shared_ui:
+        manager = pygame_gui.UIManager((width, height), load_theme())
+        ability_screen = AbilitySelectionScreen(pygame.Surface((width, height)), manager)
+        _shared_ui[(width, height)] = (manager, ability_screen)
+    return _shared_ui[(width, height)]
+
+
+class StarfallEnv:
+    """One mission as an environment: reset(seed, level) and step(action)"""
+
+    def __init__(self, observation='vector', width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT,
+                 frame_skip=1, max_steps=60 * 60 * 10, obs_buffer=None):
+        if observation not in ('vector', 'rgb'):
+            raise ValueError(f"Unknown observation type: {observation}")
+        self.observation = observation
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+
+        # RGB frames alternate between two surfaces: a surface is locked while its view is alive
+        self.surfaces = [pygame.Surface((width, height)), pygame.Surface((width, height))]
+        self.pixels = [None, None]
+        self.surface_index = 0
+        self.surface = self.surfaces[0]
+        self.manager, self.ability_screen = get_shared_ui(width, height)
+        self.playing_screen = PlayingScreen(self.surface, self.manager)
+        self.playing_screen.input_controller = self
+        self.ability_chooser = Autopilot()
+        self.game_state = None
+
+        # Written in place every step; VectorStarfallEnv passes a row of its batch array
+        self.obs_buffer = obs_buffer if obs_buffer is not None else np.zeros(OBS_SIZE, dtype=np.float32)
+
+        self.random_state = random.Random(0).getstate()
+        self.outer_random_state = None
+        self.level = 1
+        self.action = ACTIONS[0]
+        self.steps = 0
+        self.last_score = 0
+        self.last_kills = 0
+        self.last_health = 0
+
+    def swap_in_random(self):
+        self.outer_random_state = random.getstate()
+        random.setstate(self.random_state)
+
+    def swap_out_random(self):
+        self.random_state = random.getstate()
+        random.setstate(self.outer_random_state)
+
+    def reset(self, seed=None, level=None):
+        """Start a new mission and return the first observation.
+
+        Without a seed the next one is drawn from the environment's own random state.
+        """
+        if level is not None:
+            self.level = level
+        self.swap_in_random()
+        try:
+            if seed is None:
+                seed = random.getrandbits(32)
+            random.seed(seed)
+
+            self.game_state = GameState()
+            for unlocked in range(1, self.level + 1):
+                self.game_state.unlock_level(unlocked)
+            self.game_state.set_current_level(self.level)
+            self.game_state.change_state(STATE_PLAYING)
+
+            # Assets preloaded by the last mission were built from its seed
+            self.playing_screen.level_preloader.clear()
+            self.playing_screen.reset(self.game_state)
+        finally:
+            self.swap_out_random()
+
+        self.action = ACTIONS[0]
+        self.steps = 0
+        self.last_score = 0
+        self.last_kills = 0
+        self.last_health = self.playing_screen.player.health
+        return self.get_observation()
+
+    def get_controls(self, playing_screen, game_state):
+        """Input controller hook: the action being stepped"""
+        return self.action
+
+    def step(self, action):
+        """Advance frame_skip frames with one action; returns (obs, reward, done, info)"""
+        self.swap_in_random()
+        try:
+            self.advance(action)
+        finally:
+            self.swap_out_random()
+        return self.finish_step()
+
+    def advance(self, action):
+        """Run the frames of one step. The caller must have swapped in this env's random state."""
+        self.action = ACTIONS[action] if isinstance(action, (int, np.integer)) else action
+        for _ in range(self.frame_skip):
+            if self.game_state.current_state == STATE_ABILITY_SELECT:
+                self.select_ability()
+            self.playing_screen.update(self.game_state)
+            if self.get_outcome():
+                break
+
+    def finish_step(self):
+        """Work out the outcome and reward of the step just run"""
+        playing_screen = self.playing_screen
+        self.steps += 1
+
+        outcome = self.get_outcome()
+        if outcome is None and self.steps >= self.max_steps:
+            outcome = 'timeout'
+
+        player = playing_screen.player
+        reward = ((playing_screen.score - self.last_score) * REWARD_SCORE_SCALE +
+                  (playing_screen.kills - self.last_kills) * REWARD_KILL -
+                  max(0, self.last_health - player.health) * REWARD_DAMAGE)
+        if outcome in ('complete', 'victory'):
+            reward += REWARD_COMPLETE
+        elif outcome == 'defeat':
+            reward += REWARD_DEFEAT
+        self.last_score = playing_screen.score
+        self.last_kills = playing_screen.kills
+        self.last_health = player.health
+
+        info = {
+            'outcome': outcome,
+            'steps': self.steps,
+            'score': playing_screen.score,
+            'kills': playing_screen.kills,
+            'health': player.health
+        }
+        return self.get_observation(), reward, outcome is not None, info
+
+    def get_outcome(self):
+        if self.playing_screen.game_over:
+            return 'defeat'
+        if self.game_state.boss_defeated:
+            return 'victory'
+        if self.playing_screen.level_complete_timer > 0:
+            return 'complete'
+        return None
+
+    def select_ability(self):
+        """Answer the ability screen the action opened"""
+        player = self.playing_screen.player
+        # Roll the offered abilities from this environment's random state
+        self.ability_screen.setup_ui()
+        index = self.ability_chooser.choose_ability(self.ability_screen.chosen_abilities, player)
+        self.ability_screen.select_ability(index, self.game_state, player)
+
+    def get_observation(self):
+        if self.observation == 'rgb':
+            return self.render()
+        return self.get_vector()
+
+    def render(self):
+        """Draw the scene and return a zero-copy (width, height, 3) view of it"""
+        self.surface_index = 1 - self.surface_index
+        surface = self.surfaces[self.surface_index]
+        # The view handed out two steps ago locks this surface until every reference to it is gone
+        self.pixels[self.surface_index] = None
+        if surface.get_locked():
+            raise RuntimeError("An RGB observation from two steps ago is still referenced; copy observations you keep")
+        self.playing_screen.draw(surface, self.game_state)
+        self.pixels[self.surface_index] = pygame.surfarray.pixels3d(surface)
+        return self.pixels[self.surface_index]
+
+    def get_vector(self):
+        """Fill the observation buffer with normalized entity positions"""
+        playing_screen = self.playing_screen
+        player = playing_screen.player
+        width = self.surface.get_width()
+        height = self.surface.get_height()
+        obs = self.obs_buffer
+        obs[:] = 0
+
+        obs[0:OBS_PLAYER_SIZE] = (player.x / width, player.y / height, player.health / player.max_health,
+                                  player.shield / player.max_shield, player.shoot_cooldown <= 0)
+        offset = OBS_PLAYER_SIZE
+
+        boss = playing_screen.boss
+        if boss:
+            obs[offset:offset + OBS_BOSS_SIZE] = (1, boss.x / width, boss.y / height, boss.health / boss.max_health)
+        offset += OBS_BOSS_SIZE
+
+        def nearest(objects, count):
+            if len(objects) <= count:
+                return objects
+            return sorted(objects, key=lambda obj: (obj.x - player.x) ** 2 + (obj.y - player.y) ** 2)[:count]
+
+        for i, enemy in enumerate(nearest(playing_screen.enemies, OBS_MAX_ENEMIES)):
+            start = offset + i * OBS_ENEMY_SIZE
+            obs[start:start + OBS_ENEMY_SIZE] = (1, enemy.x / width, enemy.y / height, enemy.health / enemy.max_health)
+        offset += OBS_MAX_ENEMIES * OBS_ENEMY_SIZE
+
+        for i, projectile in enumerate(nearest(playing_screen.enemy_projectiles, OBS_MAX_PROJECTILES)):
+            start = offset + i * OBS_PROJECTILE_SIZE
+            # The next frame's movement: stored velocity plus the path's step (spore arcs)
+            vx, vy = projectile.vx, projectile.vy
+            if projectile.path is not None:
+                dx, dy = movement_paths[projectile.path].step(projectile.path_phase)
+                vx += dx
+                vy += dy
+            obs[start:start + OBS_PROJECTILE_SIZE] = (1, projectile.x / width, projectile.y / height,
+                                                      vx / width, vy / height)
+        offset += OBS_MAX_PROJECTILES * OBS_PROJECTILE_SIZE
+
+        for i, power_up in enumerate(nearest(playing_screen.power_ups, OBS_MAX_POWER_UPS)):
+            start = offset + i * OBS_POWER_UP_SIZE
+            obs[start:start + OBS_POWER_UP_SIZE] = (1, power_up.x / width, power_up.y / height)
+        return obs
+
+
+class VectorStarfallEnv:
+    """Several StarfallEnvs stepped in lockstep in one process.
+
+    Vector observations are rows of one (num_envs, OBS_SIZE) array; RGB
+    observations are a list of per-environment views. Environments that finish
+    are reset right away and their last observation is kept in
+    info['final_observation'].
+    """
+
+    def __init__(self, num_envs, observation='vector', **kwargs):
+        self.num_envs = num_envs
+        self.observation = observation
+        self.obs = np.zeros((num_envs, OBS_SIZE), dtype=np.float32)
+        self.envs = [StarfallEnv(observation, obs_buffer=self.obs[i], **kwargs) for i in range(num_envs)]
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+
+    def reset(self, seed=0, level=1):
+        """Reset every environment; environment i gets seed + i"""
+        observations = [env.reset(seed + i, level) for i, env in enumerate(self.envs)]
+        return self.collect(observations)
+
+    def step(self, actions):
+        # Swap each env's random state in and out directly, saving the caller's state only once
+        outer_random_state = random.getstate()
+        try:
+            for env, action in zip(self.envs, actions):
+                random.setstate(env.random_state)
+                env.advance(action)
+                env.random_state = random.getstate()
+        finally:
+            random.setstate(outer_random_state)
+
+        observations = []
+        infos = []
+        for i, env in enumerate(self.envs):
+            obs, reward, done, info = env.finish_step()
+            if done:
+                info['final_observation'] = obs.copy()
+                obs = None
+                # Draw the next mission's first frame over the final one, not over the frame the caller holds
+                env.surface_index = 1 - env.surface_index
+                obs = env.reset()
+            observations.append(obs)
+            infos.append(info)
+            self.rewards[i] = reward
+            self.dones[i] = done
+        return self.collect(observations), self.rewards, self.dones, infos
+
+    def collect(self, observations):
+        if self.observation == 'vector':
+            return self.obs  # Every env already wrote its row
+        return observations
@@ -0,0 +1,150 @@
+import pygame
+import random
+import math
+import numpy as np
+from constants import *
+from utils import create_surface
+from render_backend import blit_cached
+
+# Star colours are drawn from a small palette so every (radius, colour) pair
+# can be pre-rendered once and reused by every star that shares it
+STAR_PALETTE_SIZE = 8
+STAR_MAX_RADIUS = 4
+
+
+class Starfield:
+    """Scrolling, optionally pulsing star background shared by all screens.
+
+    Star state lives in NumPy arrays and is advanced with vectorized math.
+    Drawing looks up a pre-rendered sprite for each star and hands the whole
+    field to a single blit_cached call.
+    """
+
+    def __init__(self, width, height, count, speed_range=(1.0, 3.0), size_range=(1.0, 3.0),
+                 direction=1, pulse=False, tinted=False, brightness_range=(255, 255), seed=None):
+        self.width = width
+        self.height = height
+        self.base_count = count
+        self.speed_range = speed_range
+        self.size_range = size_range
+        self.direction = direction  # 1 scrolls down, -1 scrolls up, 0 is static
+        self.pulse = pulse
+        self.tinted = tinted
+        self.brightness_range = brightness_range
+        self.density = 1.0
+
+        # Seed from the global random module so seeded runs stay reproducible
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.rng = np.random.default_rng(seed)
+
+        self.sprites = None
+        self.build_palette()
+        self.populate()
+
+    def build_palette(self):
+        """Pick the colour palette stars are drawn with"""
+        low, high = self.brightness_range
+        self.palette = []
+        for i in range(STAR_PALETTE_SIZE):
+            brightness = int(low + (high - low) * i / max(1, STAR_PALETTE_SIZE - 1))
+            if self.tinted:
+                # Alternate slight blue and yellow tints like the title screen stars
+                blue_tint = (i * 7) % 31
+                yellow_tint = (i * 5) % 21
+                color = (brightness, brightness - yellow_tint, brightness - blue_tint)
+            else:
+                color = (brightness, brightness, brightness)
+            self.palette.append(color)
+        self.sprites = None
+
+    def build_sprites(self):
+        """Pre-render one sprite per radius and palette colour"""
+        # Object array so a whole frame's sprites can be gathered with fancy indexing
+        self.sprites = np.empty((STAR_MAX_RADIUS + 1, len(self.palette)), dtype=object)
+        for radius in range(STAR_MAX_RADIUS + 1):
+            for index, color in enumerate(self.palette):
+                size = max(1, radius * 2)
+                sprite = create_surface((size, size), alpha=True)
+                if radius > 0:
+                    pygame.draw.circle(sprite, color, (radius, radius), radius)
+                self.sprites[radius, index] = sprite
+
+    def populate(self):
+        """(Re)create every star for the current size and density"""
+        self.count = 0
+        self.x = self.y = self.speed = self.base_size = self.size = np.empty(0)
+        self.phase = self.pulse_speed = np.empty(0)
+        self.color_index = np.empty(0, dtype=np.int64)
+        self.add_stars(self.get_active_count())
+
+    def add_stars(self, count):
+        """Append count new random stars to the arrays and make them active"""
+        rng = self.rng
+        base_size = rng.uniform(self.size_range[0], self.size_range[1], count)
+        self.x = np.concatenate((self.x, rng.uniform(0, self.width, count)))
+        self.y = np.concatenate((self.y, rng.uniform(0, self.height, count)))
+        self.speed = np.concatenate((self.speed, rng.uniform(self.speed_range[0], self.speed_range[1], count)))
+        self.base_size = np.concatenate((self.base_size, base_size))
+        self.size = np.concatenate((self.size, base_size))
+        self.phase = np.concatenate((self.phase, rng.uniform(0, 2 * math.pi, count)))
+        self.pulse_speed = np.concatenate((self.pulse_speed, rng.uniform(0.02, 0.05, count)))
+        self.color_index = np.concatenate((self.color_index, rng.integers(0, len(self.palette), count)))
+        self.count = len(self.x)
+
+    def get_active_count(self):
+        # Star count scales with screen area so density stays constant on resize
+        area_scale = (self.width * self.height) / (DEFAULT_WIDTH * DEFAULT_HEIGHT)
+        return max(1, int(self.base_count * STARFIELD_DENSITY * self.density * area_scale))
+
+    def set_density(self, density):
+        """Scale the number of stars relative to the configured density.
+
+        Existing stars stay where they are: lowering the density only shrinks
+        the active count, and raising it brings parked stars back before any
+        new ones are added.
+        """
+        if density == self.density:
+            return
+        self.density = density
+        count = self.get_active_count()
+        if count > len(self.x):
+            self.add_stars(count - len(self.x))
+        self.count = count
+
+    def update(self):
+        count = self.count
+        if self.direction:
+            y = self.y[:count]
+            y += self.speed[:count] * self.direction
+            # Wrap stars that left the screen to the opposite edge at a new x
+            if self.direction > 0:
+                wrapped = y > self.height
+                y[wrapped] = 0
+            else:
+                wrapped = y < 0
+                y[wrapped] = self.height
+            wrap_count = int(np.count_nonzero(wrapped))
+            if wrap_count:
+                self.x[:count][wrapped] = self.rng.uniform(0, self.width, wrap_count)
+
+        if self.pulse:
+            phase = self.phase[:count]
+            phase += self.pulse_speed[:count]
+            phase %= 2 * math.pi
+            np.multiply(self.base_size[:count], 1 + 0.3 * np.sin(phase), out=self.size[:count])
+
+    def draw(self, surface):
+        if self.sprites is None:
+            self.build_sprites()
+
+        count = self.count
+        radius = np.clip(self.size[:count].astype(np.int32), 0, STAR_MAX_RADIUS)
+        visible = radius > 0
+        radius = radius[visible]
+        sprites = self.sprites[radius, self.color_index[:count][visible]]
+        positions = np.column_stack((
+            self.x[:count][visible].astype(np.int32) - radius,
+            self.y[:count][visible].astype(np.int32) - radius
+        )).tolist()
+        blit_cached(surface, zip(sprites.tolist(), positions), background=True)
@@ -0,0 +1,98 @@
+from constants import TIMER_WHEEL_SLOTS
+
+class Timer:
+    """One scheduled callback; cancelling just drops the callback"""
+    __slots__ = ('deadline', 'callback', 'args')
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+
+
+class TimerWheel:
+    """Frame-based hashed timer wheel.
+
+    A timer due at frame N sits in slot N % TIMER_WHEEL_SLOTS, so tick() only
+    looks at the one slot for the new frame: per-frame work is the number of
+    timers expiring (plus any parked there for a later turn of the wheel), not
+    the number of timers alive. PlayingScreen owns one wheel and ticks it once
+    per update; it is pickled with the rest of the gameplay state for
+    checkpoints, so callbacks must be picklable (bound methods of game objects
+    are, bound methods of screens are not).
+    """
+
+    def __init__(self, slots=TIMER_WHEEL_SLOTS):
+        self.now = 0
+        self.slots = [[] for _ in range(slots)]
+        self.fired = 0
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) delay frames from now (at least one); returns the Timer"""
+        timer = Timer(self.now + max(1, int(delay)), callback, args)
+        self.slots[timer.deadline % len(self.slots)].append(timer)
+        return timer
+
+    def cancel(self, timer):
+        timer.callback = None
+
+    def remaining(self, timer):
+        return max(0, timer.deadline - self.now)
+
+    def tick(self):
+        """Advance one frame and run every callback due on it"""
+        self.now += 1
+        slot = self.slots[self.now % len(self.slots)]
+        if not slot:
+            return
+        due = [timer for timer in slot if timer.deadline <= self.now]
+        slot[:] = [timer for timer in slot if timer.deadline > self.now]
+        for timer in due:
+            if timer.callback is not None:
+                self.fired += 1
+                timer.callback(*timer.args)
+
+    def clear(self):
+        """Drop every scheduled timer; the clock keeps running so old deadlines stay in the past"""
+        for slot in self.slots:
+            slot.clear()
+
+    def get_pending(self):
+        return sum(1 for slot in self.slots for timer in slot if timer.callback is not None)
+
+
+class Countdown:
+    """A frame counter attribute backed by a deadline on the owner's TimerWheel.
+
+    Reading it gives the frames left (0 once it has run out) and assigning
+    starts it over, so `self.flash_timer = 5` and `if self.flash_timer > 0`
+    read as before but nothing counts it down each frame. With on_expire,
+    the owner's method of that name is scheduled on the wheel and called
+    when the countdown runs out; re-assigning cancels the previous call. The
+    owner keeps its wheel in a `timers` attribute, which may be None for
+    objects outside a mission (the clock then stands still at 0).
+    """
+
+    def __init__(self, on_expire=None):
+        self.on_expire = on_expire
+
+    def __set_name__(self, owner, name):
+        self.deadline_key = f"_{name}_deadline"
+        self.timer_key = f"_{name}_timer"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        timers = instance.timers
+        return max(0, instance.__dict__.get(self.deadline_key, 0) - (timers.now if timers else 0))
+
+    def __set__(self, instance, frames):
+        timers = instance.timers
+        instance.__dict__[self.deadline_key] = (timers.now if timers else 0) + frames
+        if self.on_expire is None or timers is None:
+            return
+        pending = instance.__dict__.pop(self.timer_key, None)
+        if pending is not None:
+            timers.cancel(pending)
+        if frames > 0:
+            instance.__dict__[self.timer_key] = timers.schedule(frames, getattr(instance, self.on_expire))
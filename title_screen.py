@@ -1,8 +1,9 @@
 import pygame
 import pygame_gui
-import random
-import math
 from constants import *
+from starfield import Starfield
+from utils import build_scaled_frames, pick_scaled_frame, create_surface
+from render_backend import blit_cached
 
 class TitleScreen:
     def __init__(self, screen, manager):
@@ -17,8 +18,11 @@ class TitleScreen:
         self.subtitle_font = None
         self.title_rect = None
         self.subtitle_rect = None
+        self.title_frames = []
+        self.subtitle_glow = None
+        self.subtitle_glow_rect = None
         self.is_visible = False
-        self.stars = []
+        self.stars = None
         
         # Animation properties
         self.title_scale = 1.0
@@ -39,34 +43,11 @@ class TitleScreen:
         self.hide() # Hide UI elements initially
         
     def setup_stars(self):
-        # Create animated stars in the background
-        self.stars = []
+        # Create animated stars in the background (white with slight blue/yellow tints)
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
-        
-        for _ in range(50):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            size = random.uniform(0.5, 3)
-            speed = random.uniform(0.2, 1.0)
-            pulse_speed = random.uniform(0.02, 0.05)
-            
-            # Randomly select a star color (white with slight tints)
-            brightness = random.randint(200, 255)
-            blue_tint = random.randint(0, 30)  # Some stars have slight blue tint
-            yellow_tint = random.randint(0, 20)  # Some stars have slight yellow tint
-            color = (brightness, brightness - yellow_tint, brightness - blue_tint)
-            
-            self.stars.append({
-                'x': x,
-                'y': y,
-                'size': size,
-                'base_size': size,
-                'speed': speed,
-                'pulse': 0,
-                'pulse_speed': pulse_speed,
-                'color': color
-            })
+        self.stars = Starfield(screen_width, screen_height, 50, speed_range=(0.2, 1.0), size_range=(0.5, 3),
+                               direction=-1, pulse=True, tinted=True, brightness_range=(200, 255))
 
     def setup_ui(self):
         screen_width = self.screen.get_width()
@@ -96,6 +77,8 @@ class TitleScreen:
         self.title_font = load_font(title_font_size)
         self.title_text = self.title_font.render("STARFALL", True, WHITE)
         self.title_rect = self.title_text.get_rect(center=(center_x, center_y - int(100 * scale)))
+        self.title_frames = build_scaled_frames(self.title_text, self.title_min_scale, self.title_max_scale,
+                                                TITLE_PULSE_FRAMES)
 
         # Subtitle text
         subtitle_font_size = int(SUBTITLE_FONT_SIZE * scale)
@@ -103,6 +86,11 @@ class TitleScreen:
         self.subtitle_text = self.subtitle_font.render("THE KRYLL INVASION", True, LIGHT_GRAY)
         self.subtitle_rect = self.subtitle_text.get_rect(center=(center_x, self.title_rect.bottom + int(10 * scale)))
 
+        # Subtle glow behind the subtitle, built once per layout
+        self.subtitle_glow = create_surface((self.subtitle_text.get_width() + 10, self.subtitle_text.get_height() + 10), alpha=True)
+        pygame.draw.rect(self.subtitle_glow, (100, 100, 200, 20), self.subtitle_glow.get_rect(), border_radius=5)
+        self.subtitle_glow_rect = self.subtitle_glow.get_rect(center=self.subtitle_rect.center)
+
         # Create buttons
         button_y = self.subtitle_rect.bottom + int(50 * scale)
         
@@ -173,24 +161,8 @@ class TitleScreen:
             self.title_scale = self.title_min_scale
             self.title_direction = abs(self.title_direction)
             
-        # Animate background stars
-        screen_width = self.screen.get_width()
-        screen_height = self.screen.get_height()
-        
-        for star in self.stars:
-            # Move stars slowly upward
-            star['y'] -= star['speed']
-            if star['y'] < 0:
-                star['y'] = screen_height
-                star['x'] = random.randint(0, screen_width)
-                
-            # Make stars pulse
-            star['pulse'] += star['pulse_speed']
-            if star['pulse'] > 2 * math.pi:
-                star['pulse'] -= 2 * math.pi
-                
-            # Calculate current size based on pulse
-            star['size'] = star['base_size'] * (1 + 0.3 * math.sin(star['pulse']))
+        # Animate background stars (drift upward and pulse)
+        self.stars.update()
 
     def show(self):
         if self.begin_button:
@@ -218,54 +190,44 @@ class TitleScreen:
         surface.fill(BLACK)
         
         # Draw animated background stars
-        for star in self.stars:
-            pygame.draw.circle(
-                surface, 
-                star['color'], 
-                (int(star['x']), int(star['y'])), 
-                int(star['size'])
-            )
+        self.stars.draw(surface)
         
+        # Title, subtitle and labels never change, so they are drawn in one batch of cached blits
+        layers = []
+
         # Draw animated title text with pulsing scale
-        if self.title_text:
-            # Create scaled version of the title
-            scaled_width = int(self.title_text.get_width() * self.title_scale)
-            scaled_height = int(self.title_text.get_height() * self.title_scale)
-            scaled_title = pygame.transform.scale(self.title_text, (scaled_width, scaled_height))
+        if self.title_frames:
+            # Pick the pre-scaled frame nearest to the current scale
+            scaled_title = pick_scaled_frame(self.title_frames, self.title_scale,
+                                             self.title_min_scale, self.title_max_scale)
             
             # Update the rect to center the scaled title
             scaled_rect = scaled_title.get_rect(center=self.title_rect.center)
-            surface.blit(scaled_title, scaled_rect)
+            layers.append((scaled_title, scaled_rect))
             
         # Draw subtitle with glow effect
         if self.subtitle_text:
             # Draw a subtle glow around the subtitle
-            glow_surf = pygame.Surface((self.subtitle_text.get_width() + 10, self.subtitle_text.get_height() + 10), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (100, 100, 200, 20), glow_surf.get_rect(), border_radius=5)
-            glow_rect = glow_surf.get_rect(center=self.subtitle_rect.center)
-            surface.blit(glow_surf, glow_rect)
+            layers.append((self.subtitle_glow, self.subtitle_glow_rect))
             
             # Draw the actual subtitle
-            surface.blit(self.subtitle_text, self.subtitle_rect)
+            layers.append((self.subtitle_text, self.subtitle_rect))
         
         # Draw debug hint if enabled
         if self.debug_hint_text and DEBUG_MODE:
-            surface.blit(self.debug_hint_text, self.debug_hint_rect)
+            layers.append((self.debug_hint_text, self.debug_hint_rect))
             
         # Draw version text
         if self.version_text:
-            surface.blit(self.version_text, self.version_rect)
+            layers.append((self.version_text, self.version_rect))
+        blit_cached(surface, layers, background=True)
 
     def handle_event(self, event, game_state):
         if not self.is_visible:
             return True
         if event.type == pygame_gui.UI_BUTTON_PRESSED:
             if event.ui_element == self.begin_button:
-                # Use transition when changing to level select
-                if hasattr(game_state.game, 'change_state_with_transition'):
-                    game_state.game.change_state_with_transition(STATE_LEVEL_SELECT)
-                else:
-                    game_state.change_state(STATE_LEVEL_SELECT)
+                self.begin_game(game_state)
             elif event.ui_element == self.gallery_button:
                 # Use transition for enemy gallery
                 if hasattr(game_state.game, 'change_state_with_transition'):
@@ -275,3 +237,10 @@ class TitleScreen:
             elif event.ui_element == self.exit_button:
                 return False # Signal to quit the game
         return True
+
+    def begin_game(self, game_state):
+        # Cross-fade into level select
+        if hasattr(game_state.game, 'change_state_with_transition'):
+            game_state.game.change_state_with_transition(STATE_LEVEL_SELECT, "crossfade")
+        else:
+            game_state.change_state(STATE_LEVEL_SELECT)
@@ -1,6 +1,20 @@
 import pygame
-import os
-from constants import DEFAULT_WIDTH, DEFAULT_HEIGHT, FONT_PATH
+from importlib import resources
+from pygame_gui.core.utility import PackageResource
+from constants import DEFAULT_WIDTH, DEFAULT_HEIGHT, FONT_PATH, DEBUG_MODE, TEXT_CACHE_SIZE
+
+# Bundled data files
+def get_resource(name):
+    """Traversable for a file in the assets package, e.g. "theme.json" or "images/ship.png".
+
+    Works the same from the source tree and from the zipapp build, and does
+    not depend on the current directory.
+    """
+    return resources.files('assets').joinpath(*name.split('/'))
+
+def load_theme():
+    """The pygame_gui theme, for UIManager"""
+    return PackageResource(package='assets', resource='theme.json')
 
 # Font loading helper
 def load_font(size):
@@ -14,12 +28,89 @@ def load_font(size):
         print(f"Warning: Font {font_path} not found or failed to load. Using default font.")
         return pygame.font.Font(None, size)  # Fallback to default
 
+# Rendered text, keyed by (font size, text, colour)
+_text_cache = {}
+
+def render_text(size, text, color):
+    """Return a cached antialiased rendering of text, shared by every caller (do not draw onto it)"""
+    key = (size, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        surface = load_font(size).render(text, True, color)
+        _text_cache[key] = surface
+    return surface
+
 # UI Scale settings
 def get_scale_factor(current_width, current_height):
     width_scale = current_width / DEFAULT_WIDTH
     height_scale = current_height / DEFAULT_HEIGHT
     return min(width_scale, height_scale)
 
+# Display-format surfaces
+class AuditedSurface(pygame.Surface):
+    """Surface that counts blits from sources not in display format (debug builds only)"""
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        audit_blit_source(source)
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        for entry in blit_sequence:
+            audit_blit_source(entry[0])
+        return super().blits(blit_sequence, doreturn)
+
+_display_templates = {}  # Display format key -> (opaque template, alpha template)
+_slow_blits = 0
+
+def _format_key(surface):
+    return (surface.get_bitsize(), surface.get_masks())
+
+def get_display_templates():
+    """1x1 surfaces in the display's opaque and per-pixel alpha formats, or None without a display"""
+    display = pygame.display.get_surface()
+    if display is None:
+        return None
+    key = _format_key(display)
+    templates = _display_templates.get(key)
+    if templates is None:
+        probe = pygame.Surface((1, 1))
+        templates = (probe.convert(), probe.convert_alpha())
+        _display_templates[key] = templates
+    return templates
+
+def create_surface(size, alpha=False, templates=None):
+    """Return a new surface already in display format, so blitting it needs no conversion.
+
+    Use instead of pygame.Surface(...) (plus convert()/convert_alpha()). In
+    debug builds the surface also counts slow blits drawn onto it. Worker
+    threads pass templates from get_display_templates(), taken on the main
+    thread: building them converts surfaces, which SDL only allows there.
+    """
+    flags = pygame.SRCALPHA if alpha else 0
+    surface_type = AuditedSurface if DEBUG_MODE else pygame.Surface
+    if templates is None:
+        templates = get_display_templates()
+    if templates is None:
+        # No display yet (or a headless tool): nothing to match
+        return surface_type(size, flags)
+    return surface_type(size, flags, templates[1] if alpha else templates[0])
+
+def audit_blit_source(source):
+    """Count a blit whose source has to be converted to the display format"""
+    global _slow_blits
+    templates = get_display_templates()
+    if templates and _format_key(source) not in (_format_key(templates[0]), _format_key(templates[1])):
+        _slow_blits += 1
+
+def take_slow_blit_count():
+    """Slow blits counted since the last call"""
+    global _slow_blits
+    count, _slow_blits = _slow_blits, 0
+    return count
+
 # Image loading function
 def load_image(filename, scale=1.0, convert_alpha=True):
     """Load an image and return a pygame surface.
@@ -30,41 +121,43 @@ def load_image(filename, scale=1.0, convert_alpha=True):
         convert_alpha: Whether to convert the image for alpha transparency
     
     Returns:
-        Pygame surface with the loaded image
+        Pygame surface with the loaded image, shared with every other caller
+        asking for the same image and scale (do not draw onto it)
     """
-    # Check if assets directory exists
-    base_path = "assets/images"
-    if not os.path.exists(base_path):
-        os.makedirs(base_path, exist_ok=True)
-        
-    try:
-        full_path = os.path.join(base_path, filename)
-        if not os.path.exists(full_path):
-            # If file doesn't exist, create a placeholder surface
-            print(f"Warning: Image {full_path} not found. Using placeholder.")
-            surface = pygame.Surface((64, 64))
-            surface.fill((255, 0, 255))  # Magenta for missing textures
-            if convert_alpha:
-                surface = surface.convert_alpha()
-            return surface
-            
-        image = pygame.image.load(full_path)
-        if convert_alpha:
-            image = image.convert_alpha()
-        else:
-            image = image.convert()
-            
-        # Scale if necessary
-        if scale != 1.0:
-            new_size = (int(image.get_width() * scale), int(image.get_height() * scale))
-            image = pygame.transform.scale(image, new_size)
-            
-        return image
-    except pygame.error as e:
-        print(f"Error loading image {filename}: {e}")
-        # Return placeholder on error
-        surface = pygame.Surface((64, 64))
-        surface.fill((255, 0, 255))  # Magenta for missing textures
-        if convert_alpha:
-            surface = surface.convert_alpha()
-        return surface 
\ No newline at end of file
+    # Imported here because asset_manager builds on this module
+    from asset_manager import image_assets
+    return image_assets.get(filename, scale, convert_alpha)
+
+# Pre-scaled animation frames
+def build_scaled_frames(surface, min_scale, max_scale, count):
+    """Pre-scale a surface to `count` evenly spaced scales between min_scale and max_scale.
+    
+    Pulsing text picks the nearest frame instead of calling transform.scale every frame.
+    """
+    frames = []
+    for i in range(count):
+        scale = min_scale + (max_scale - min_scale) * i / max(1, count - 1)
+        size = (int(surface.get_width() * scale), int(surface.get_height() * scale))
+        frames.append(pygame.transform.scale(surface, size))
+    return frames
+
+def pick_scaled_frame(frames, scale, min_scale, max_scale):
+    """Return the pre-scaled frame closest to the requested scale"""
+    t = (scale - min_scale) / (max_scale - min_scale)
+    index = int(round(t * (len(frames) - 1)))
+    return frames[max(0, min(len(frames) - 1, index))]
+
+# Gradient glow sprites, keyed by (radius, color, max_alpha)
+_glow_cache = {}
+
+def get_glow_sprite(radius, color, max_alpha=100):
+    """Return a cached radial gradient circle that fades from max_alpha at the centre to 0 at the edge"""
+    key = (radius, color, max_alpha)
+    sprite = _glow_cache.get(key)
+    if sprite is None:
+        sprite = create_surface((radius * 2, radius * 2), alpha=True)
+        for r in range(radius, 0, -1):
+            alpha = max(0, int(max_alpha * (1 - r / radius)))
+            pygame.draw.circle(sprite, (*color, alpha), (radius, radius), r)
+        _glow_cache[key] = sprite
+    return sprite
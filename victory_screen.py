@@ -1,6 +1,8 @@
 import pygame
 import pygame_gui
 from constants import *
+from utils import create_surface, render_text
+from render_backend import blit_cached
 
 class VictoryScreen:
     def __init__(self, screen, manager):
@@ -47,7 +49,7 @@ class VictoryScreen:
         self.congrats_rect = self.congrats_text.get_rect(center=(center_x, self.victory_rect.bottom + int(30 * scale)))
 
         # Score text (needs game_state, will update in draw)
-        self.score_font = load_font(int(SUBTITLE_FONT_SIZE * scale))
+        self.score_font_size = int(SUBTITLE_FONT_SIZE * scale)
         self.score_rect = pygame.Rect(center_x, self.congrats_rect.bottom + int(20 * scale), 0, 0)
         
         # Create menu button
@@ -60,7 +62,7 @@ class VictoryScreen:
         )
 
         # Create overlay (subtle, maybe blue)
-        self.overlay = pygame.Surface((screen_width, screen_height))
+        self.overlay = create_surface((screen_width, screen_height))
         self.overlay.fill(BLUE) 
         self.overlay.set_alpha(64)  # Very subtle blue overlay
 
@@ -79,31 +81,36 @@ class VictoryScreen:
             self.menu_button.hide()
         self.is_visible = False
         
+    def draw_overlay(self, surface):
+        # Draw overlay (baked into the frozen background by the main loop)
+        if self.overlay:
+            surface.blit(self.overlay, (0, 0))
+        
     def draw(self, surface, game_state):
         if not self.is_visible:
             return
-        # Draw overlay
-        if self.overlay:
-            surface.blit(self.overlay, (0, 0))
         
         # Draw "VICTORY ACHIEVED" text
         if self.victory_text:
-            surface.blit(self.victory_text, self.victory_rect)
+            blit_cached(surface, [(self.victory_text, self.victory_rect)])
             
         # Draw Congrats text
         if self.congrats_text:
-            surface.blit(self.congrats_text, self.congrats_rect)
+            blit_cached(surface, [(self.congrats_text, self.congrats_rect)])
         
         # Update and draw score
-        self.score_text = self.score_font.render(f"Final Score: {game_state.score}", True, WHITE)
+        self.score_text = render_text(self.score_font_size, f"Final Score: {game_state.score}", WHITE)
         score_actual_rect = self.score_text.get_rect(center=self.score_rect.center)
-        surface.blit(self.score_text, score_actual_rect)
+        blit_cached(surface, [(self.score_text, score_actual_rect)])
         
     def handle_event(self, event, game_state):
         if not self.is_visible:
             return True
         if event.type == pygame_gui.UI_BUTTON_PRESSED:
             if event.ui_element == self.menu_button:
-                game_state.reset_game() # Reset game when returning to title after victory
-                game_state.change_state(STATE_TITLE)
-        return True 
\ No newline at end of file
+                self.return_to_title(game_state)
+        return True
+
+    def return_to_title(self, game_state):
+        game_state.reset_game() # Reset game when returning to title after victory
+        game_state.change_state(STATE_TITLE) 
\ No newline at end of file